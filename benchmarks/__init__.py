@@ -0,0 +1,8 @@
+"""
+Benchmarks package for the Knapsack Problem Solver.
+"""
+
+from .generators import InstanceGenerator
+from .runner import BenchmarkRunner
+
+__all__ = ['BenchmarkRunner', 'InstanceGenerator']
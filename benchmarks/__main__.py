@@ -0,0 +1,71 @@
+"""
+Benchmark command line entry point.
+
+Usage:
+    python -m benchmarks --sizes 100 1000 --output results.json
+    python -m benchmarks --baseline baseline.json   # exit status 1 on regressions
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from .generators import InstanceGenerator
+from .runner import BenchmarkRunner
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark sweep and optionally check it against a baseline."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the knapsack engines.")
+    parser.add_argument("--kind", choices=("01", "fractional"), default="01")
+    parser.add_argument("--classes", nargs="+", choices=InstanceGenerator.CLASSES,
+                        default=list(InstanceGenerator.CLASSES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100, 1000])
+    parser.add_argument("--capacity-ratios", nargs="+", type=float, default=[0.5])
+    parser.add_argument("--range", type=int, default=1000, dest="coefficient_range",
+                        help="upper bound R of the generated weights")
+    parser.add_argument("--engines", nargs="+", default=None)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--time-limit", type=float, default=10.0,
+                        help="seconds allowed per 0/1 solver call")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this JSON file")
+    parser.add_argument("--time-tolerance", type=float, default=0.25)
+    parser.add_argument("--memory-tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    records = []
+    for record in BenchmarkRunner.iter_run(
+        args.classes, args.sizes, args.capacity_ratios, args.engines, args.kind,
+        args.coefficient_range, args.repeats, args.seed, args.time_limit
+    ):
+        records.append(record)
+        name = BenchmarkRunner.case_name(record)
+        if "seconds" in record:
+            print(f"{name:<60} {record['seconds'] * 1000:>10.2f} ms {record['peak_bytes'] / 2**20:>9.2f} MiB",
+                  flush=True)
+        else:
+            print(f"{name:<60} {record.get('error') or record.get('skipped')}", flush=True)
+
+    if args.output:
+        BenchmarkRunner.save(BenchmarkRunner.report(records), args.output)
+
+    if args.baseline:
+        baseline = BenchmarkRunner.load(args.baseline)["results"]
+        regressions = BenchmarkRunner.compare(
+            baseline, records, args.time_tolerance, args.memory_tolerance
+        )
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print("No regressions against", args.baseline)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
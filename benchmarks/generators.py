@@ -0,0 +1,100 @@
+"""
+Benchmark Instance Generators
+Seeded generators for the classic knapsack instance classes.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+Instance = Tuple[int, List[int], List[int]]
+
+
+class InstanceGenerator:
+    """
+    Generates knapsack instances following Pisinger's standard classes.
+
+    Weights are drawn from ``[1, R]`` (``R`` is the coefficient range) and
+    profits are derived from them according to the class. The capacity is a
+    fraction of the total weight, so the same ``capacity_ratio`` gives
+    comparable tightness across sizes. Every instance is fully determined by
+    its arguments and ``seed``.
+    """
+
+    CLASSES = (
+        "uncorrelated",
+        "weakly_correlated",
+        "strongly_correlated",
+        "inverse_strongly_correlated",
+        "subset_sum",
+        "spanner",
+    )
+
+    # Spanner parameters: v spanner items scaled by multipliers up to m.
+    SPANNER_ITEMS = 2
+    SPANNER_MULTIPLIER = 10
+
+    @staticmethod
+    def generate(kind: str, n: int, capacity_ratio: float = 0.5, coefficient_range: int = 1000,
+                 seed: int = 0, capacity: Optional[int] = None) -> Instance:
+        """
+        Generate one instance.
+
+        Args:
+            kind: One of ``CLASSES``
+            n: Number of items
+            capacity_ratio: Capacity as a fraction of the total weight
+            coefficient_range: Upper bound ``R`` of the weight range
+            seed: Random seed
+            capacity: Explicit capacity, overriding ``capacity_ratio``
+
+        Returns:
+            Tuple of (capacity, weights, values)
+        """
+        if kind not in InstanceGenerator.CLASSES:
+            raise ValueError(f"Unknown instance class '{kind}', expected one of {InstanceGenerator.CLASSES}")
+        rng = np.random.default_rng(seed)
+        r = coefficient_range
+
+        if kind == "spanner":
+            weights, values = InstanceGenerator._spanner(rng, n, r)
+        else:
+            weights, values = InstanceGenerator._correlated(rng, kind, n, r)
+
+        if capacity is None:
+            capacity = max(1, int(capacity_ratio * int(weights.sum())))
+        return capacity, weights.tolist(), values.tolist()
+
+    @staticmethod
+    def _correlated(rng: np.random.Generator, kind: str, n: int, r: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Weights and profits of the non-spanner classes."""
+        weights = rng.integers(1, r + 1, n)
+        if kind == "uncorrelated":
+            values = rng.integers(1, r + 1, n)
+        elif kind == "weakly_correlated":
+            values = np.maximum(1, weights + rng.integers(-(r // 10), r // 10 + 1, n))
+        elif kind == "strongly_correlated":
+            values = weights + r // 10
+        elif kind == "inverse_strongly_correlated":
+            values = rng.integers(1, r + 1, n)
+            weights = values + r // 10
+        else:  # subset_sum
+            values = weights.copy()
+        return weights, values
+
+    @staticmethod
+    def _spanner(rng: np.random.Generator, n: int, r: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Strongly correlated spanner instance: multiples of a few base items."""
+        m = InstanceGenerator.SPANNER_MULTIPLIER
+        base_weights, base_values = InstanceGenerator._correlated(
+            rng, "strongly_correlated", InstanceGenerator.SPANNER_ITEMS, r
+        )
+        base_weights = -(-2 * base_weights // m)
+        base_values = -(-2 * base_values // m)
+
+        picks = rng.integers(0, InstanceGenerator.SPANNER_ITEMS, n)
+        multipliers = rng.integers(1, m + 1, n)
+        return base_weights[picks] * multipliers, base_values[picks] * multipliers
@@ -0,0 +1,121 @@
+"""
+Import Time Benchmark
+Checks that cold headless starts stay fast and do not load the GUI.
+
+Each run starts a fresh interpreter, so nothing is cached between runs. The
+reported overhead is the headless start minus a bare interpreter start.
+Two starts are measured, each against its own budget:
+
+- library: import the solver and run a fractional solve; must not load
+  NumPy or the GUI toolkit
+- batch: ``main.py --batch`` on one JSON Lines instance from stdin, which
+  reads it with the NumPy loaders, starts a worker process and solves
+  there; must not load the GUI toolkit
+
+Usage:
+    python -m benchmarks.import_time --budget 0.1 --batch-budget 0.4 --repeats 7
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import List, Optional
+
+# What a short-lived process using the library does before its first solve.
+HEADLESS_START = (
+    "from models import KnapsackSolver; "
+    "KnapsackSolver.solve_fractional_knapsack(50, [10, 20, 30], [60, 100, 120])"
+)
+
+# A complete headless batch run; its output is discarded.
+BATCH_START = "import main; main.main(['--batch', '--workers', '1'])"
+BATCH_INPUT = '{"capacity": 50, "weights": [10, 20, 30], "values": [60, 100, 120]}\n'
+
+# Modules each start must not import.
+HEAVY_MODULES = ("numpy", "tkinter", "customtkinter")
+GUI_MODULES = ("tkinter", "customtkinter")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run(code: str, stdin: str = "") -> str:
+    """Run ``code`` in a fresh interpreter at the repository root and return its stdout."""
+    return subprocess.run([sys.executable, "-c", code], input=stdin, cwd=ROOT, check=True,
+                          stdout=subprocess.PIPE, universal_newlines=True).stdout
+
+
+def start_time(code: str, repeats: int, stdin: str = "") -> float:
+    """Fastest wall time in seconds of a fresh interpreter running ``code``."""
+    best = float("inf")
+    for _ in range(max(1, repeats)):
+        start = time.perf_counter()
+        run(code, stdin)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def loaded_modules(code: str, modules: List[str], stdin: str = "") -> List[str]:
+    """Names among ``modules`` that are imported after running ``code``."""
+    marker = "\nimport sys\nprint('modules:', ' '.join(m for m in %r if m in sys.modules))" % (list(modules),)
+    output = run(code + marker, stdin)
+    return output.rsplit("modules:", 1)[-1].split()
+
+
+def slowest_imports(code: str, count: int = 10, stdin: str = "") -> List[str]:
+    """The ``count`` top-level imports of ``code`` with the largest cumulative time."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], input=stdin, cwd=ROOT, check=True,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, universal_newlines=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit() and not fields[2].startswith("  "):
+            rows.append((int(fields[1]), fields[2].strip()))
+    rows.sort(reverse=True)
+    return [f"{micros / 1000:8.1f} ms  {name}" for micros, name in rows[:count]]
+
+
+def check(name: str, code: str, stdin: str, budget: float, baseline: float, repeats: int,
+          forbidden: List[str]) -> bool:
+    """Measure one start, print its report and return True if it is within budget."""
+    elapsed = start_time(code, repeats, stdin)
+    overhead = elapsed - baseline
+    loaded = loaded_modules(code, forbidden, stdin)
+
+    print(f"{name + ':':<18}{elapsed * 1000:.1f} ms (+{overhead * 1000:.1f} ms, budget {budget * 1000:.0f} ms)")
+    print(f"{'  forbidden:':<18}{', '.join(loaded) or 'none'} (of {', '.join(forbidden)})")
+
+    passed = overhead <= budget and not loaded
+    if not passed:
+        print("  Slowest imports:")
+        for line in slowest_imports(code, stdin=stdin):
+            print("  " + line)
+    return passed
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Measure the headless starts and exit with status 1 if one is over budget."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.import_time",
+                                     description="Check the cold headless start times.")
+    parser.add_argument("--budget", type=float, default=0.1,
+                        help="allowed seconds above a bare interpreter for the library start (default: 0.1)")
+    parser.add_argument("--batch-budget", type=float, default=0.4,
+                        help="allowed seconds above a bare interpreter for a one-instance "
+                             "'main.py --batch' run, worker process included (default: 0.4)")
+    parser.add_argument("--repeats", type=int, default=5, help="runs per measurement; the fastest counts")
+    args = parser.parse_args(argv)
+
+    baseline = start_time("pass", args.repeats)
+    print(f"{'Bare interpreter:':<18}{baseline * 1000:.1f} ms")
+    library = check("Library start", HEADLESS_START, "", args.budget, baseline, args.repeats, list(HEAVY_MODULES))
+    batch = check("Batch run", BATCH_START, BATCH_INPUT, args.batch_budget, baseline, args.repeats,
+                  list(GUI_MODULES))
+    return 0 if library and batch else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
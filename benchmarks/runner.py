@@ -0,0 +1,215 @@
+"""
+Benchmark Runner
+Times knapsack engines over instance sweeps and compares against a baseline.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import json
+import platform
+import time
+import tracemalloc
+from itertools import product
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from models import KnapsackSolver, MeetInMiddleEngine, SolveControl, SubsetSumEngine
+
+from .generators import InstanceGenerator
+
+
+class BenchmarkRunner:
+    """
+    Runs a grid of (instance class, n, capacity ratio, engine) cases.
+
+    Every case is timed ``repeats`` times and the fastest run is kept, then
+    run once more under ``tracemalloc`` to record peak memory (NumPy buffers
+    included). 0/1 runs that exceed ``time_limit`` are recorded as errors,
+    which keeps exponential cases (branch-and-bound on strongly correlated
+    instances) from stalling a sweep. Results are plain dictionaries so
+    they serialize directly to JSON and can be diffed against a saved
+    baseline with :meth:`compare`.
+    """
+
+    # Cases whose n * capacity exceeds this are skipped for the pure-Python
+    # reference table engine.
+    TABLE_CELL_LIMIT = 5_000_000
+
+    @staticmethod
+    def run(*args, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Benchmark every combination of the given parameters.
+
+        Takes the same arguments as :meth:`iter_run`.
+
+        Returns:
+            One result record per case
+        """
+        return list(BenchmarkRunner.iter_run(*args, **kwargs))
+
+    @staticmethod
+    def iter_run(classes: Sequence[str] = InstanceGenerator.CLASSES, sizes: Sequence[int] = (100, 1000),
+                 capacity_ratios: Sequence[float] = (0.5,), engines: Optional[Sequence[str]] = None,
+                 kind: str = "01", coefficient_range: int = 1000, repeats: int = 3,
+                 seed: int = 0, time_limit: Optional[float] = 10.0) -> Iterator[Dict[str, Any]]:
+        """
+        Benchmark every combination of the given parameters, one case at a time.
+
+        Args:
+            classes: Instance classes from ``InstanceGenerator.CLASSES``
+            sizes: Item counts to sweep
+            capacity_ratios: Capacities as fractions of the total weight
+            engines: Engines to time (defaults to every non-reference engine of ``kind``)
+            kind: "01" or "fractional"
+            coefficient_range: Upper bound of the generated weights
+            repeats: Timed runs per case; the fastest is reported
+            seed: Base random seed
+            time_limit: Wall time in seconds allowed per 0/1 solver call
+
+        Yields:
+            One result record per case
+        """
+        if kind == "01":
+            def solve(capacity, weights, values, engine):
+                control = None if time_limit is None else SolveControl(time_limit)
+                return KnapsackSolver.solve_01_knapsack(capacity, weights, values, engine=engine, control=control)
+            engines = engines or [e for e in KnapsackSolver.ENGINES if e not in ("auto", "table")]
+        elif kind == "fractional":
+            solve = KnapsackSolver.solve_fractional_knapsack
+            engines = engines or list(KnapsackSolver.FRACTIONAL_ENGINES)
+        else:
+            raise ValueError(f"Unknown knapsack kind '{kind}', expected '01' or 'fractional'")
+
+        for instance_class, n, ratio in product(classes, sizes, capacity_ratios):
+            capacity, weights, values = InstanceGenerator.generate(
+                instance_class, n, ratio, coefficient_range, seed
+            )
+            for engine in engines:
+                record = {
+                    "kind": kind,
+                    "class": instance_class,
+                    "n": n,
+                    "capacity_ratio": ratio,
+                    "capacity": capacity,
+                    "engine": engine,
+                    "seed": seed,
+                }
+                skipped = BenchmarkRunner.skip_reason(engine, capacity, weights, values)
+                if skipped is not None:
+                    record["skipped"] = skipped
+                    yield record
+                    continue
+                try:
+                    record.update(BenchmarkRunner.measure(solve, capacity, weights, values, engine, repeats))
+                except Exception as e:
+                    record["error"] = f"{type(e).__name__}: {e}"
+                yield record
+
+    @staticmethod
+    def skip_reason(engine: str, capacity: int, weights: List[int], values: List[int]) -> Optional[str]:
+        """Tell why an engine cannot run an instance, or None if it can."""
+        if engine == "table" and len(weights) * capacity > BenchmarkRunner.TABLE_CELL_LIMIT:
+            return "instance too large for the reference table"
+        if engine == "meet_in_middle" and len(weights) > MeetInMiddleEngine.MAX_ITEMS:
+            return "too many items for meet-in-the-middle"
+        if engine == "subset_sum" and not SubsetSumEngine.is_subset_sum(weights, values):
+            return "values not proportional to weights"
+        return None
+
+    @staticmethod
+    def measure(solve, capacity: int, weights: List[int], values: List[int], engine: str,
+                repeats: int) -> Dict[str, Any]:
+        """
+        Time one solver call and record its peak memory.
+
+        Returns:
+            Dictionary with ``seconds``, ``peak_bytes`` and ``max_value``
+        """
+        best = float("inf")
+        for _ in range(max(1, repeats)):
+            start = time.perf_counter()
+            max_value, _ = solve(capacity, weights, values, engine=engine)
+            best = min(best, time.perf_counter() - start)
+
+        tracemalloc.start()
+        try:
+            solve(capacity, weights, values, engine=engine)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return {"seconds": best, "peak_bytes": peak, "max_value": max_value}
+
+    @staticmethod
+    def report(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Wrap result records with information about the environment."""
+        return {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "results": records,
+        }
+
+    @staticmethod
+    def save(report: Dict[str, Any], path: str) -> None:
+        """Write a benchmark report as JSON."""
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+            fh.write("\n")
+
+    @staticmethod
+    def load(path: str) -> Dict[str, Any]:
+        """Read a benchmark report written by :meth:`save`."""
+        with open(path, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+
+    @staticmethod
+    def compare(baseline: Iterable[Dict[str, Any]], current: Iterable[Dict[str, Any]],
+                time_tolerance: float = 0.25, memory_tolerance: float = 0.25,
+                min_seconds: float = 0.005) -> List[str]:
+        """
+        Flag cases that got slower, use more memory or changed their answer.
+
+        Args:
+            baseline: Records of the reference run
+            current: Records of the new run
+            time_tolerance: Allowed relative slowdown
+            memory_tolerance: Allowed relative growth of peak memory
+            min_seconds: Slowdowns smaller than this are treated as noise
+
+        Returns:
+            One human readable line per regression (empty when none)
+        """
+        reference = {BenchmarkRunner.case_key(record): record for record in baseline}
+        regressions = []
+        for record in current:
+            old = reference.get(BenchmarkRunner.case_key(record))
+            if old is None or "seconds" not in old:
+                continue
+            name = BenchmarkRunner.case_name(record)
+            if "seconds" not in record:
+                regressions.append(f"{name}: {record.get('error') or record.get('skipped')}")
+                continue
+            if record["max_value"] != old["max_value"]:
+                regressions.append(f"{name}: max_value {old['max_value']} -> {record['max_value']}")
+            slower = record["seconds"] - old["seconds"]
+            if slower > min_seconds and record["seconds"] > old["seconds"] * (1 + time_tolerance):
+                regressions.append(f"{name}: time {old['seconds']:.4f}s -> {record['seconds']:.4f}s")
+            if record["peak_bytes"] > old["peak_bytes"] * (1 + memory_tolerance):
+                regressions.append(f"{name}: peak memory {old['peak_bytes']} -> {record['peak_bytes']} bytes")
+        return regressions
+
+    @staticmethod
+    def case_key(record: Dict[str, Any]) -> tuple:
+        """Identify a case independently of its measurements."""
+        return (record["kind"], record["class"], record["n"], record["capacity_ratio"],
+                record["engine"], record["seed"])
+
+    @staticmethod
+    def case_name(record: Dict[str, Any]) -> str:
+        """Short label of a case, e.g. "01/spanner n=1000 c=0.5 dense"."""
+        return (f"{record['kind']}/{record['class']} n={record['n']} "
+                f"c={record['capacity_ratio']} {record['engine']}")
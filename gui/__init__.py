@@ -1,7 +1,31 @@
 """
 GUI package for the Knapsack Problem Solver.
+
+Classes are imported on first access, so customtkinter and tkinter are
+only loaded when the GUI is actually started.
 """
 
-from .knapsack_gui import KnapsackGUI
+import importlib
+from typing import Any, List
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    'KnapsackGUI': 'knapsack_gui',
+}
 
 __all__ = ['KnapsackGUI']
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public class from its submodule on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the public names, including those not imported yet."""
+    return sorted(set(globals()) | set(__all__))
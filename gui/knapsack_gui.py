@@ -6,21 +6,35 @@ Author: GitHub Copilot
 Created: 2025
 """
 
+import threading
 import customtkinter as ctk
-from tkinter import messagebox
-from typing import List, Tuple
+from tkinter import filedialog, messagebox
+from typing import Any, Callable, List, Optional, Tuple
 
-from models import KnapsackSolver
+from models import KnapsackSolver, SolutionCache, SolveCancelled, SolveControl, SolveStats
 from utils import InputValidator
 
+from .report import ReportTable, ResultReport
+
 
 class KnapsackGUI:
     """
     Professional GUI for the Knapsack Problem Solver.
     """
     
+    # Rows shown per table page in the results panel
+    PAGE_SIZE = 100
+    # Item numbers listed inline in the solution summary
+    SUMMARY_ITEMS = 20
+    
     def __init__(self):
         self.solver = KnapsackSolver()
+        self.cache = SolutionCache()
+        self.control = None
+        self.worker = None
+        self.outcome = None
+        self.report = None
+        self.page = 0
         self.validator = InputValidator()
         self.setup_gui()
         
@@ -94,14 +108,14 @@ class KnapsackGUI:
         ctk.CTkLabel(input_frame, text="Knapsack Capacity:", font=ctk.CTkFont(weight="bold")).grid(
             row=1, column=0, sticky="w", padx=(20, 10), pady=10
         )
-        self.capacity_entry = ctk.CTkEntry(input_frame, placeholder_text="e.g., 50")
+        self.capacity_entry = ctk.CTkEntry(input_frame, placeholder_text="e.g., 50  or  50, 20")
         self.capacity_entry.grid(row=1, column=1, sticky="ew", padx=(0, 20), pady=10)
         
         # Weights input
         ctk.CTkLabel(input_frame, text="Item Weights:", font=ctk.CTkFont(weight="bold")).grid(
             row=2, column=0, sticky="w", padx=(20, 10), pady=10
         )
-        self.weights_entry = ctk.CTkEntry(input_frame, placeholder_text="e.g., 10, 20, 30")
+        self.weights_entry = ctk.CTkEntry(input_frame, placeholder_text="e.g., 10, 20, 30  or  10, 20, 30; 5, 10, 8")
         self.weights_entry.grid(row=2, column=1, sticky="ew", padx=(0, 20), pady=10)
         
         # Values input
@@ -111,6 +125,20 @@ class KnapsackGUI:
         self.values_entry = ctk.CTkEntry(input_frame, placeholder_text="e.g., 60, 100, 120")
         self.values_entry.grid(row=3, column=1, sticky="ew", padx=(0, 20), pady=10)
         
+        # Approximation tolerance for the 0/1 solve
+        ctk.CTkLabel(input_frame, text="Approximation ε:", font=ctk.CTkFont(weight="bold")).grid(
+            row=4, column=0, sticky="w", padx=(20, 10), pady=10
+        )
+        self.epsilon_entry = ctk.CTkEntry(input_frame, placeholder_text="blank = exact, e.g., 0.05 = within 5%")
+        self.epsilon_entry.grid(row=4, column=1, sticky="ew", padx=(0, 20), pady=10)
+        
+        # Multi-dimensional input hint
+        ctk.CTkLabel(
+            input_frame,
+            text="Several dimensions: one capacity each, weight vectors separated by ';'",
+            font=ctk.CTkFont(size=11)
+        ).grid(row=5, column=0, columnspan=2, padx=20)
+        
         # Example button
         example_btn = ctk.CTkButton(
             input_frame, 
@@ -118,11 +146,11 @@ class KnapsackGUI:
             command=self.load_example,
             width=120
         )
-        example_btn.grid(row=4, column=0, columnspan=2, pady=15)
+        example_btn.grid(row=6, column=0, columnspan=2, pady=15)
         
         # Action buttons
         button_frame = ctk.CTkFrame(input_frame)
-        button_frame.grid(row=5, column=0, columnspan=2, sticky="ew", padx=20, pady=(10, 20))
+        button_frame.grid(row=7, column=0, columnspan=2, sticky="ew", padx=20, pady=(10, 20))
         button_frame.grid_columnconfigure((0, 1), weight=1)
         
         self.btn_01 = ctk.CTkButton(
@@ -143,6 +171,19 @@ class KnapsackGUI:
         )
         self.btn_fractional.grid(row=0, column=1, padx=(5, 0), pady=10, sticky="ew")
         
+        self.btn_cancel = ctk.CTkButton(
+            button_frame,
+            text="⏹ Cancel",
+            command=self.cancel_solve,
+            state="disabled",
+            width=120
+        )
+        self.btn_cancel.grid(row=1, column=0, columnspan=2, pady=(0, 10))
+        
+        # Progress of a running solve
+        self.progress_label = ctk.CTkLabel(input_frame, text="", font=ctk.CTkFont(size=12))
+        self.progress_label.grid(row=8, column=0, columnspan=2, pady=(0, 10))
+        
     def create_results_section(self, parent):
         """Create the results section."""
         results_frame = ctk.CTkFrame(parent)
@@ -166,14 +207,29 @@ class KnapsackGUI:
         self.results_text.grid(row=1, column=0, sticky="nsew", padx=20, pady=(0, 20))
         self.results_text.configure(state="disabled")  # Start in disabled state
         
+        # Table paging and export
+        pager_frame = ctk.CTkFrame(results_frame)
+        pager_frame.grid(row=2, column=0, pady=(0, 10))
+        
+        self.btn_prev = ctk.CTkButton(pager_frame, text="◀", command=self.previous_page, width=40, state="disabled")
+        self.btn_prev.grid(row=0, column=0, padx=5, pady=5)
+        self.page_label = ctk.CTkLabel(pager_frame, text="Page 1 / 1", width=100)
+        self.page_label.grid(row=0, column=1, padx=5, pady=5)
+        self.btn_next = ctk.CTkButton(pager_frame, text="▶", command=self.next_page, width=40, state="disabled")
+        self.btn_next.grid(row=0, column=2, padx=5, pady=5)
+        self.btn_export = ctk.CTkButton(
+            pager_frame, text="💾 Export Full Table", command=self.export_report, width=140, state="disabled"
+        )
+        self.btn_export.grid(row=0, column=3, padx=5, pady=5)
+        
         # Clear button
-        clear_btn = ctk.CTkButton(
+        self.btn_clear = ctk.CTkButton(
             results_frame,
             text="🗑️ Clear Results",
             command=self.clear_results,
             width=120
         )
-        clear_btn.grid(row=2, column=0, pady=(0, 20))
+        self.btn_clear.grid(row=3, column=0, pady=(0, 20))
         
     def create_footer(self):
         """Create the application footer."""
@@ -193,6 +249,50 @@ class KnapsackGUI:
         self.results_text.insert("end", text)
         self.results_text.configure(state="disabled")  # Disable editing again
         
+    def show_report(self):
+        """Render the current page of the report with a single textbox insert."""
+        text = self.report.render(self.page, self.PAGE_SIZE) if self.report else ""
+        self.results_text.configure(state="normal")
+        self.results_text.delete("1.0", "end")
+        self.results_text.insert("end", text)
+        self.results_text.configure(state="disabled")
+        
+        pages = self.report.page_count(self.PAGE_SIZE) if self.report else 1
+        self.page_label.configure(text=f"Page {self.page + 1} / {pages}")
+        self.btn_prev.configure(state="normal" if self.page > 0 else "disabled")
+        self.btn_next.configure(state="normal" if self.page < pages - 1 else "disabled")
+        self.btn_export.configure(state="normal" if self.report and self.report.longest_table else "disabled")
+        
+    def previous_page(self):
+        """Show the previous page of the result tables."""
+        if self.page > 0:
+            self.page -= 1
+            self.show_report()
+            
+    def next_page(self):
+        """Show the next page of the result tables."""
+        if self.report and self.page < self.report.page_count(self.PAGE_SIZE) - 1:
+            self.page += 1
+            self.show_report()
+            
+    def export_report(self):
+        """Save the full result tables to a CSV file."""
+        if not self.report:
+            return
+        path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")])
+        if path:
+            try:
+                self.report.export_csv(path)
+            except OSError as e:
+                messagebox.showerror("Export Error", f"Could not write {path}: {str(e)}")
+                
+    def summarize_items(self, selected_items: List[int]) -> str:
+        """List selected item numbers, truncated for large selections."""
+        shown = [i + 1 for i in selected_items[:self.SUMMARY_ITEMS]]
+        if len(selected_items) > self.SUMMARY_ITEMS:
+            return f"{shown} … (+{len(selected_items) - self.SUMMARY_ITEMS} more)"
+        return str(shown)
+        
     def load_example(self):
         """Load example data for demonstration."""
         self.capacity_entry.delete(0, 'end')
@@ -209,13 +309,17 @@ class KnapsackGUI:
         Validate user input and return parsed values.
         
         Returns:
-            Tuple of (capacity, weights, values) if valid, None otherwise
+            Tuple of (capacity, weights, values) if valid, None otherwise.
+            For multi-dimensional input capacity and weights are lists with
+            one entry per dimension.
         """
         try:
             capacity_text = self.capacity_entry.get()
             weights_text = self.weights_entry.get()
             values_text = self.values_entry.get()
             
+            if self.validator.is_multidimensional(capacity_text, weights_text):
+                return self.validator.validate_multi_input(capacity_text, weights_text, values_text)
             return self.validator.validate_input(capacity_text, weights_text, values_text)
             
         except ValueError as e:
@@ -229,98 +333,255 @@ class KnapsackGUI:
         Args:
             is_fractional: True for fractional knapsack, False for 0/1 knapsack
         """
+        if self.is_busy():
+            return
+            
         # Validate input
         validation_result = self.validate_input()
         if validation_result is None:
             return
             
         capacity, weights, values = validation_result
+        try:
+            epsilon = self.validator.validate_epsilon(self.epsilon_entry.get())
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e))
+            return
+        if isinstance(capacity, list):
+            if is_fractional:
+                messagebox.showerror("Input Error", "Fractional knapsack supports a single capacity")
+            else:
+                self.calculate_multidim_knapsack(capacity, weights, values)
+            return
         
         try:
-            # Clear previous results
-            self.clear_results()
-            
             # Display problem details
             problem_type = "Fractional Knapsack" if is_fractional else "0/1 Knapsack"
-            self.append_result(f"🎯 {problem_type} Solution\n")
-            self.append_result("=" * 40 + "\n\n")
-            
-            self.append_result(f"📦 Knapsack Capacity: {capacity}\n")
-            self.append_result(f"📝 Number of Items: {len(weights)}\n\n")
+            if not is_fractional and epsilon is not None:
+                problem_type += f" (within {epsilon:.1%} of optimal)"
+            self.report = ResultReport()
+            self.page = 0
+            self.report.text(
+                f"🎯 {problem_type} Solution\n" + "=" * 40 + "\n\n"
+                f"📦 Knapsack Capacity: {capacity}\n"
+                f"📝 Number of Items: {len(weights)}\n\n"
+            )
             
             # Display items table
-            self.append_result("📋 Items Information:\n")
-            self.append_result("-" * 40 + "\n")
-            self.append_result(f"{'Item':<6} {'Weight':<8} {'Value':<8} {'Ratio':<8}\n")
-            self.append_result("-" * 40 + "\n")
+            self.report.table(ReportTable(
+                "📋 Items Information:",
+                [("Item", 6, ""), ("Weight", 8, ""), ("Value", 8, ""), ("Ratio", 8, ".2f")],
+                len(weights),
+                lambda i: (i + 1, weights[i], values[i], values[i] / weights[i])
+            ))
+            self.report.text("\n")
+            self.show_report()
             
-            for i in range(len(weights)):
-                ratio = values[i] / weights[i]
-                self.append_result(f"{i+1:<6} {weights[i]:<8} {values[i]:<8} {ratio:<8.2f}\n")
-            
-            self.append_result("\n")
-            
-            # Solve the problem
+            # Solve the problem off the main thread
+            stats = SolveStats()
             if is_fractional:
-                max_value, selected_items = self.solver.solve_fractional_knapsack(capacity, weights, values)
-                self.display_fractional_results(max_value, selected_items, weights, values)
+                self.start_solve(
+                    lambda control: self.solver.solve_fractional_knapsack(capacity, weights, values, stats=stats),
+                    lambda result: self.display_fractional_results(*result, weights, values, stats)
+                )
+            elif epsilon is not None:
+                self.start_solve(
+                    lambda control: self.solver.solve_01_fptas(capacity, weights, values, epsilon,
+                                                               control=control, stats=stats),
+                    lambda result: self.display_01_results(result.max_value, result.selected_items, weights, values,
+                                                           stats, result.upper_bound)
+                )
             else:
-                max_value, selected_items = self.solver.solve_01_knapsack(capacity, weights, values)
-                self.display_01_results(max_value, selected_items, weights, values)
+                self.start_solve(
+                    lambda control: self.cache.solve_01(capacity, weights, values, control=control, stats=stats),
+                    lambda result: self.display_01_results(*result, weights, values, stats)
+                )
                 
         except Exception as e:
             messagebox.showerror("Calculation Error", f"An error occurred during calculation: {str(e)}")
             
-    def display_01_results(self, max_value: int, selected_items: List[int], weights: List[int], values: List[int]):
-        """Display results for 0/1 knapsack."""
-        self.append_result("🏆 SOLUTION RESULTS:\n")
-        self.append_result("-" * 40 + "\n")
-        self.append_result(f"💰 Maximum Value: {max_value}\n")
-        self.append_result(f"📦 Selected Items: {[i+1 for i in selected_items]}\n")
+    def calculate_multidim_knapsack(self, capacities: List[int], weights: List[List[int]], values: List[int]):
+        """
+        Calculate a multi-dimensional 0/1 knapsack solution and display results.
         
-        total_weight = sum(weights[i] for i in selected_items)
-        self.append_result(f"⚖️  Total Weight: {total_weight}\n\n")
+        Args:
+            capacities: Capacity per dimension
+            weights: One weight vector per dimension
+            values: List of item values
+        """
+        try:
+            self.report = ResultReport()
+            self.page = 0
+            self.report.text(
+                "🎯 Multi-Dimensional 0/1 Knapsack Solution\n" + "=" * 40 + "\n\n"
+                f"📦 Capacities: {capacities}\n"
+                f"📝 Number of Items: {len(values)}\n\n"
+            )
+            self.show_report()
+            
+            self.start_solve(
+                lambda control: self.solver.solve_multidim_knapsack(capacities, weights, values, control=control),
+                lambda result: self.display_multidim_results(*result, weights, values)
+            )
+                
+        except Exception as e:
+            messagebox.showerror("Calculation Error", f"An error occurred during calculation: {str(e)}")
+            
+    def display_multidim_results(self, max_value: int, selected_items: List[int], weights: List[List[int]],
+                                 values: List[int]):
+        """Display results for multi-dimensional 0/1 knapsack."""
+        totals = [sum(vector[i] for i in selected_items) for vector in weights]
+        self.report.text(
+            "🏆 SOLUTION RESULTS:\n" + "-" * 40 + "\n"
+            f"💰 Maximum Value: {max_value}\n"
+            f"📦 Selected Items: {self.summarize_items(selected_items)}\n"
+            f"⚖️  Total Usage: {totals}\n\n"
+        )
         
         if selected_items:
-            self.append_result("📋 Selected Items Details:\n")
-            self.append_result("-" * 40 + "\n")
-            self.append_result(f"{'Item':<6} {'Weight':<8} {'Value':<8}\n")
-            self.append_result("-" * 40 + "\n")
+            self.report.table(ReportTable(
+                "📋 Selected Items Details:",
+                [("Item", 6, ""), ("Weights", 18, ""), ("Value", 8, "")],
+                len(selected_items),
+                lambda k: (selected_items[k] + 1,
+                           "/".join(str(vector[selected_items[k]]) for vector in weights),
+                           values[selected_items[k]])
+            ))
+        else:
+            self.report.text("ℹ️  No items selected (capacity too small)\n")
+        self.show_report()
             
-            for i in selected_items:
-                self.append_result(f"{i+1:<6} {weights[i]:<8} {values[i]:<8}\n")
+    def is_busy(self) -> bool:
+        """Tell whether a solve is currently running."""
+        return self.worker is not None and self.worker.is_alive()
+        
+    def start_solve(self, solve: Callable[[SolveControl], Any], on_done: Callable[[Any], None]):
+        """
+        Run a solve on a worker thread and poll it from the Tk main loop.
+        
+        Args:
+            solve: Called on the worker thread with the SolveControl handle
+            on_done: Called on the main thread with the solve result
+        """
+        self.control = SolveControl()
+        self.outcome = None
+        control = self.control
+        
+        def work():
+            try:
+                self.outcome = (True, solve(control))
+            except Exception as e:
+                self.outcome = (False, e)
+                
+        self.set_busy(True)
+        self.worker = threading.Thread(target=work, daemon=True)
+        self.worker.start()
+        self.window.after(100, self.poll_solve, on_done)
+        
+    def poll_solve(self, on_done: Callable[[Any], None]):
+        """Report progress of the running solve and hand over its result."""
+        if self.worker.is_alive():
+            self.progress_label.configure(text=f"⏳ Solving... {self.control.describe()}")
+            self.window.after(100, self.poll_solve, on_done)
+            return
+            
+        self.set_busy(False)
+        succeeded, result = self.outcome
+        if succeeded:
+            on_done(result)
+        elif isinstance(result, SolveCancelled):
+            self.report.text("⏹ Solve cancelled\n")
+            self.show_report()
         else:
-            self.append_result("ℹ️  No items selected (capacity too small)\n")
+            messagebox.showerror("Calculation Error", f"An error occurred during calculation: {str(result)}")
             
-    def display_fractional_results(self, max_value: float, selected_items: List[Tuple[int, float]], weights: List[int], values: List[int]):
-        """Display results for fractional knapsack."""
-        self.append_result("🏆 SOLUTION RESULTS:\n")
-        self.append_result("-" * 40 + "\n")
-        self.append_result(f"💰 Maximum Value: {max_value:.2f}\n")
+    def cancel_solve(self):
+        """Stop the running solve at the engine's next progress check."""
+        if self.is_busy():
+            self.control.cancel()
+            self.progress_label.configure(text="⏹ Cancelling...")
+            
+    def set_busy(self, busy: bool):
+        """Toggle the solve and clear buttons while a solve is running."""
+        # The running solve writes into self.report, which Clear would drop.
+        self.btn_01.configure(state="disabled" if busy else "normal")
+        self.btn_fractional.configure(state="disabled" if busy else "normal")
+        self.btn_clear.configure(state="disabled" if busy else "normal")
+        self.btn_cancel.configure(state="normal" if busy else "disabled")
+        if not busy:
+            self.progress_label.configure(text="")
+            
+    def display_01_results(self, max_value: int, selected_items: List[int], weights: List[int], values: List[int],
+                           stats: Optional[SolveStats] = None, upper_bound: Optional[int] = None):
+        """Display results for 0/1 knapsack, with the proven bound of an approximate solve."""
+        total_weight = sum(weights[i] for i in selected_items)
+        bound_text = ""
+        if upper_bound is not None:
+            gap = (upper_bound - max_value) / upper_bound if upper_bound > 0 else 0.0
+            bound_text = f"📐 Optimum at most: {upper_bound} (gap ≤ {gap:.2%})\n"
+        self.report.text(
+            "🏆 SOLUTION RESULTS:\n" + "-" * 40 + "\n"
+            f"💰 {'Maximum' if upper_bound is None else 'Found'} Value: {max_value}\n"
+            + bound_text +
+            f"📦 Selected Items: {self.summarize_items(selected_items)}\n"
+            f"⚖️  Total Weight: {total_weight}\n\n"
+        )
         
+        if selected_items:
+            self.report.table(ReportTable(
+                "📋 Selected Items Details:",
+                [("Item", 6, ""), ("Weight", 8, ""), ("Value", 8, "")],
+                len(selected_items),
+                lambda k: (selected_items[k] + 1, weights[selected_items[k]], values[selected_items[k]])
+            ))
+        else:
+            self.report.text("ℹ️  No items selected (capacity too small)\n")
+        self.display_stats(stats)
+        self.show_report()
+            
+    def display_fractional_results(self, max_value: float, selected_items: List[Tuple[int, float]], weights: List[int], values: List[int],
+                                   stats: Optional[SolveStats] = None):
+        """Display results for fractional knapsack."""
         total_weight = sum(weights[i] * fraction for i, fraction in selected_items)
-        self.append_result(f"⚖️  Total Weight: {total_weight:.2f}\n\n")
+        self.report.text(
+            "🏆 SOLUTION RESULTS:\n" + "-" * 40 + "\n"
+            f"💰 Maximum Value: {max_value:.2f}\n"
+            f"⚖️  Total Weight: {total_weight:.2f}\n\n"
+        )
         
         if selected_items:
-            self.append_result("📋 Selected Items Details:\n")
-            self.append_result("-" * 50 + "\n")
-            self.append_result(f"{'Item':<6} {'Weight':<8} {'Value':<8} {'Fraction':<10}\n")
-            self.append_result("-" * 50 + "\n")
-            
-            for item_index, fraction in selected_items:
-                weight_taken = weights[item_index] * fraction
-                value_taken = values[item_index] * fraction
-                percentage = fraction * 100
-                
-                self.append_result(f"{item_index+1:<6} {weight_taken:<8.2f} {value_taken:<8.2f} {percentage:<10.1f}%\n")
+            def row(k):
+                item_index, fraction = selected_items[k]
+                return (item_index + 1, weights[item_index] * fraction, values[item_index] * fraction,
+                        f"{fraction * 100:.1f}%")
+                        
+            self.report.table(ReportTable(
+                "📋 Selected Items Details:",
+                [("Item", 6, ""), ("Weight", 8, ".2f"), ("Value", 8, ".2f"), ("Fraction", 10, "")],
+                len(selected_items),
+                row,
+                rule=50
+            ))
         else:
-            self.append_result("ℹ️  No items selected (capacity too small)\n")
+            self.report.text("ℹ️  No items selected (capacity too small)\n")
+        self.display_stats(stats)
+        self.show_report()
+            
+    def display_stats(self, stats: Optional[SolveStats]):
+        """Add the solver statistics to the report."""
+        if stats is None or stats.engine is None:
+            return
+        self.report.text(
+            "\n📈 Solver Statistics:\n" + "-" * 40 + "\n" + "\n".join(stats.describe()) + "\n"
+        )
             
     def clear_results(self):
         """Clear the results display."""
-        self.results_text.configure(state="normal")
-        self.results_text.delete("1.0", "end")
-        self.results_text.configure(state="disabled")
+        if self.is_busy():
+            return
+        self.report = None
+        self.page = 0
+        self.show_report()
         
     def run(self):
         """Start the GUI application."""
@@ -0,0 +1,111 @@
+"""
+Result Report Model
+Builds the text shown in the results panel, one page at a time.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import csv
+from typing import Any, Callable, List, Sequence, Tuple, Union
+
+
+class ReportTable:
+    """
+    A table whose rows are produced on demand.
+
+    Rows are never materialized up front: ``row(i)`` builds the values of
+    row i only when that row is rendered or exported, so a table over a
+    million items costs nothing until it is looked at.
+    """
+
+    def __init__(self, title: str, columns: Sequence[Tuple[str, int, str]], count: int,
+                 row: Callable[[int], Sequence[Any]], rule: int = 40):
+        self.title = title
+        self.columns = columns  # (name, width, format spec)
+        self.count = count
+        self.row = row
+        self.rule = rule
+
+    def format_row(self, values: Sequence[Any]) -> str:
+        """Format one row as fixed-width text."""
+        return " ".join(
+            f"{value:<{width}{spec}}" for value, (_, width, spec) in zip(values, self.columns)
+        ).rstrip() + "\n"
+
+    def render(self, start: int, stop: int) -> str:
+        """Render the title, header and rows ``start``..``stop`` of the table."""
+        parts = [f"{self.title}\n", "-" * self.rule + "\n"]
+        parts.append(" ".join(f"{name:<{width}}" for name, width, _ in self.columns).rstrip() + "\n")
+        parts.append("-" * self.rule + "\n")
+        parts.extend(self.format_row(self.row(i)) for i in range(start, stop))
+        if stop - start < self.count:
+            parts.append(f"… rows {start + 1}-{stop} of {self.count}, page or export for the rest\n")
+        return "".join(parts)
+
+
+class ResultReport:
+    """
+    The results panel content: plain text blocks interleaved with tables.
+
+    :meth:`render` shows at most ``page_size`` rows per table, so its cost
+    does not depend on the number of items; :meth:`export_csv` streams the
+    full tables to a file.
+    """
+
+    def __init__(self):
+        self.blocks: List[Union[str, ReportTable]] = []
+
+    def text(self, text: str) -> None:
+        """Append a plain text block."""
+        self.blocks.append(text)
+
+    def table(self, table: ReportTable) -> None:
+        """Append a table."""
+        self.blocks.append(table)
+
+    @property
+    def longest_table(self) -> int:
+        """Row count of the largest table."""
+        return max((block.count for block in self.blocks if isinstance(block, ReportTable)), default=0)
+
+    def page_count(self, page_size: int) -> int:
+        """Number of pages needed to show every row of the largest table."""
+        return max(1, -(-self.longest_table // page_size))
+
+    def render(self, page: int = 0, page_size: int = 100) -> str:
+        """
+        Render the report with one page of rows from every table.
+
+        Args:
+            page: Zero-based page index (clamped per table)
+            page_size: Rows shown per table
+
+        Returns:
+            The report text
+        """
+        parts = []
+        for block in self.blocks:
+            if isinstance(block, ReportTable):
+                last_page = max(0, (block.count - 1) // page_size)
+                start = min(page, last_page) * page_size
+                parts.append(block.render(start, min(start + page_size, block.count)))
+            else:
+                parts.append(block)
+        return "".join(parts)
+
+    def export_csv(self, path: str) -> None:
+        """
+        Write every table in full to a CSV file.
+
+        Args:
+            path: Destination file
+        """
+        with open(path, "w", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh)
+            for block in self.blocks:
+                if isinstance(block, ReportTable):
+                    writer.writerow([block.title.strip(": \n")])
+                    writer.writerow([name for name, _, _ in block.columns])
+                    writer.writerows(block.row(i) for i in range(block.count))
+                    writer.writerow([])
@@ -2,18 +2,144 @@
 Main entry point for the Knapsack Problem Solver
 A professional GUI application for solving 0/1 and Fractional Knapsack problems.
 
+Without arguments the GUI is launched. With ``--batch`` or input files the
+solver runs headless: instances are read from CSV, ``.npy`` or JSON Lines
+files (or JSON Lines on stdin) and one JSON result per instance is written
+to stdout.
+
 Author: GitHub Copilot
 Created: 2025
 """
 
-from gui import KnapsackGUI
+import argparse
+import json
+import sys
+from functools import partial
+from typing import Callable, Iterator, List, Optional, Union
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    from models import KnapsackSolver
+
+    parser = argparse.ArgumentParser(
+        description="Solve 0/1 and fractional knapsack problems.",
+        epilog="Example: python main.py --batch --workers 4 < instances.jsonl > results.jsonl"
+    )
+    parser.add_argument("inputs", nargs="*", metavar="FILE",
+                        help="CSV, .npy or JSON Lines instance files; '-' reads JSON Lines from stdin")
+    parser.add_argument("--batch", action="store_true",
+                        help="run headless even without input files (reads JSON Lines from stdin)")
+    parser.add_argument("--kind", choices=("01", "fractional"), default="01",
+                        help="knapsack variant to solve (default: 01)")
+    parser.add_argument("--engine", default=None,
+                        help=f"0/1 engine {KnapsackSolver.ENGINES} or fractional engine "
+                             f"{KnapsackSolver.FRACTIONAL_ENGINES}")
+    parser.add_argument("--capacity", type=int, default=None,
+                        help="capacity for CSV and .npy inputs, which do not store one")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help="instances sent to a worker at a time")
+    parser.add_argument("--time-limit", type=float, default=None, metavar="SECONDS",
+                        help="per-instance wall time for 0/1 solves; rejected with --kind fractional")
+    args = parser.parse_args(argv)
+
+    engines = KnapsackSolver.ENGINES if args.kind == "01" else KnapsackSolver.FRACTIONAL_ENGINES
+    if args.engine is not None and args.engine not in engines:
+        parser.error(f"--engine must be one of {engines} for --kind {args.kind}")
+    if args.workers is not None and args.workers <= 0:
+        parser.error("--workers must be positive")
+    if args.chunk_size is not None and args.chunk_size <= 0:
+        parser.error("--chunk-size must be positive")
+    if args.time_limit is not None and args.time_limit <= 0:
+        parser.error("--time-limit must be positive")
+    if args.time_limit is not None and args.kind == "fractional":
+        parser.error("--time-limit applies to 0/1 solves only, not --kind fractional")
+    return args
+
+
+def iter_loaders(path: str, capacity: Optional[int]) -> Iterator[Callable]:
+    """
+    Yield one deferred loader per instance stored in ``path``.
+
+    JSON Lines are parsed line by line so that a malformed line only fails
+    its own instance.
+    """
+    from utils import InstanceLoader
+
+    if path == "-":
+        for line in sys.stdin:
+            if line.strip():
+                yield partial(InstanceLoader.parse_json, line)
+    elif path.lower().endswith(InstanceLoader.JSONL_SUFFIXES):
+        with open(path, "r", encoding="utf-8") as fh:
+            for line in fh:
+                if line.strip():
+                    yield partial(InstanceLoader.parse_json, line)
+    else:
+        yield partial(InstanceLoader.load, path, capacity)
+
 
+def iter_instances(paths: List[str], capacity: Optional[int]) -> Iterator[Union[tuple, Exception]]:
+    """
+    Stream the input instances in order.
 
-def main():
+    An instance that fails to load is yielded as its exception, so the
+    batch solver reports it in its input position without reading ahead
+    of the instances in flight.
+    """
+    for path in paths or ["-"]:
+        for load in iter_loaders(path, capacity):
+            try:
+                yield load()
+            except (ValueError, OSError) as e:
+                yield e
+
+
+def write_record(record: dict) -> None:
+    """Write one JSON Lines record to stdout."""
+    # Results may hold NumPy scalars or arrays, which all provide tolist().
+    sys.stdout.write(json.dumps(record, default=lambda value: value.tolist()) + "\n")
+    sys.stdout.flush()
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    """
+    Solve every input instance and stream the results as JSON Lines.
+
+    Each output line holds the instance ``index`` (its position in the
+    input) and either ``max_value``/``selected_items`` or ``error``. Only a
+    bounded window of instances is held in memory at any time.
+    """
+    from models import KnapsackSolver
+
+    options = {} if args.engine is None else {"engine": args.engine}
+    results = KnapsackSolver.solve_batch(
+        iter_instances(args.inputs, args.capacity), kind=args.kind, workers=args.workers,
+        chunk_size=args.chunk_size, ordered=True, time_limit=args.time_limit, **options
+    )
+    for result in results:
+        if result.ok:
+            write_record({"index": result.index, "max_value": result.max_value,
+                          "selected_items": result.selected_items})
+        else:
+            write_record({"index": result.index, "error": result.error})
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Main function to run the application."""
+    args = parse_args(argv)
+    if args.batch or args.inputs:
+        return run_batch(args)
+
+    from gui import KnapsackGUI
+
     app = KnapsackGUI()
     app.run()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,7 +1,81 @@
 """
 Models package for the Knapsack Problem Solver.
+
+Classes are imported on first access, so ``import models`` stays cheap and
+NumPy is only loaded once an engine that needs it is used.
 """
 
-from .knapsack_solver import KnapsackSolver
+import importlib
+from typing import Any, List
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    'KnapsackSolver': 'knapsack_solver',
+    'AnytimeSolver': 'anytime',
+    'BatchResult': 'batch',
+    'BatchSolver': 'batch',
+    'BoundedEngine': 'bounded_engine',
+    'BranchAndBoundResult': 'branch_and_bound',
+    'BranchAndBoundSolver': 'branch_and_bound',
+    'CoreEngine': 'core_engine',
+    'DenseEngine': 'dense_engine',
+    'FPTASEngine': 'fptas_engine',
+    'GreedySolver': 'greedy',
+    'HirschbergEngine': 'hirschberg_engine',
+    'IncrementalSolver': 'incremental',
+    'InstancePreprocessor': 'preprocessing',
+    'MeetInMiddleEngine': 'meet_in_middle_engine',
+    'MultiDimEngine': 'multidim_engine',
+    'ParetoEngine': 'pareto_engine',
+    'ReducedInstance': 'preprocessing',
+    'SolutionCache': 'solution_cache',
+    'SolveCancelled': 'control',
+    'SolveControl': 'control',
+    'SolveStats': 'stats',
+    'SolvedInstance': 'solution_cache',
+    'SubsetSumEngine': 'subset_sum_engine',
+    'ValueEngine': 'value_engine',
+}
+
+__all__ = [
+    'KnapsackSolver',
+    'AnytimeSolver',
+    'BatchResult',
+    'BatchSolver',
+    'BoundedEngine',
+    'BranchAndBoundResult',
+    'BranchAndBoundSolver',
+    'CoreEngine',
+    'DenseEngine',
+    'FPTASEngine',
+    'GreedySolver',
+    'HirschbergEngine',
+    'IncrementalSolver',
+    'InstancePreprocessor',
+    'MeetInMiddleEngine',
+    'MultiDimEngine',
+    'ParetoEngine',
+    'ReducedInstance',
+    'SolutionCache',
+    'SolveCancelled',
+    'SolveControl',
+    'SolveStats',
+    'SolvedInstance',
+    'SubsetSumEngine',
+    'ValueEngine',
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public class from its submodule on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ['KnapsackSolver']
+def __dir__() -> List[str]:
+    """List the public names, including those not imported yet."""
+    return sorted(set(globals()) | set(__all__))
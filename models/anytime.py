@@ -0,0 +1,150 @@
+"""
+Anytime Solver
+Time-budgeted 0/1 knapsack solver returning the best solution found so far.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .branch_and_bound import BranchAndBoundResult, BranchAndBoundSolver, FractionalBound
+from .control import SolveControl
+from .greedy import GreedySolver
+from .stats import SolveStats
+
+
+class AnytimeSolver:
+    """
+    0/1 knapsack solver that always answers within a time budget.
+
+    1. Greedy: the whole items of the fractional solution, completed with
+       every later item that still fits (or the single best item if that is
+       worth more). The floored fractional value is the initial upper bound.
+    2. Local search: add moves, then 1-for-1 swaps among the ``CORE_SIZE``
+       items on either side of the break item, until no move improves.
+    3. Branch-and-bound seeded with that incumbent for the rest of the budget.
+
+    The result carries the incumbent, the best proven upper bound and the
+    resulting gap; ``optimal`` is True when the search finished in time.
+    """
+
+    DEFAULT_BUDGET = 0.05
+
+    # Items on each side of the break item considered for swap moves.
+    CORE_SIZE = 64
+
+    @staticmethod
+    def solve(capacity: int, weights: List[int], values: List[int], time_budget: Optional[float] = None,
+              control: Optional[SolveControl] = None, stats: Optional[SolveStats] = None) -> BranchAndBoundResult:
+        """
+        Solve the 0/1 Knapsack problem within a time budget.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+            time_budget: Wall time in seconds (defaults to ``DEFAULT_BUDGET``)
+            control: Optional progress and cancellation handle
+            stats: Optional record receiving phase timings and node count
+
+        Returns:
+            BranchAndBoundResult with the incumbent, upper bound and gap
+        """
+        budget = AnytimeSolver.DEFAULT_BUDGET if time_budget is None else time_budget
+        deadline = time.perf_counter() + budget
+        stats = stats or SolveStats(trace_memory=False)
+
+        with stats.phase("greedy"):
+            order = GreedySolver.ratio_order(weights, values)
+            upper_bound = FractionalBound(order, weights, values)(0, capacity, 0)
+            best_value, selected_items = GreedySolver.integral_fill(capacity, order, weights, values)
+            fitting = [i for i in range(len(weights)) if weights[i] <= capacity]
+            if fitting:
+                best_single = max(fitting, key=values.__getitem__)
+                if values[best_single] > best_value:
+                    best_value, selected_items = values[best_single], [best_single]
+        if best_value == upper_bound:
+            return BranchAndBoundResult(best_value, sorted(selected_items), upper_bound, 0, True)
+
+        with stats.phase("local_search"):
+            best_value, selected_items = AnytimeSolver.local_search(
+                capacity, weights, values, order, selected_items, deadline, control
+            )
+
+        remaining = deadline - time.perf_counter()
+        if best_value == upper_bound or remaining <= 0:
+            return BranchAndBoundResult(best_value, sorted(selected_items), upper_bound, 0,
+                                        best_value == upper_bound)
+
+        result = BranchAndBoundSolver.solve(
+            capacity, weights, values, time_limit=remaining, control=control, stats=stats,
+            incumbent=(best_value, selected_items)
+        )
+        result.upper_bound = min(result.upper_bound, upper_bound)
+        return result
+
+    @staticmethod
+    def local_search(capacity: int, weights: List[int], values: List[int], order: List[int],
+                     selected_items: List[int], deadline: float,
+                     control: Optional[SolveControl] = None) -> Tuple[int, List[int]]:
+        """
+        Improve a feasible selection with add and swap moves.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+            order: Item indices in ratio order
+            selected_items: Feasible starting selection
+            deadline: ``time.perf_counter()`` value at which to stop
+            control: Optional progress and cancellation handle
+
+        Returns:
+            Tuple containing (total_value, selected_item_indices)
+        """
+        w = np.asarray(weights, dtype=np.int64)
+        v = np.asarray(values, dtype=np.int64)
+        taken = np.zeros(len(weights), dtype=bool)
+        taken[selected_items] = True
+        slack = capacity - int(w[taken].sum())
+
+        # The core is the stretch of the ratio order around the first item the
+        # greedy fill skipped, where improving swaps are most likely.
+        ordered_taken = taken[order]
+        break_position = int(np.argmin(ordered_taken)) if not ordered_taken.all() else len(order)
+        core = np.asarray(order[max(0, break_position - AnytimeSolver.CORE_SIZE):
+                                break_position + AnytimeSolver.CORE_SIZE], dtype=np.int64)
+
+        moves = 0
+        while time.perf_counter() < deadline:
+            if control is not None:
+                control.update(moves, None, "moves")
+            moves += 1
+
+            addable = np.flatnonzero(~taken & (w <= slack))
+            if len(addable):
+                j = addable[np.argmax(v[addable])]
+                taken[j] = True
+                slack -= int(w[j])
+                continue
+
+            ins = core[taken[core]]
+            outs = core[~taken[core]]
+            if not len(ins) or not len(outs):
+                break
+            gain = v[outs][None, :] - v[ins][:, None]
+            gain[(w[outs][None, :] - w[ins][:, None]) > slack] = 0
+            best = int(np.argmax(gain))
+            i, j = divmod(best, len(outs))
+            if gain[i, j] <= 0:
+                break
+            taken[ins[i]] = False
+            taken[outs[j]] = True
+            slack += int(w[ins[i]] - w[outs[j]])
+
+        selected = np.flatnonzero(taken)
+        return int(v[selected].sum()), selected.tolist()
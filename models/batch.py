@@ -0,0 +1,210 @@
+"""
+Batch Solving
+Solves many independent knapsack instances across a process pool.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:  # Python 3.7: fall back to pickling every array
+    shared_memory = None
+
+from .control import SolveControl
+from .knapsack_solver import KnapsackSolver
+
+
+class BatchResult:
+    """
+    Result of one instance in a batch.
+
+    Exactly one of ``error`` or (``max_value``, ``selected_items``) is set;
+    a failing instance never aborts the rest of the batch.
+    """
+
+    def __init__(self, index: int, max_value: Any = None, selected_items: Optional[list] = None,
+                 error: Optional[str] = None):
+        self.index = index
+        self.max_value = max_value
+        self.selected_items = selected_items
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """True when the instance was solved without error."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        if self.error is not None:
+            return f"BatchResult(index={self.index}, error={self.error!r})"
+        return f"BatchResult(index={self.index}, max_value={self.max_value}, selected_items={self.selected_items})"
+
+
+class _SharedArray(NamedTuple):
+    """Handle to an int64 array placed in a shared memory block."""
+    name: str
+    length: int
+
+
+def _share(array: Sequence[int], blocks: list) -> _SharedArray:
+    """Copy ``array`` into a new shared memory block and return its handle."""
+    block = shared_memory.SharedMemory(create=True, size=max(1, len(array)) * 8)
+    np.ndarray((len(array),), dtype=np.int64, buffer=block.buf)[:] = array
+    blocks.append(block)
+    return _SharedArray(block.name, len(array))
+
+
+def _attach(array: Any) -> List[int]:
+    """Materialize an array sent to a worker as Python ints, reading shared memory if needed."""
+    if not isinstance(array, _SharedArray):
+        # NumPy arrays must not hand their int64 scalars to the engines.
+        return array.tolist() if isinstance(array, np.ndarray) else list(array)
+    block = shared_memory.SharedMemory(name=array.name)
+    try:
+        return np.ndarray((array.length,), dtype=np.int64, buffer=block.buf).tolist()
+    finally:
+        block.close()
+
+
+def _solve_chunk(kind: str, options: Dict[str, Any], time_limit: Optional[float],
+                 chunk: List[Tuple[int, Any]]) -> List[BatchResult]:
+    """Worker entry point: solve every instance of a chunk, capturing errors."""
+    solve = KnapsackSolver.solve_01_knapsack if kind == "01" else KnapsackSolver.solve_fractional_knapsack
+    results = []
+    for index, instance in chunk:
+        try:
+            if isinstance(instance, Exception):
+                raise instance
+            capacity, weights, values = instance
+            instance_options = options
+            if time_limit is not None and kind == "01":
+                instance_options = dict(options, control=SolveControl(time_limit))
+            max_value, selected_items = solve(capacity, _attach(weights), _attach(values), **instance_options)
+            results.append(BatchResult(index, max_value, selected_items))
+        except Exception as e:
+            results.append(BatchResult(index, error=f"{type(e).__name__}: {e}"))
+    return results
+
+
+class BatchSolver:
+    """
+    Spreads independent knapsack instances over a ``ProcessPoolExecutor``.
+
+    Instances are grouped into chunks so that small problems do not pay one
+    round-trip each, and weight/value arrays of at least
+    ``SHARED_MEMORY_THRESHOLD`` items travel through
+    ``multiprocessing.shared_memory`` instead of being pickled. Only a
+    bounded number of chunks is in flight at a time, so arbitrarily long
+    instance streams are consumed lazily.
+    """
+
+    SHARED_MEMORY_THRESHOLD = 100_000
+    DEFAULT_CHUNK_SIZE = 32
+
+    @staticmethod
+    def solve_batch(instances: Iterable[Tuple[int, Sequence[int], Sequence[int]]], kind: str = "01",
+                    workers: Optional[int] = None, chunk_size: Optional[int] = None,
+                    ordered: bool = True, time_limit: Optional[float] = None,
+                    **options) -> Iterator[BatchResult]:
+        """
+        Solve a stream of knapsack instances in parallel.
+
+        Args:
+            instances: Iterable of (capacity, weights, values) tuples; an
+                exception in place of a tuple (e.g. an instance that failed
+                to load) keeps its position and is reported as its error
+            kind: "01" for 0/1 knapsack, "fractional" for fractional knapsack
+            workers: Number of worker processes (defaults to all cores)
+            chunk_size: Instances per task (defaults to ``DEFAULT_CHUNK_SIZE``)
+            ordered: Yield results in input order (True) or as they complete (False)
+            time_limit: Per-instance wall time in seconds for 0/1 solves; an
+                instance that runs over is reported with an error
+            **options: Extra keyword arguments for the solver, e.g. ``engine``
+
+        Yields:
+            BatchResult for every instance, tagged with its input index
+        """
+        if kind not in ("01", "fractional"):
+            raise ValueError(f"Unknown knapsack kind '{kind}', expected '01' or 'fractional'")
+        workers = workers or os.cpu_count() or 1
+        chunk_size = chunk_size or BatchSolver.DEFAULT_CHUNK_SIZE
+        max_in_flight = 2 * workers
+        if shared_memory is not None and os.name == "posix":
+            # Workers forked before the parent's first block would start
+            # their own resource tracker, which then reports the blocks the
+            # parent unlinks as leaked. Starting it first lets every worker
+            # share it, so only the parent's registration counts.
+            resource_tracker.ensure_running()
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            blocks_by_future = {}
+            chunks = BatchSolver._chunks(instances, chunk_size)
+
+            def submit_next() -> None:
+                chunk_and_blocks = next(chunks, None)
+                if chunk_and_blocks is not None:
+                    chunk, blocks = chunk_and_blocks
+                    future = executor.submit(_solve_chunk, kind, options, time_limit, chunk)
+                    blocks_by_future[future] = blocks
+                    pending.append(future)
+
+            try:
+                for _ in range(max_in_flight):
+                    submit_next()
+
+                while pending:
+                    if ordered:
+                        done = [pending.popleft()]
+                    else:
+                        finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        done = [future for future in pending if future in finished]
+                        for future in done:
+                            pending.remove(future)
+
+                    for future in done:
+                        try:
+                            results = future.result()
+                        finally:
+                            BatchSolver._release(blocks_by_future.pop(future))
+                        submit_next()
+                        yield from results
+            finally:
+                for future in pending:
+                    future.cancel()
+                for blocks in blocks_by_future.values():
+                    BatchSolver._release(blocks)
+
+    @staticmethod
+    def _release(blocks: list) -> None:
+        """Free the shared memory blocks of a finished chunk."""
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    @staticmethod
+    def _chunks(instances: Iterable[Tuple[int, Sequence[int], Sequence[int]]],
+                chunk_size: int) -> Iterator[Tuple[list, list]]:
+        """Group instances into chunks, moving large arrays to shared memory."""
+        chunk = []
+        blocks = []
+        for index, instance in enumerate(instances):
+            if not isinstance(instance, Exception):
+                capacity, weights, values = instance
+                if shared_memory is not None and len(weights) >= BatchSolver.SHARED_MEMORY_THRESHOLD:
+                    instance = (capacity, _share(weights, blocks), _share(values, blocks))
+            chunk.append((index, instance))
+            if len(chunk) == chunk_size:
+                yield chunk, blocks
+                chunk = []
+                blocks = []
+        if chunk:
+            yield chunk, blocks
@@ -0,0 +1,214 @@
+"""
+Bounded and Unbounded Knapsack Engine
+Knapsack variants where items are available in several copies.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .dense_engine import DenseEngine
+
+
+class BoundedEngine:
+    """
+    Knapsack engine for items with multiplicities.
+
+    An item with k available copies is split into pieces of 1, 2, 4, ...
+    copies plus a remainder, so any count from 0 to k is a sum of distinct
+    pieces. The pieces are solved as a 0/1 instance by
+    ``KnapsackSolver.solve_01_knapsack``, whose engine choice respects the
+    memory budget, and grow n by only O(log k) per item instead of k.
+
+    Unlimited copies use a dedicated O(n * C) forward DP instead: within
+    each residue class modulo the item weight, the best value with any
+    number of copies is a running maximum, which NumPy computes for the
+    whole row at once.
+    """
+
+    # Bytes per capacity unit of the unbounded DP: the previous and new
+    # value rows, the padded copy being shifted and the take flags.
+    ROW_BYTES = 25
+
+    @staticmethod
+    def table_bytes(capacity: int, n: int) -> int:
+        """Estimate the peak memory of the unbounded DP: decision bits plus working rows."""
+        return DenseEngine.decision_bytes(capacity, n) + BoundedEngine.ROW_BYTES * (capacity + 1)
+
+    @staticmethod
+    def split(capacity: int, weights: Sequence[int],
+              counts: Sequence[Optional[int]]) -> List[Tuple[int, int]]:
+        """
+        Binary-split every item into (item_index, copies) pieces.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            counts: Available copies per item, None for unlimited
+
+        Returns:
+            List of (item_index, copies) pieces
+        """
+        pieces = []
+        for i, weight in enumerate(weights):
+            limit = capacity // weight
+            count = limit if counts[i] is None else min(counts[i], limit)
+            size = 1
+            while count > 0:
+                copies = min(size, count)
+                pieces.append((i, copies))
+                count -= copies
+                size *= 2
+        return pieces
+
+    @staticmethod
+    def solve(capacity: int, weights: List[int], values: List[int],
+              counts: Sequence[Optional[int]], memory_budget: Optional[int] = None) -> Tuple[int, List[int]]:
+        """
+        Solve the bounded knapsack problem.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+            counts: Available copies per item, None for unlimited
+            memory_budget: Peak memory budget in bytes for the 0/1 engine
+                choice (defaults to ``KnapsackSolver.MEMORY_BUDGET``)
+
+        Returns:
+            Tuple containing (maximum_value, copies_taken_per_item)
+        """
+        from .knapsack_solver import KnapsackSolver
+        if len(counts) != len(weights):
+            raise ValueError(f"Number of counts ({len(counts)}) must equal number of weights ({len(weights)})")
+        if any(count is not None and count < 0 for count in counts):
+            raise ValueError("All counts must be non-negative")
+
+        pieces = BoundedEngine.split(capacity, weights, counts)
+        piece_weights = [weights[i] * copies for i, copies in pieces]
+        piece_values = [values[i] * copies for i, copies in pieces]
+
+        max_value, selected_pieces = KnapsackSolver.solve_01_knapsack(capacity, piece_weights, piece_values,
+                                                                      memory_budget=memory_budget)
+        item_counts = [0] * len(weights)
+        for p in selected_pieces:
+            i, copies = pieces[p]
+            item_counts[i] += copies
+
+        return max_value, item_counts
+
+    @staticmethod
+    def solve_unbounded(capacity: int, weights: List[int], values: List[int],
+                        memory_budget: Optional[int] = None) -> Tuple[int, List[int]]:
+        """
+        Solve the unbounded knapsack problem (unlimited copies of every item).
+
+        Runs the forward DP of :meth:`fill_unbounded` when its table fits the
+        memory budget and its values fit in int64; otherwise the items are
+        binary-split and solved like a bounded instance.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+            memory_budget: Peak memory budget in bytes (defaults to
+                ``KnapsackSolver.MEMORY_BUDGET``)
+
+        Returns:
+            Tuple containing (maximum_value, copies_taken_per_item)
+        """
+        from .knapsack_solver import KnapsackSolver
+        budget = KnapsackSolver.MEMORY_BUDGET if memory_budget is None else memory_budget
+        # capacity * best ratio bounds every row entry.
+        bound = max((capacity * value // weight for weight, value in zip(weights, values)), default=0)
+        if bound >= 2 ** 62 or BoundedEngine.table_bytes(capacity, len(weights)) > budget:
+            return BoundedEngine.solve(capacity, weights, values, [None] * len(weights), memory_budget)
+
+        kept = BoundedEngine.undominated(capacity, weights, values)
+        kept_weights = [weights[i] for i in kept]
+        row, decisions = BoundedEngine.fill_unbounded(capacity, kept_weights, [values[i] for i in kept])
+        item_counts = [0] * len(weights)
+        w = capacity
+        for k in range(len(kept) - 1, -1, -1):
+            # A set bit means the best value at w uses another copy of the item.
+            while (decisions[k, w >> 3] >> (7 - (w & 7))) & 1:
+                item_counts[kept[k]] += 1
+                w -= kept_weights[k]
+
+        return int(row[capacity]), item_counts
+
+    @staticmethod
+    def undominated(capacity: int, weights: List[int], values: List[int]) -> List[int]:
+        """
+        Indices of the items an unbounded optimum may need.
+
+        Items heavier than ``capacity`` are dropped, as is every item that
+        a lighter-or-equal item matches in value, or that as many copies of
+        the best-ratio item as fit in its weight match in value.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+
+        Returns:
+            Kept item indices in ascending order
+        """
+        candidates = [i for i in range(len(weights)) if weights[i] <= capacity]
+        if not candidates:
+            return []
+        best = max(candidates, key=lambda i: values[i] / weights[i])
+        kept = []
+        best_value = 0
+        for i in sorted(candidates, key=lambda i: (weights[i], -values[i], i)):
+            if values[i] > best_value and (i == best or weights[i] // weights[best] * values[best] < values[i]):
+                kept.append(i)
+                best_value = values[i]
+        kept.sort()
+        return kept
+
+    @staticmethod
+    def fill_unbounded(capacity: int, weights: List[int], values: List[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Run the unbounded forward pass and record the decision bits.
+
+        After item i, ``row[c] = max(previous[c], row[c - w] + v)``. Grouping
+        the capacities by residue modulo w turns this into a running maximum
+        of ``previous[r + k*w] - k*v`` down each group, shifted back by k*v.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+
+        Returns:
+            Tuple containing (value_row, packed_decisions) where bit c of
+            ``packed_decisions[i]`` tells that the best value at capacity c
+            after item i takes one more copy of it
+        """
+        n = len(weights)
+        row = np.zeros(capacity + 1, dtype=np.int64)
+        decisions = np.zeros((n, (capacity + 8) // 8), dtype=np.uint8)
+
+        for i in range(n):
+            weight = weights[i]
+            if weight > capacity:
+                continue
+            # Padding cells come last in their group, so they never leak
+            # into the running maximum of a real capacity.
+            groups = -(-(capacity + 1) // weight)
+            grid = np.zeros(groups * weight, dtype=np.int64)
+            grid[:capacity + 1] = row
+            shift = np.arange(groups, dtype=np.int64)[:, None] * values[i]
+            best = grid.reshape(groups, weight) - shift
+            np.maximum.accumulate(best, axis=0, out=best)
+            best += shift
+            best = best.reshape(-1)[:capacity + 1]
+            take = best > row
+            row = best
+            decisions[i] = np.packbits(take)
+
+        return row, decisions
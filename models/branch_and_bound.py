@@ -0,0 +1,176 @@
+"""
+Branch-and-Bound Solver
+Capacity-independent exact 0/1 knapsack solver.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import time
+from bisect import bisect_right
+from itertools import accumulate
+from typing import List, Optional, Sequence, Tuple
+
+from .control import SolveControl
+from .greedy import GreedySolver
+from .stats import SolveStats
+
+
+class BranchAndBoundResult:
+    """
+    Outcome of a branch-and-bound run.
+
+    ``upper_bound`` equals ``max_value`` when the search finished; when a
+    node or time limit stopped it early, it is the best bound still held by
+    an unexplored node.
+    """
+
+    def __init__(self, max_value: int, selected_items: List[int], upper_bound: int,
+                 nodes: int, optimal: bool):
+        self.max_value = max_value
+        self.selected_items = selected_items
+        self.upper_bound = upper_bound
+        self.nodes = nodes
+        self.optimal = optimal
+
+    @property
+    def gap(self) -> float:
+        """Relative optimality gap ``(upper_bound - max_value) / upper_bound``."""
+        if self.upper_bound <= 0:
+            return 0.0
+        return (self.upper_bound - self.max_value) / self.upper_bound
+
+    def as_tuple(self) -> Tuple[int, List[int]]:
+        """Return the solution as (maximum_value, selected_item_indices)."""
+        return self.max_value, self.selected_items
+
+
+class FractionalBound:
+    """
+    Dantzig upper bound over items in ratio order.
+
+    Evaluates the greedy fractional fill of :class:`GreedySolver` from any
+    position of the ordering in O(log n) using prefix sums, and floors it
+    since every 0/1 solution has an integer value.
+    """
+
+    def __init__(self, order: Sequence[int], weights: Sequence[int], values: Sequence[int]):
+        self.weights = [weights[i] for i in order]
+        self.values = [values[i] for i in order]
+        self.prefix_weights = [0] + list(accumulate(self.weights))
+        self.prefix_values = [0] + list(accumulate(self.values))
+
+    def __call__(self, k: int, remaining: int, value: int) -> int:
+        """Bound for a node that has decided the first ``k`` items in order."""
+        limit = self.prefix_weights[k] + remaining
+        j = bisect_right(self.prefix_weights, limit, lo=k) - 1
+        bound = value + self.prefix_values[j] - self.prefix_values[k]
+        if j < len(self.weights):
+            bound += (limit - self.prefix_weights[j]) * self.values[j] // self.weights[j]
+        return bound
+
+
+class BranchAndBoundSolver:
+    """
+    Depth-first branch-and-bound over items in value-to-weight ratio order.
+
+    Runtime depends on the number of explored nodes, not on ``capacity``,
+    which makes it suitable for instances with very large weights.
+    """
+
+    # How many nodes are expanded between two clock reads.
+    CLOCK_INTERVAL = 1024
+
+    @staticmethod
+    def solve(capacity: int, weights: List[int], values: List[int],
+              node_limit: Optional[int] = None, time_limit: Optional[float] = None,
+              control: Optional[SolveControl] = None, stats: Optional[SolveStats] = None,
+              incumbent: Optional[Tuple[int, List[int]]] = None) -> BranchAndBoundResult:
+        """
+        Solve the 0/1 Knapsack problem by branch-and-bound.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+            node_limit: Maximum number of nodes to expand
+            time_limit: Maximum wall time in seconds
+            control: Optional progress and cancellation handle
+            stats: Optional record receiving the search time and node count
+            incumbent: Known feasible (value, selected_items) to start from;
+                used instead of the greedy fill when it is better
+
+        Returns:
+            BranchAndBoundResult with the incumbent and the remaining gap
+        """
+        stats = stats or SolveStats(trace_memory=False)
+        with stats.phase("search"):
+            result = BranchAndBoundSolver._search(capacity, weights, values, node_limit, time_limit, control,
+                                                  incumbent)
+        stats.nodes += result.nodes
+        return result
+
+    @staticmethod
+    def _search(capacity: int, weights: List[int], values: List[int], node_limit: Optional[int],
+                time_limit: Optional[float], control: Optional[SolveControl],
+                incumbent: Optional[Tuple[int, List[int]]]) -> BranchAndBoundResult:
+        """Run the depth-first search of :meth:`solve`."""
+        deadline = None if time_limit is None else time.perf_counter() + time_limit
+        order = GreedySolver.ratio_order(weights, values)
+        bound = FractionalBound(order, weights, values)
+        ordered_weights = bound.weights
+        ordered_values = bound.values
+        n = len(order)
+
+        best_value, initial_items = GreedySolver.integral_fill(capacity, order, weights, values)
+        if incumbent is not None and incumbent[0] > best_value:
+            best_value, initial_items = incumbent
+        best_path = None
+        best_is_initial = True
+
+        # Each node is (depth, remaining_capacity, value, path) where path is
+        # a linked list (position, parent) of the items taken so far.
+        stack = [(0, capacity, 0, None)]
+        nodes = 0
+        stopped = False
+
+        while stack:
+            if node_limit is not None and nodes >= node_limit:
+                stopped = True
+                break
+            if nodes % BranchAndBoundSolver.CLOCK_INTERVAL == 0:
+                if control is not None:
+                    control.update(nodes, node_limit, "nodes")
+                if deadline is not None and time.perf_counter() > deadline:
+                    stopped = True
+                    break
+
+            k, remaining, value, path = stack.pop()
+            nodes += 1
+
+            if value > best_value:
+                best_value = value
+                best_path = path
+                best_is_initial = False
+            if k == n or bound(k, remaining, value) <= best_value:
+                continue
+
+            stack.append((k + 1, remaining, value, path))
+            if ordered_weights[k] <= remaining:
+                stack.append((k + 1, remaining - ordered_weights[k], value + ordered_values[k], (k, path)))
+
+        if best_is_initial:
+            selected_items = sorted(initial_items)
+        else:
+            selected_items = []
+            while best_path is not None:
+                position, best_path = best_path
+                selected_items.append(order[position])
+            selected_items.sort()
+
+        if stopped:
+            upper_bound = max([best_value] + [bound(k, r, v) for k, r, v, _ in stack])
+        else:
+            upper_bound = best_value
+
+        return BranchAndBoundResult(best_value, selected_items, upper_bound, nodes, not stopped)
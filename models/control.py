@@ -0,0 +1,69 @@
+"""
+Solve Control
+Progress reporting and cooperative cancellation for long-running solves.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class SolveCancelled(Exception):
+    """Raised inside an engine when its solve has been cancelled."""
+
+
+class SolveControl:
+    """
+    Shared handle between a running solve and the code that started it.
+
+    Engines call :meth:`update` as they make progress (DP rows completed,
+    nodes explored, ...). The caller reads ``done``/``total`` from any
+    thread and may call :meth:`cancel`, which makes the next
+    :meth:`update` raise :class:`SolveCancelled` inside the engine. A
+    ``time_limit`` cancels the solve the same way once it has elapsed.
+    """
+
+    def __init__(self, time_limit: Optional[float] = None):
+        self.done = 0
+        self.total: Optional[int] = None
+        self.unit = "rows"
+        self.time_limit = time_limit
+        self._deadline = None if time_limit is None else time.perf_counter() + time_limit
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        """True once :meth:`cancel` has been called."""
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Ask the running engine to stop at its next progress update."""
+        self._cancelled.set()
+
+    def update(self, done: int, total: Optional[int] = None, unit: Optional[str] = None) -> None:
+        """
+        Record progress and stop the engine if cancellation was requested.
+
+        Args:
+            done: Work units completed so far
+            total: Total work units, if known
+            unit: Name of the work unit, e.g. "rows" or "nodes"
+        """
+        self.done = done
+        if total is not None:
+            self.total = total
+        if unit is not None:
+            self.unit = unit
+        if self._cancelled.is_set():
+            raise SolveCancelled("Solve cancelled")
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            raise SolveCancelled(f"Time limit of {self.time_limit:g}s exceeded")
+
+    def describe(self) -> str:
+        """Human readable progress, e.g. "1200 / 5000 rows"."""
+        if self.total:
+            return f"{self.done} / {self.total} {self.unit}"
+        return f"{self.done} {self.unit}"
@@ -0,0 +1,152 @@
+"""
+Dense Dynamic Programming Engine
+Vectorized 0/1 knapsack engine built on NumPy.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .control import SolveControl
+from .stats import SolveStats
+
+
+class DenseEngine:
+    """
+    Rolling-row 0/1 knapsack engine.
+
+    Keeps a single 1-D value row that is updated per item with a vectorized
+    ``np.maximum`` over shifted slices. Take/skip decisions are stored one
+    bit per cell in a packed matrix, which is all the backtracking needs.
+    """
+
+    # Working bytes per unit of capacity during the forward pass: the int64
+    # value row, the int64 candidate copy, NumPy's temporary for the
+    # overlapping in-place maximum and the take flags.
+    ROW_BYTES = 25
+
+    @staticmethod
+    def value_row(capacity: int, weights: List[int], values: List[int],
+                  control: Optional[SolveControl] = None) -> np.ndarray:
+        """
+        Compute the optimal value for every capacity 0..capacity.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+            control: Optional progress and cancellation handle
+
+        Returns:
+            Value row where ``row[c]`` is the best value within capacity c
+        """
+        row = np.zeros(capacity + 1, dtype=np.int64)
+        for i, (weight, value) in enumerate(zip(weights, values)):
+            if control is not None:
+                control.update(i, len(weights))
+            if weight > capacity:
+                continue
+            np.maximum(row[weight:], row[:capacity + 1 - weight] + value, out=row[weight:])
+        return row
+
+    @staticmethod
+    def cells(capacity: int, weights: List[int]) -> int:
+        """Number of DP cells a forward pass over ``weights`` evaluates."""
+        return sum(capacity + 1 - weight for weight in weights if weight <= capacity)
+
+    @staticmethod
+    def decision_bytes(capacity: int, n: int) -> int:
+        """Size of the packed decision table in bytes."""
+        return n * ((capacity + 8) // 8)
+
+    @staticmethod
+    def table_bytes(capacity: int, n: int) -> int:
+        """Estimate the peak memory of a solve: decision table plus working rows."""
+        return DenseEngine.decision_bytes(capacity, n) + DenseEngine.ROW_BYTES * (capacity + 1)
+
+    @staticmethod
+    def fill(capacity: int, weights: List[int], values: List[int],
+             control: Optional[SolveControl] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Run the forward pass and record the decision bits.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+            control: Optional progress and cancellation handle
+
+        Returns:
+            Tuple containing (value_row, packed_decisions) where
+            ``packed_decisions[i]`` holds the bit-packed take flags of item i
+        """
+        n = len(weights)
+        row = np.zeros(capacity + 1, dtype=np.int64)
+        decisions = np.zeros((n, (capacity + 8) // 8), dtype=np.uint8)
+        take = np.zeros(capacity + 1, dtype=bool)
+
+        for i in range(n):
+            if control is not None:
+                control.update(i, n)
+            weight = weights[i]
+            if weight > capacity:
+                continue
+            # The candidate slice is a copy, so the in-place update below
+            # never reads a value already overwritten for this item.
+            candidate = row[:capacity + 1 - weight] + values[i]
+            take[:weight] = False
+            np.greater(candidate, row[weight:], out=take[weight:])
+            np.maximum(row[weight:], candidate, out=row[weight:])
+            decisions[i] = np.packbits(take)
+
+        return row, decisions
+
+    @staticmethod
+    def backtrack(capacity: int, weights: List[int], decisions: np.ndarray) -> List[int]:
+        """
+        Recover the selected item indices from the packed decision bits.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            decisions: Packed decision matrix produced by :meth:`fill`
+
+        Returns:
+            Selected item indices in ascending order
+        """
+        selected_items = []
+        w = capacity
+        for i in range(len(weights) - 1, -1, -1):
+            if (decisions[i, w >> 3] >> (7 - (w & 7))) & 1:
+                selected_items.append(i)
+                w -= weights[i]
+
+        selected_items.reverse()
+        return selected_items
+
+    @staticmethod
+    def solve(capacity: int, weights: List[int], values: List[int],
+              control: Optional[SolveControl] = None, stats: Optional[SolveStats] = None) -> Tuple[int, List[int]]:
+        """
+        Solve the 0/1 Knapsack problem with the vectorized rolling row.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+            control: Optional progress and cancellation handle
+            stats: Optional record receiving phase timings and cell counts
+
+        Returns:
+            Tuple containing (maximum_value, selected_item_indices)
+        """
+        stats = stats or SolveStats(trace_memory=False)
+        with stats.phase("fill"):
+            row, decisions = DenseEngine.fill(capacity, weights, values, control)
+        with stats.phase("backtrack"):
+            selected_items = DenseEngine.backtrack(capacity, weights, decisions)
+        stats.cells += DenseEngine.cells(capacity, weights)
+        return int(row[capacity]), selected_items
@@ -0,0 +1,90 @@
+"""
+FPTAS Engine
+Fully polynomial approximation scheme for 0/1 knapsack.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+from typing import List, Optional
+
+import numpy as np
+
+from .branch_and_bound import BranchAndBoundResult, FractionalBound
+from .control import SolveControl
+from .greedy import GreedySolver
+from .stats import SolveStats
+from .value_engine import ValueEngine
+
+
+class FPTASEngine:
+    """
+    0/1 knapsack engine returning a selection worth at least (1 - epsilon) of optimal.
+
+    Values are divided by ``K = floor(epsilon * LB / n)``, where LB is the
+    greedy lower bound (at least half the optimum), and the scaled instance
+    is solved exactly by the value-indexed DP. Rounding loses less than K
+    per selected item, so at most ``epsilon * LB`` in total. The DP has
+    O(n / epsilon) columns, independent of the capacity and the values.
+    """
+
+    DEFAULT_EPSILON = 0.1
+
+    @staticmethod
+    def solve(capacity: int, weights: List[int], values: List[int], epsilon: float = DEFAULT_EPSILON,
+              control: Optional[SolveControl] = None, stats: Optional[SolveStats] = None) -> BranchAndBoundResult:
+        """
+        Solve the 0/1 Knapsack problem to within a factor of (1 - epsilon).
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+            epsilon: Allowed relative loss, between 0 (exclusive) and 1
+            control: Optional progress and cancellation handle
+            stats: Optional record receiving phase timings and cell counts
+
+        Returns:
+            BranchAndBoundResult with the selection, a proven upper bound on
+            the optimum and the resulting gap (never above epsilon)
+
+        Raises:
+            ValueError: If epsilon is not in (0, 1)
+        """
+        if not 0 < epsilon < 1:
+            raise ValueError(f"epsilon must be between 0 and 1, got {epsilon}")
+        stats = stats or SolveStats(trace_memory=False)
+
+        with stats.phase("bounds"):
+            fitting = [i for i in range(len(weights)) if weights[i] <= capacity]
+            fitting_weights = [weights[i] for i in fitting]
+            fitting_values = [values[i] for i in fitting]
+            n = len(fitting)
+
+            order = GreedySolver.ratio_order(fitting_weights, fitting_values)
+            upper_bound = FractionalBound(order, fitting_weights, fitting_values)(0, capacity, 0)
+            best_value, selected = GreedySolver.integral_fill(capacity, order, fitting_weights, fitting_values)
+            if n:
+                best_single = max(range(n), key=fitting_values.__getitem__)
+                if fitting_values[best_single] > best_value:
+                    best_value, selected = fitting_values[best_single], [best_single]
+
+            # Most items any feasible selection can hold: the lightest ones.
+            most_items = int(np.searchsorted(np.cumsum(np.sort(np.asarray(fitting_weights, dtype=np.int64))),
+                                             capacity, side="right"))
+
+        if best_value < upper_bound:
+            scale = max(1, int(epsilon * best_value / n))
+            scaled_values = [value // scale for value in fitting_values]
+            scaled_best, scaled_selected = ValueEngine.solve(
+                capacity, fitting_weights, scaled_values, control=control, stats=stats,
+                value_limit=upper_bound // scale
+            )
+            value = sum(fitting_values[i] for i in scaled_selected)
+            if value > best_value:
+                best_value, selected = value, scaled_selected
+            # Each item of an optimal selection lost less than one scale step.
+            upper_bound = min(upper_bound, scale * scaled_best + (scale - 1) * most_items)
+
+        selected_items = sorted(fitting[i] for i in selected)
+        return BranchAndBoundResult(best_value, selected_items, upper_bound, 0, best_value == upper_bound)
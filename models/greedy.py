@@ -0,0 +1,222 @@
+"""
+Greedy Ratio Ordering
+Shared value-to-weight ratio logic used by the fractional solver and as a
+bounding procedure by the exact solvers.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import random
+from typing import TYPE_CHECKING, List, Sequence, Tuple
+
+# NumPy is only needed by fractional_arrays and imported there.
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class GreedySolver:
+    """
+    Greedy procedures over items ordered by value-to-weight ratio.
+    """
+
+    @staticmethod
+    def ratio_order(weights: Sequence[int], values: Sequence[int]) -> List[int]:
+        """
+        Order item indices by value-to-weight ratio, best first.
+
+        Args:
+            weights: List of item weights
+            values: List of item values
+
+        Returns:
+            Item indices sorted by decreasing ratio (stable for ties)
+        """
+        ratios = [values[i] / weights[i] for i in range(len(weights))]
+        return sorted(range(len(weights)), key=ratios.__getitem__, reverse=True)
+
+    @staticmethod
+    def fractional_fill(capacity: int, order: Sequence[int], weights: Sequence[int],
+                        values: Sequence[int]) -> Tuple[float, List[Tuple[int, float]]]:
+        """
+        Fill the knapsack along ``order``, splitting the first item that does not fit.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            order: Item indices in the order they are considered
+            weights: List of item weights
+            values: List of item values
+
+        Returns:
+            Tuple containing (maximum_value, selected_items_with_fractions)
+        """
+        max_value = 0.0
+        selected_items = []
+        remaining_capacity = capacity
+
+        for item_index in order:
+            weight = weights[item_index]
+            value = values[item_index]
+            if remaining_capacity >= weight:
+                # Take the whole item
+                max_value += value
+                selected_items.append((item_index, 1.0))
+                remaining_capacity -= weight
+            elif remaining_capacity > 0:
+                # Take fraction of the item
+                fraction = remaining_capacity / weight
+                max_value += value * fraction
+                selected_items.append((item_index, fraction))
+                break
+
+        return max_value, selected_items
+
+    @staticmethod
+    def integral_fill(capacity: int, order: Sequence[int], weights: Sequence[int],
+                      values: Sequence[int]) -> Tuple[int, List[int]]:
+        """
+        Fill the knapsack along ``order`` with whole items only.
+
+        Items that do not fit are skipped rather than split, which yields a
+        feasible 0/1 solution.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            order: Item indices in the order they are considered
+            weights: List of item weights
+            values: List of item values
+
+        Returns:
+            Tuple containing (total_value, selected_item_indices)
+        """
+        total_value = 0
+        selected_items = []
+        remaining_capacity = capacity
+
+        for item_index in order:
+            if weights[item_index] <= remaining_capacity:
+                total_value += values[item_index]
+                selected_items.append(item_index)
+                remaining_capacity -= weights[item_index]
+
+        return total_value, selected_items
+
+    @staticmethod
+    def fractional_select(capacity: int, weights: Sequence[int],
+                          values: Sequence[int]) -> Tuple[float, List[Tuple[int, float]]]:
+        """
+        Solve the Fractional Knapsack problem in expected linear time.
+
+        Only the critical (break) ratio matters: items above it are taken
+        whole, the break item is split. The critical ratio is located by
+        quickselect-style partitioning around random pivots, so no sort is
+        needed.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+
+        Returns:
+            Tuple containing (maximum_value, selected_items_with_fractions);
+            whole items come first in index order, the split item last
+        """
+        ratios = [values[i] / weights[i] for i in range(len(weights))]
+        candidates = list(range(len(weights)))
+        taken = []
+        remaining_capacity = capacity
+        split = None
+
+        while candidates and remaining_capacity > 0:
+            pivot = ratios[random.choice(candidates)]
+            higher = [i for i in candidates if ratios[i] > pivot]
+            higher_weight = sum(weights[i] for i in higher)
+            if higher_weight > remaining_capacity:
+                candidates = higher
+                continue
+
+            taken.extend(higher)
+            remaining_capacity -= higher_weight
+            for i in candidates:
+                if ratios[i] != pivot:
+                    continue
+                if weights[i] <= remaining_capacity:
+                    taken.append(i)
+                    remaining_capacity -= weights[i]
+                else:
+                    split = i
+                    break
+            if split is not None:
+                break
+            candidates = [i for i in candidates if ratios[i] < pivot]
+
+        taken.sort()
+        max_value = float(sum(values[i] for i in taken))
+        selected_items = [(i, 1.0) for i in taken]
+        if split is not None and remaining_capacity > 0:
+            fraction = remaining_capacity / weights[split]
+            max_value += values[split] * fraction
+            selected_items.append((split, fraction))
+
+        return max_value, selected_items
+
+    @staticmethod
+    def fractional_arrays(capacity: int, weights, values) -> Tuple[float, "np.ndarray", "np.ndarray"]:
+        """
+        Vectorized linear-time Fractional Knapsack for large item arrays.
+
+        Works like :meth:`fractional_select` but partitions around the exact
+        median ratio with ``np.partition``, so every round at least halves
+        the candidate set, and keeps the result in arrays instead of per-item
+        Python tuples.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: Item weights (any 1-D array-like)
+            values: Item values (any 1-D array-like)
+
+        Returns:
+            Tuple containing (maximum_value, item_indices, fractions); whole
+            items come first in index order, the split item last
+        """
+        import numpy as np
+
+        weights = np.asarray(weights)
+        values = np.asarray(values)
+        ratios = values / weights
+        candidates = np.arange(len(weights))
+        taken = []
+        remaining_capacity = capacity
+        split = None
+
+        while len(candidates) and remaining_capacity > 0:
+            candidate_ratios = ratios[candidates]
+            middle = len(candidates) // 2
+            pivot = np.partition(candidate_ratios, middle)[middle]
+            higher = candidates[candidate_ratios > pivot]
+            higher_weight = int(weights[higher].sum())
+            if higher_weight > remaining_capacity:
+                candidates = higher
+                continue
+
+            taken.append(higher)
+            remaining_capacity -= higher_weight
+            equal = candidates[candidate_ratios == pivot]
+            fits = int(np.searchsorted(np.cumsum(weights[equal]), remaining_capacity, side="right"))
+            taken.append(equal[:fits])
+            remaining_capacity -= int(weights[equal[:fits]].sum())
+            if fits < len(equal):
+                split = int(equal[fits])
+                break
+            candidates = candidates[candidate_ratios < pivot]
+
+        indices = np.sort(np.concatenate(taken)) if taken else np.zeros(0, dtype=np.intp)
+        fractions = np.ones(len(indices))
+        max_value = float(values[indices].sum())
+        if split is not None and remaining_capacity > 0:
+            fraction = remaining_capacity / int(weights[split])
+            max_value += float(values[split]) * fraction
+            indices = np.append(indices, split)
+            fractions = np.append(fractions, fraction)
+
+        return max_value, indices, fractions
@@ -0,0 +1,92 @@
+"""
+Linear-Memory Reconstruction Engine
+Hirschberg-style divide and conquer for the 0/1 knapsack problem.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .control import SolveControl
+from .dense_engine import DenseEngine
+from .stats import SolveStats
+
+
+class HirschbergEngine:
+    """
+    0/1 knapsack engine that recovers the optimal item set in O(C) memory.
+
+    The item list is split in half, a forward value row is computed for the
+    first half and a backward one for the second, and the capacity split
+    maximising their sum tells how much room each half receives in an
+    optimal solution. Both halves are then solved recursively. Sub-problems
+    whose decision table fits in ``leaf_budget`` bytes are handed to
+    :class:`DenseEngine` directly.
+    """
+
+    # Working bytes per unit of capacity: the forward and backward int64
+    # rows plus the candidate copy (or their sum) alive at the same time.
+    ROW_BYTES = 24
+
+    @staticmethod
+    def table_bytes(capacity: int) -> int:
+        """Estimate the peak memory of a solve in bytes, independent of n."""
+        return HirschbergEngine.ROW_BYTES * (capacity + 1)
+
+    @staticmethod
+    def solve(capacity: int, weights: List[int], values: List[int],
+              leaf_budget: int = 1 << 20, control: Optional[SolveControl] = None,
+              stats: Optional[SolveStats] = None) -> Tuple[int, List[int]]:
+        """
+        Solve the 0/1 Knapsack problem using linear working memory.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+            leaf_budget: Largest decision table (in bytes) solved directly
+            control: Optional progress and cancellation handle
+            stats: Optional record receiving phase timings and cell counts
+
+        Returns:
+            Tuple containing (maximum_value, selected_item_indices)
+        """
+        stats = stats or SolveStats(trace_memory=False)
+        selected_items = []
+        HirschbergEngine._recurse(
+            list(range(len(weights))), capacity, weights, values, leaf_budget, selected_items, control, stats
+        )
+        selected_items.sort()
+        max_value = sum(values[i] for i in selected_items)
+        return max_value, selected_items
+
+    @staticmethod
+    def _recurse(items: List[int], capacity: int, weights: List[int], values: List[int],
+                 leaf_budget: int, selected_items: List[int], control: Optional[SolveControl],
+                 stats: SolveStats) -> None:
+        """Append the optimal selection of ``items`` within ``capacity``."""
+        items = [i for i in items if weights[i] <= capacity]
+        if not items:
+            return
+
+        sub_weights = [weights[i] for i in items]
+        sub_values = [values[i] for i in items]
+        if len(items) == 1 or DenseEngine.decision_bytes(capacity, len(items)) <= leaf_budget:
+            _, local = DenseEngine.solve(capacity, sub_weights, sub_values, control, stats)
+            selected_items.extend(items[j] for j in local)
+            return
+
+        mid = len(items) // 2
+        with stats.phase("fill"):
+            forward = DenseEngine.value_row(capacity, sub_weights[:mid], sub_values[:mid], control)
+            backward = DenseEngine.value_row(capacity, sub_weights[mid:], sub_values[mid:], control)
+            split = int(np.argmax(forward + backward[::-1]))
+            del forward, backward
+        stats.cells += DenseEngine.cells(capacity, sub_weights)
+
+        HirschbergEngine._recurse(items[:mid], split, weights, values, leaf_budget, selected_items, control, stats)
+        HirschbergEngine._recurse(items[mid:], capacity - split, weights, values, leaf_budget, selected_items,
+                                  control, stats)
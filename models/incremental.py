@@ -0,0 +1,153 @@
+"""
+Incremental 0/1 Knapsack Solver
+Keeps a solution up to date while items are added and removed.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+
+class IncrementalSolver:
+    """
+    0/1 knapsack over a changing item set with a fixed capacity.
+
+    Items are processed in insertion order. Every item keeps its packed
+    take/skip bits, and the value row after every ``checkpoint_interval``
+    items is stored. Adding an item is one vectorized row update. Removing
+    an item rolls back to the nearest checkpoint before it and replays the
+    items that follow, so undoing recent additions costs O(C) while
+    removing the item at position k costs O((n - k) * C); removing one of
+    the first items is as expensive as a full re-solve.
+
+    Items are referred to by the ids returned from :meth:`add_item`, which
+    stay valid across removals.
+    """
+
+    def __init__(self, capacity: int, checkpoint_interval: int = 32):
+        if capacity < 0:
+            raise ValueError("Capacity must be non-negative")
+        self.capacity = capacity
+        self.checkpoint_interval = max(1, checkpoint_interval)
+        self._ids = []
+        self._weights = []
+        self._values = []
+        self._decisions = []
+        self._row = np.zeros(capacity + 1, dtype=np.int64)
+        self._checkpoints = {0: self._row.copy()}
+        self._positions = {}
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def items(self) -> Dict[int, Tuple[int, int]]:
+        """Current items as {item_id: (weight, value)}."""
+        return {item_id: (w, v) for item_id, w, v in zip(self._ids, self._weights, self._values)}
+
+    @property
+    def best_value(self) -> int:
+        """Optimal value of the current item set."""
+        return int(self._row[self.capacity])
+
+    @property
+    def selection(self) -> List[int]:
+        """Ids of the items in the current optimal selection, in insertion order."""
+        selected_items = []
+        w = self.capacity
+        for i in range(len(self._ids) - 1, -1, -1):
+            if (self._decisions[i][w >> 3] >> (7 - (w & 7))) & 1:
+                selected_items.append(self._ids[i])
+                w -= self._weights[i]
+
+        selected_items.reverse()
+        return selected_items
+
+    def solution(self) -> Tuple[int, List[int]]:
+        """Return (maximum_value, selected_item_ids)."""
+        return self.best_value, self.selection
+
+    def add_item(self, weight: int, value: int) -> int:
+        """
+        Append an item with a single DP row update.
+
+        Args:
+            weight: Item weight
+            value: Item value
+
+        Returns:
+            Id of the new item
+        """
+        if weight <= 0 or value <= 0:
+            raise ValueError("Item weight and value must be positive")
+        item_id = self._next_id
+        self._next_id += 1
+        self._positions[item_id] = len(self._ids)
+        self._ids.append(item_id)
+        self._weights.append(weight)
+        self._values.append(value)
+        self._apply(len(self._ids) - 1)
+        return item_id
+
+    def add_items(self, items: Iterable[Tuple[int, int]]) -> List[int]:
+        """Append several (weight, value) items and return their ids."""
+        return [self.add_item(weight, value) for weight, value in items]
+
+    def remove_item(self, item_id: int) -> None:
+        """
+        Remove an item and bring the solution up to date.
+
+        Args:
+            item_id: Id returned by :meth:`add_item`
+        """
+        self.remove_items([item_id])
+
+    def remove_items(self, item_ids: Iterable[int]) -> None:
+        """
+        Remove several items with a single replay.
+
+        The replay starts at the checkpoint before the earliest removed
+        item, so its cost depends on how early that item was added.
+
+        Args:
+            item_ids: Ids returned by :meth:`add_item`
+        """
+        removed = set(item_ids)
+        unknown = removed.difference(self._positions)
+        if unknown:
+            raise KeyError(f"Unknown item id(s): {sorted(unknown)}")
+        if not removed:
+            return
+
+        first = min(self._positions[item_id] for item_id in removed)
+        keep = [i for i in range(len(self._ids)) if self._ids[i] not in removed]
+        self._ids = [self._ids[i] for i in keep]
+        self._weights = [self._weights[i] for i in keep]
+        self._values = [self._values[i] for i in keep]
+        self._positions = {item_id: i for i, item_id in enumerate(self._ids)}
+
+        # Roll back to the last checkpoint that only covers untouched items.
+        start = first - first % self.checkpoint_interval
+        self._checkpoints = {k: row for k, row in self._checkpoints.items() if k <= start}
+        self._row = self._checkpoints[start].copy()
+        del self._decisions[start:]
+        for i in range(start, len(self._ids)):
+            self._apply(i)
+
+    def _apply(self, i: int) -> None:
+        """Fold the item at position ``i`` into the current row."""
+        capacity = self.capacity
+        weight = self._weights[i]
+        take = np.zeros(capacity + 1, dtype=bool)
+        if weight <= capacity:
+            candidate = self._row[:capacity + 1 - weight] + self._values[i]
+            np.greater(candidate, self._row[weight:], out=take[weight:])
+            np.maximum(self._row[weight:], candidate, out=self._row[weight:])
+        self._decisions.append(np.packbits(take))
+
+        if (i + 1) % self.checkpoint_interval == 0:
+            self._checkpoints[i + 1] = self._row.copy()
@@ -6,19 +6,476 @@ Author: GitHub Copilot
 Created: 2025
 """
 
-from typing import List, Tuple
+import logging
+import time
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from .control import SolveControl
+from .branch_and_bound import BranchAndBoundResult, BranchAndBoundSolver
+from .greedy import GreedySolver
+from .preprocessing import InstancePreprocessor
+from .stats import SolveStats
+from .subset_sum_engine import SubsetSumEngine
+
+# The NumPy engines are imported where they are first used, so that
+# importing the solver stays cheap for short-lived processes.
+if TYPE_CHECKING:
+    from .solution_cache import SolvedInstance
+
+logger = logging.getLogger(__name__)
 
 
 class KnapsackSolver:
     """
     A class containing algorithms for solving knapsack problems.
     """
+
+    ENGINES = ("auto", "dense", "value", "pareto", "hirschberg", "branch_and_bound", "core",
+               "meet_in_middle", "subset_sum", "table")
+    FRACTIONAL_ENGINES = ("sort", "select", "numpy")
+
+    # Largest estimated peak memory (in bytes), decision table and working
+    # rows included, the dense engine may use before "auto" switches to
+    # linear-memory reconstruction.
+    MEMORY_BUDGET = 256 * 1024 * 1024
+
+    # Item count from which "auto" solves only the core around the break item.
+    CORE_MIN_ITEMS = 2000
+
+    # Engines keeping values and weights in NumPy int64 arrays.
+    INT64_ENGINES = ("dense", "value", "pareto", "hirschberg", "core")
     
     @staticmethod
-    def solve_01_knapsack(capacity: int, weights: List[int], values: List[int]) -> Tuple[int, List[int]]:
+    def solve_01_knapsack(capacity: int, weights: List[int], values: List[int],
+                          engine: str = "auto", memory_budget: Optional[int] = None,
+                          preprocess: bool = True, control: Optional[SolveControl] = None,
+                          stats: Optional[SolveStats] = None) -> Tuple[int, List[int]]:
         """
         Solve the 0/1 Knapsack problem using dynamic programming.
         
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+            engine: "dense" for the vectorized NumPy engine, "value" for the
+                min-weight-per-value DP, "pareto" for the sparse
+                non-dominated state list, "hirschberg" for linear-memory
+                reconstruction, "branch_and_bound" for the capacity-independent
+                search, "core" for the expanding core around the break item,
+                "meet_in_middle" for few items with huge capacities,
+                "subset_sum" for the bitset engine when values are
+                proportional to weights, "table" for the reference
+                pure-Python table, or "auto" to pick by instance shape,
+                estimated cost and memory budget
+            memory_budget: Peak memory budget in bytes for "auto" and
+                "pareto" (defaults to ``MEMORY_BUDGET``)
+            preprocess: Reduce the instance (divisor scaling, dominance
+                pruning, trivial fixing) before running the engine; the core
+                engine reduces only its core
+            control: Optional progress and cancellation handle
+            stats: Optional SolveStats filled in with the engine used, phase
+                timings, peak memory and work counters
+            
+        Returns:
+            Tuple containing (maximum_value, selected_item_indices)
+        """
+        stats = SolveStats.collect(stats)
+        if stats is None:
+            return KnapsackSolver._solve_01(capacity, weights, values, engine, memory_budget, preprocess, control,
+                                            SolveStats(trace_memory=False))
+        with stats.track(len(weights), capacity):
+            return KnapsackSolver._solve_01(capacity, weights, values, engine, memory_budget, preprocess, control,
+                                            stats)
+
+    @staticmethod
+    def _solve_01(capacity: int, weights: List[int], values: List[int], engine: str,
+                  memory_budget: Optional[int], preprocess: bool, control: Optional[SolveControl],
+                  stats: SolveStats) -> Tuple[int, List[int]]:
+        """Preprocess and dispatch a 0/1 instance to its engine."""
+        if engine == "auto" and len(weights) >= KnapsackSolver.CORE_MIN_ITEMS:
+            engine = "core"
+            logger.info("0/1 knapsack: n=%d capacity=%d engine=%s", len(weights), capacity, engine)
+        # The core engine fixes items with its own bounds and preprocesses
+        # only the core, which keeps the O(n log n) pass off large instances.
+        if preprocess and engine != "core":
+            with stats.phase("preprocess"):
+                reduced = InstancePreprocessor.reduce_01(capacity, weights, values)
+            stats.items_removed += len(weights) - len(reduced.weights)
+            max_value, selected_items = KnapsackSolver._solve_01(
+                reduced.capacity, reduced.weights, reduced.values, engine, memory_budget, False, control, stats
+            )
+            return reduced.restore_01(max_value, selected_items)
+
+        if engine == "auto":
+            engine = KnapsackSolver.select_engine(capacity, weights, values, memory_budget)
+            logger.info("0/1 knapsack: n=%d capacity=%d engine=%s", len(weights), capacity, engine)
+        if engine in KnapsackSolver.INT64_ENGINES and not KnapsackSolver.fits_int64(weights, values):
+            raise ValueError(f"Engine '{engine}' works in int64, which these weights or values could overflow; "
+                             f"use 'branch_and_bound' or 'table'")
+        stats.engine = engine
+
+        if engine == "dense":
+            from .dense_engine import DenseEngine
+            return DenseEngine.solve(capacity, weights, values, control=control, stats=stats)
+        if engine == "value":
+            from .value_engine import ValueEngine
+            return ValueEngine.solve(capacity, weights, values, control=control, stats=stats)
+        if engine == "pareto":
+            from .pareto_engine import ParetoEngine
+            return ParetoEngine.solve(capacity, weights, values, memory_budget=memory_budget, control=control,
+                                      stats=stats)
+        if engine == "hirschberg":
+            from .hirschberg_engine import HirschbergEngine
+            return HirschbergEngine.solve(capacity, weights, values, control=control, stats=stats)
+        if engine == "branch_and_bound":
+            return BranchAndBoundSolver.solve(capacity, weights, values, control=control, stats=stats).as_tuple()
+        if engine == "meet_in_middle":
+            from .meet_in_middle_engine import MeetInMiddleEngine
+            return MeetInMiddleEngine.solve(capacity, weights, values, control=control, stats=stats)
+        if engine == "subset_sum":
+            return SubsetSumEngine.solve(capacity, weights, values, control=control, stats=stats)
+        if engine == "core":
+            from .core_engine import CoreEngine
+            result = CoreEngine.solve(
+                capacity, weights, values, control=control, stats=stats,
+                solve_core=lambda c, w, v: KnapsackSolver._solve_core(c, w, v, memory_budget, preprocess, control,
+                                                                      stats)
+            )
+            stats.engine = "core"
+            return result
+        if engine == "table":
+            with stats.phase("fill"):
+                result = KnapsackSolver._solve_01_table(capacity, weights, values)
+            stats.cells += len(weights) * capacity
+            return result
+        raise ValueError(f"Unknown engine '{engine}', expected one of {KnapsackSolver.ENGINES}")
+
+    @staticmethod
+    def _solve_core(capacity: int, weights: List[int], values: List[int], memory_budget: Optional[int],
+                    preprocess: bool, control: Optional[SolveControl], stats: SolveStats) -> Tuple[int, List[int]]:
+        """
+        Solve a core subproblem of the core engine.
+
+        The engine is picked by :meth:`select_dp_engine` after preprocessing,
+        so a core whose residual capacity is too large for any DP table goes
+        to the capacity-independent branch-and-bound search.
+        """
+        if not preprocess:
+            engine = KnapsackSolver.select_dp_engine(capacity, weights, values, memory_budget)
+            return KnapsackSolver._solve_01(capacity, weights, values, engine, memory_budget, False, control, stats)
+        with stats.phase("preprocess"):
+            reduced = InstancePreprocessor.reduce_01(capacity, weights, values)
+        stats.items_removed += len(weights) - len(reduced.weights)
+        max_value, selected_items = KnapsackSolver._solve_core(
+            reduced.capacity, reduced.weights, reduced.values, memory_budget, False, control, stats
+        )
+        return reduced.restore_01(max_value, selected_items)
+
+    @staticmethod
+    def solve_01_anytime(capacity: int, weights: List[int], values: List[int],
+                         time_budget: Optional[float] = None, preprocess: bool = True,
+                         control: Optional[SolveControl] = None,
+                         stats: Optional[SolveStats] = None) -> BranchAndBoundResult:
+        """
+        Solve the 0/1 Knapsack problem within a time budget.
+
+        Unlike the exact engines this always returns once the budget is spent,
+        with the best selection found so far and a proven upper bound.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+            time_budget: Wall time in seconds, preprocessing included
+                (defaults to ``AnytimeSolver.DEFAULT_BUDGET``)
+            preprocess: Reduce the instance before searching
+            control: Optional progress and cancellation handle
+            stats: Optional SolveStats filled in with phase timings and node count
+
+        Returns:
+            BranchAndBoundResult with the incumbent, upper bound and gap
+        """
+        stats = SolveStats.collect(stats)
+        if stats is None:
+            return KnapsackSolver._solve_01_anytime(capacity, weights, values, time_budget, preprocess, control,
+                                                    SolveStats(trace_memory=False))
+        with stats.track(len(weights), capacity):
+            return KnapsackSolver._solve_01_anytime(capacity, weights, values, time_budget, preprocess, control,
+                                                    stats)
+
+    @staticmethod
+    def _solve_01_anytime(capacity: int, weights: List[int], values: List[int], time_budget: Optional[float],
+                          preprocess: bool, control: Optional[SolveControl],
+                          stats: SolveStats) -> BranchAndBoundResult:
+        """Preprocess and run the anytime solver on the remaining budget."""
+        from .anytime import AnytimeSolver
+        stats.engine = "anytime"
+        if not preprocess:
+            return AnytimeSolver.solve(capacity, weights, values, time_budget, control=control, stats=stats)
+
+        start = time.perf_counter()
+        with stats.phase("preprocess"):
+            reduced = InstancePreprocessor.reduce_01(capacity, weights, values)
+        stats.items_removed += len(weights) - len(reduced.weights)
+        if time_budget is not None:
+            time_budget = max(0.0, time_budget - (time.perf_counter() - start))
+        result = AnytimeSolver.solve(reduced.capacity, reduced.weights, reduced.values, time_budget,
+                                     control=control, stats=stats)
+        result.max_value, result.selected_items = reduced.restore_01(result.max_value, result.selected_items)
+        result.upper_bound += reduced.fixed_value
+        return result
+
+    @staticmethod
+    def solve_01_fptas(capacity: int, weights: List[int], values: List[int],
+                       epsilon: Optional[float] = None, preprocess: bool = True,
+                       control: Optional[SolveControl] = None,
+                       stats: Optional[SolveStats] = None) -> BranchAndBoundResult:
+        """
+        Solve the 0/1 Knapsack problem to within a factor of (1 - epsilon).
+
+        Runs in O(n^2 / epsilon) time whatever the capacity and values, so
+        smaller epsilon trades speed for accuracy.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+            epsilon: Allowed relative loss, between 0 (exclusive) and 1
+                (defaults to ``FPTASEngine.DEFAULT_EPSILON``)
+            preprocess: Reduce the instance before solving
+            control: Optional progress and cancellation handle
+            stats: Optional SolveStats filled in with phase timings and cell counts
+
+        Returns:
+            BranchAndBoundResult with the selection, a proven upper bound and
+            the achieved gap (at most epsilon)
+        """
+        stats = SolveStats.collect(stats)
+        if stats is None:
+            return KnapsackSolver._solve_01_fptas(capacity, weights, values, epsilon, preprocess, control,
+                                                  SolveStats(trace_memory=False))
+        with stats.track(len(weights), capacity):
+            return KnapsackSolver._solve_01_fptas(capacity, weights, values, epsilon, preprocess, control, stats)
+
+    @staticmethod
+    def _solve_01_fptas(capacity: int, weights: List[int], values: List[int], epsilon: Optional[float],
+                        preprocess: bool, control: Optional[SolveControl],
+                        stats: SolveStats) -> BranchAndBoundResult:
+        """Preprocess and run the approximation scheme."""
+        from .fptas_engine import FPTASEngine
+        if epsilon is None:
+            epsilon = FPTASEngine.DEFAULT_EPSILON
+        stats.engine = "fptas"
+        if not preprocess:
+            return FPTASEngine.solve(capacity, weights, values, epsilon, control=control, stats=stats)
+
+        with stats.phase("preprocess"):
+            reduced = InstancePreprocessor.reduce_01(capacity, weights, values)
+        stats.items_removed += len(weights) - len(reduced.weights)
+        result = FPTASEngine.solve(reduced.capacity, reduced.weights, reduced.values, epsilon,
+                                   control=control, stats=stats)
+        result.max_value, result.selected_items = reduced.restore_01(result.max_value, result.selected_items)
+        result.upper_bound += reduced.fixed_value
+        return result
+
+    @staticmethod
+    def solve_bounded_knapsack(capacity: int, weights: List[int], values: List[int],
+                               counts: List[Optional[int]],
+                               memory_budget: Optional[int] = None) -> Tuple[int, List[int]]:
+        """
+        Solve the bounded Knapsack problem where item i has ``counts[i]`` copies.
+        
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+            counts: Available copies per item, None for unlimited
+            memory_budget: Peak memory budget in bytes (defaults to ``MEMORY_BUDGET``)
+            
+        Returns:
+            Tuple containing (maximum_value, copies_taken_per_item)
+        """
+        from .bounded_engine import BoundedEngine
+        return BoundedEngine.solve(capacity, weights, values, counts, memory_budget)
+
+    @staticmethod
+    def solve_unbounded_knapsack(capacity: int, weights: List[int], values: List[int],
+                                 memory_budget: Optional[int] = None) -> Tuple[int, List[int]]:
+        """
+        Solve the unbounded Knapsack problem where every item has unlimited copies.
+        
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+            memory_budget: Peak memory budget in bytes (defaults to ``MEMORY_BUDGET``)
+            
+        Returns:
+            Tuple containing (maximum_value, copies_taken_per_item)
+        """
+        from .bounded_engine import BoundedEngine
+        return BoundedEngine.solve_unbounded(capacity, weights, values, memory_budget)
+
+    @staticmethod
+    def solve_multidim_knapsack(capacities: List[int], weights: List[List[int]], values: List[int],
+                                time_limit: Optional[float] = None,
+                                control: Optional[SolveControl] = None) -> Tuple[int, List[int]]:
+        """
+        Solve the 0/1 Knapsack problem with one capacity per dimension.
+        
+        Args:
+            capacities: Capacity per dimension (e.g. weight, volume, slots)
+            weights: One weight vector per dimension
+            values: List of item values
+            time_limit: Optional limit in seconds for the branch-and-bound path
+            control: Optional progress and cancellation handle
+            
+        Returns:
+            Tuple containing (maximum_value, selected_item_indices)
+        """
+        from .multidim_engine import MultiDimEngine
+        return MultiDimEngine.solve(capacities, weights, values, time_limit=time_limit, control=control).as_tuple()
+
+    @staticmethod
+    def solve_01_instance(capacity: int, weights: List[int], values: List[int]) -> "SolvedInstance":
+        """
+        Solve a 0/1 item set once for every capacity up to ``capacity``.
+        
+        Args:
+            capacity: Largest capacity that will be queried
+            weights: List of item weights
+            values: List of item values
+            
+        Returns:
+            SolvedInstance answering best_value(c) and selection(c) for c <= capacity
+        """
+        from .solution_cache import SolvedInstance
+        return SolvedInstance(capacity, weights, values)
+
+    @staticmethod
+    def solve_batch(instances, kind: str = "01", workers: Optional[int] = None,
+                    chunk_size: Optional[int] = None, ordered: bool = True,
+                    time_limit: Optional[float] = None, **options):
+        """
+        Solve many independent instances on a process pool.
+
+        See :meth:`models.batch.BatchSolver.solve_batch` for details.
+        
+        Args:
+            instances: Iterable of (capacity, weights, values) tuples, or
+                exceptions standing for instances that failed to load
+            kind: "01" for 0/1 knapsack, "fractional" for fractional knapsack
+            workers: Number of worker processes (defaults to all cores)
+            chunk_size: Instances per task
+            ordered: Yield results in input order (True) or as they complete (False)
+            time_limit: Per-instance wall time in seconds for 0/1 solves
+            **options: Extra keyword arguments for the solver, e.g. ``engine``
+            
+        Returns:
+            Iterator of BatchResult objects
+        """
+        from .batch import BatchSolver
+        return BatchSolver.solve_batch(instances, kind, workers, chunk_size, ordered, time_limit, **options)
+
+    @staticmethod
+    def select_engine(capacity: int, weights: List[int], values: List[int],
+                      memory_budget: Optional[int] = None) -> str:
+        """
+        Pick the cheapest exact engine for an instance.
+
+        Instances with at least ``CORE_MIN_ITEMS`` items go to the core
+        engine, which runs the engine picked by :meth:`select_dp_engine`
+        (branch-and-bound when no DP table fits) on the items near the break
+        item only. Up to
+        ``MeetInMiddleEngine.MAX_ITEMS`` items, meet-in-the-middle is used
+        when its 2^(n/2) subsets (weighted by ``STATE_COST``) are cheaper than
+        the n * capacity DP cells.
+        Everything else goes straight to the DP engine.
+        
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+            memory_budget: Peak memory budget in bytes (defaults to ``MEMORY_BUDGET``)
+            
+        Returns:
+            Name of the selected engine
+        """
+        from .meet_in_middle_engine import MeetInMiddleEngine
+        n = len(weights)
+        if n >= KnapsackSolver.CORE_MIN_ITEMS and KnapsackSolver.fits_int64(weights, values):
+            return "core"
+        if (n <= MeetInMiddleEngine.MAX_ITEMS
+                and MeetInMiddleEngine.states(n) * MeetInMiddleEngine.STATE_COST < n * capacity):
+            return "meet_in_middle"
+        return KnapsackSolver.select_dp_engine(capacity, weights, values, memory_budget)
+
+    @staticmethod
+    def select_dp_engine(capacity: int, weights: List[int], values: List[int],
+                         memory_budget: Optional[int] = None) -> str:
+        """
+        Pick the cheapest dynamic programming engine for an instance.
+
+        Instances whose sums could overflow the int64 rows go to
+        branch-and-bound, which works in Python integers. Subset-sum shaped
+        instances (values proportional to weights) use the bitset engine,
+        which needs reachability only.
+
+        The weight-indexed DP costs n * capacity cell updates, the
+        value-indexed one n * sum(values). The cheaper formulation wins as long
+        as its decision table and working rows fit the memory budget;
+        otherwise the linear-memory engine is used. When even its O(capacity)
+        rows exceed the budget, the capacity-independent branch-and-bound
+        search takes over.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+            memory_budget: Peak memory budget in bytes (defaults to ``MEMORY_BUDGET``)
+
+        Returns:
+            "subset_sum", "value", "dense", "hirschberg" or "branch_and_bound"
+        """
+        budget = KnapsackSolver.MEMORY_BUDGET if memory_budget is None else memory_budget
+        if not KnapsackSolver.fits_int64(weights, values):
+            return "branch_and_bound"
+        if (SubsetSumEngine.is_subset_sum(weights, values)
+                and SubsetSumEngine.table_bytes(capacity, len(weights)) <= budget):
+            return "subset_sum"
+        from .dense_engine import DenseEngine
+        from .hirschberg_engine import HirschbergEngine
+        from .value_engine import ValueEngine
+        if sum(values) < capacity and ValueEngine.table_bytes(values) <= budget:
+            return "value"
+        if DenseEngine.table_bytes(capacity, len(weights)) <= budget:
+            return "dense"
+        if HirschbergEngine.table_bytes(capacity) <= budget:
+            return "hirschberg"
+        return "branch_and_bound"
+
+    @staticmethod
+    def fits_int64(weights: List[int], values: List[int]) -> bool:
+        """
+        Tell whether the int64 engines can hold every sum of an instance.
+
+        Value rows hold sums of values, and the value-indexed DP adds weights
+        to its ``ValueEngine.UNREACHABLE`` (2^62) sentinel.
+
+        Args:
+            weights: List of item weights
+            values: List of item values
+
+        Returns:
+            True if the total value is below 2^63 and the total weight below 2^62
+        """
+        return sum(values) < 2 ** 63 and sum(weights) < 2 ** 62
+
+    @staticmethod
+    def _solve_01_table(capacity: int, weights: List[int], values: List[int]) -> Tuple[int, List[int]]:
+        """
+        Reference 0/1 solver filling the full (n+1) x (capacity+1) table.
+        
         Args:
             capacity: Maximum weight capacity of the knapsack
             weights: List of item weights
@@ -53,7 +510,9 @@ class KnapsackSolver:
         return dp[n][capacity], selected_items
 
     @staticmethod
-    def solve_fractional_knapsack(capacity: int, weights: List[int], values: List[int]) -> Tuple[float, List[Tuple[int, float]]]:
+    def solve_fractional_knapsack(capacity: int, weights: List[int], values: List[int],
+                                  preprocess: bool = False, engine: str = "sort",
+                                  stats: Optional[SolveStats] = None) -> Tuple[float, List[Tuple[int, float]]]:
         """
         Solve the Fractional Knapsack problem using greedy approach.
         
@@ -61,29 +520,45 @@ class KnapsackSolver:
             capacity: Maximum weight capacity of the knapsack
             weights: List of item weights
             values: List of item values
+            preprocess: Reduce the instance (exact divisor scaling, trivial
+                fixing) before running the greedy pass; off by default since
+                the greedy work does not depend on the capacity
+            engine: "sort" lists items in ratio order, "select" finds the
+                break item by linear-time partitioning, "numpy" runs the
+                vectorized partitioning path
+            stats: Optional SolveStats filled in with phase timings and peak memory
             
         Returns:
             Tuple containing (maximum_value, selected_items_with_fractions)
         """
-        n = len(weights)
-        items = [(i, weights[i], values[i], values[i] / weights[i]) for i in range(n)]
-        items.sort(key=lambda x: x[3], reverse=True)  # Sort by value-to-weight ratio
+        stats = SolveStats.collect(stats)
+        if stats is None:
+            return KnapsackSolver._solve_fractional(capacity, weights, values, preprocess, engine,
+                                                    SolveStats(trace_memory=False))
+        with stats.track(len(weights), capacity):
+            return KnapsackSolver._solve_fractional(capacity, weights, values, preprocess, engine, stats)
 
-        max_value = 0.0
-        selected_items = []
-        remaining_capacity = capacity
-
-        for item_index, weight, value, ratio in items:
-            if remaining_capacity >= weight:
-                # Take the whole item
-                max_value += value
-                selected_items.append((item_index, 1.0))
-                remaining_capacity -= weight
-            elif remaining_capacity > 0:
-                # Take fraction of the item
-                fraction = remaining_capacity / weight
-                max_value += value * fraction
-                selected_items.append((item_index, fraction))
-                break
-
-        return max_value, selected_items
+    @staticmethod
+    def _solve_fractional(capacity: int, weights: List[int], values: List[int], preprocess: bool, engine: str,
+                          stats: SolveStats) -> Tuple[float, List[Tuple[int, float]]]:
+        """Preprocess and dispatch a fractional instance to its greedy variant."""
+        if preprocess:
+            with stats.phase("preprocess"):
+                reduced = InstancePreprocessor.reduce_fractional(capacity, weights, values)
+            stats.items_removed += len(weights) - len(reduced.weights)
+            max_value, selected_items = KnapsackSolver._solve_fractional(
+                reduced.capacity, reduced.weights, reduced.values, False, engine, stats
+            )
+            return reduced.restore_fractional(max_value, selected_items)
+
+        stats.engine = engine
+        with stats.phase("fill"):
+            if engine == "sort":
+                order = GreedySolver.ratio_order(weights, values)
+                return GreedySolver.fractional_fill(capacity, order, weights, values)
+            if engine == "select":
+                return GreedySolver.fractional_select(capacity, weights, values)
+            if engine == "numpy":
+                max_value, indices, fractions = GreedySolver.fractional_arrays(capacity, weights, values)
+                return max_value, list(zip(indices.tolist(), fractions.tolist()))
+        raise ValueError(f"Unknown fractional engine '{engine}', expected one of {KnapsackSolver.FRACTIONAL_ENGINES}")
@@ -0,0 +1,117 @@
+"""
+Meet-in-the-Middle Engine
+Capacity-independent 0/1 knapsack for instances with few items.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .control import SolveControl
+from .stats import SolveStats
+
+
+class MeetInMiddleEngine:
+    """
+    0/1 knapsack engine enumerating the subsets of each half of the items.
+
+    Both halves are enumerated with their (weight, value, mask) triples and
+    pruned to Pareto lists (values strictly increasing with weight). As the
+    first list gets heavier its best partner in the second list can only get
+    lighter, so one vectorized sorted search pairs every state with the
+    heaviest partner that still fits. Time and memory grow with 2^(n/2)
+    and not with the capacity, which suits a few dozen items with
+    capacities around 10^12.
+    """
+
+    # Most items accepted; 2^20 subsets per half.
+    MAX_ITEMS = 40
+
+    # Rough cost of one enumerated subset in DP cell updates (sorting,
+    # concatenation and the partner search), used when picking an engine.
+    STATE_COST = 32
+
+    @staticmethod
+    def states(n: int) -> int:
+        """Number of subsets enumerated for the larger half of n items."""
+        return 1 << ((n + 1) // 2)
+
+    @staticmethod
+    def solve(capacity: int, weights: List[int], values: List[int],
+              control: Optional[SolveControl] = None, stats: Optional[SolveStats] = None) -> Tuple[int, List[int]]:
+        """
+        Solve the 0/1 Knapsack problem by meet-in-the-middle.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+            control: Optional progress and cancellation handle
+            stats: Optional record receiving phase timings and the number of
+                enumerated subsets (as ``cells``)
+
+        Returns:
+            Tuple containing (maximum_value, selected_item_indices)
+
+        Raises:
+            ValueError: If there are more than ``MAX_ITEMS`` items
+        """
+        n = len(weights)
+        if n > MeetInMiddleEngine.MAX_ITEMS:
+            raise ValueError(f"Meet-in-the-middle supports at most {MeetInMiddleEngine.MAX_ITEMS} items, got {n}")
+        stats = stats or SolveStats(trace_memory=False)
+        capacity = min(capacity, sum(weights))
+        # Subset sums must not overflow int64; fall back to Python integers.
+        dtype = np.int64 if max(sum(weights), sum(values)) < 2 ** 62 else object
+        half = n // 2
+
+        with stats.phase("enumerate"):
+            first = MeetInMiddleEngine._enumerate(capacity, weights[:half], values[:half], dtype, control, 0, n)
+            second = MeetInMiddleEngine._enumerate(capacity, weights[half:], values[half:], dtype, control, half, n)
+        stats.cells += len(first[0]) + len(second[0])
+
+        with stats.phase("combine"):
+            first_weights, first_values, first_masks = MeetInMiddleEngine._pareto(*first)
+            second_weights, second_values, second_masks = MeetInMiddleEngine._pareto(*second)
+            # Best second-half partner: the heaviest Pareto state that fits.
+            partner = np.searchsorted(second_weights, capacity - first_weights, side="right") - 1
+            totals = first_values + second_values[partner]
+            best = int(np.argmax(totals))
+            max_value = int(totals[best])
+            first_mask = int(first_masks[best])
+            second_mask = int(second_masks[partner[best]])
+
+        selected_items = [i for i in range(half) if first_mask >> i & 1]
+        selected_items += [half + i for i in range(n - half) if second_mask >> i & 1]
+        return max_value, selected_items
+
+    @staticmethod
+    def _enumerate(capacity: int, weights: List[int], values: List[int], dtype, control: Optional[SolveControl],
+                   offset: int, n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Enumerate the subsets of one half that fit, as (weights, values, masks)."""
+        subset_weights = np.zeros(1, dtype=dtype)
+        subset_values = np.zeros(1, dtype=dtype)
+        masks = np.zeros(1, dtype=np.int64)
+        for i in range(len(weights)):
+            if control is not None:
+                control.update(offset + i, n)
+            fits = subset_weights + weights[i] <= capacity
+            subset_weights = np.concatenate([subset_weights, subset_weights[fits] + weights[i]])
+            subset_values = np.concatenate([subset_values, subset_values[fits] + values[i]])
+            masks = np.concatenate([masks, masks[fits] | (1 << i)])
+        return subset_weights, subset_values, masks
+
+    @staticmethod
+    def _pareto(weights: np.ndarray, values: np.ndarray,
+                masks: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Keep the states whose value beats every lighter state, sorted by weight."""
+        order = np.lexsort((-values, weights)) if weights.dtype != object else \
+            np.array(sorted(range(len(weights)), key=lambda i: (weights[i], -values[i])), dtype=np.int64)
+        weights, values, masks = weights[order], values[order], masks[order]
+        best_before = np.maximum.accumulate(values)
+        keep = np.ones(len(values), dtype=bool)
+        keep[1:] = values[1:] > best_before[:-1]
+        return weights[keep], values[keep], masks[keep]
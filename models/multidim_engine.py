@@ -0,0 +1,221 @@
+"""
+Multi-Dimensional Knapsack Engine
+0/1 knapsack with several capacity constraints (weight, volume, ...).
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import time
+from functools import reduce
+from operator import mul
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .control import SolveControl
+from .branch_and_bound import BranchAndBoundResult, FractionalBound
+from .greedy import GreedySolver
+
+
+class MultiDimEngine:
+    """
+    d-dimensional 0/1 knapsack engine.
+
+    ``weights[k][i]`` is the size of item i in dimension k and must fit
+    within ``capacities[k]``. Instances whose DP fits ``MEMORY_BUDGET`` are
+    solved exactly by a vectorized DP over a d-dimensional array; larger ones by
+    branch-and-bound using the surrogate relaxation, which aggregates all
+    constraints into one knapsack whose fractional bound is valid for the
+    original problem.
+    """
+
+    # Largest estimated peak memory (in bytes) of the exact DP, packed
+    # per-item decisions and working arrays included; matches
+    # KnapsackSolver.MEMORY_BUDGET.
+    MEMORY_BUDGET = 256 * 1024 * 1024
+
+    # Working bytes per DP cell: the int64 table, the int64 candidate copy,
+    # NumPy's temporary for the overlapping in-place maximum and the take flags.
+    CELL_BYTES = 25
+    CLOCK_INTERVAL = 1024
+
+    @staticmethod
+    def solve(capacities: List[int], weights: List[List[int]], values: List[int],
+              node_limit: Optional[int] = None, time_limit: Optional[float] = None,
+              control: Optional[SolveControl] = None) -> BranchAndBoundResult:
+        """
+        Solve the multi-dimensional 0/1 Knapsack problem.
+
+        Args:
+            capacities: Capacity per dimension
+            weights: One weight vector per dimension
+            values: List of item values
+            node_limit: Node limit for the branch-and-bound fallback
+            time_limit: Time limit in seconds for the branch-and-bound fallback
+            control: Optional progress and cancellation handle
+
+        Returns:
+            BranchAndBoundResult (always optimal when the DP path is taken)
+        """
+        if len(capacities) != len(weights):
+            raise ValueError(
+                f"Number of capacities ({len(capacities)}) must equal number of weight vectors ({len(weights)})"
+            )
+        for vector in weights:
+            if len(vector) != len(values):
+                raise ValueError(f"Number of weights ({len(vector)}) must equal number of values ({len(values)})")
+
+        if any(all(vector[i] == 0 for vector in weights) for i in range(len(values))):
+            raise ValueError("Every item must have a positive weight in at least one dimension")
+
+        if MultiDimEngine.dp_bytes(capacities, len(values)) <= MultiDimEngine.MEMORY_BUDGET:
+            max_value, selected_items = MultiDimEngine.solve_dp(capacities, weights, values, control)
+            return BranchAndBoundResult(max_value, selected_items, max_value, 0, True)
+        return MultiDimEngine.solve_branch_and_bound(capacities, weights, values, node_limit, time_limit, control)
+
+    @staticmethod
+    def dp_bytes(capacities: Sequence[int], n: int) -> int:
+        """Estimate the peak memory of :meth:`solve_dp` in bytes."""
+        cells = reduce(mul, (c + 1 for c in capacities), 1)
+        return n * ((cells + 7) // 8) + MultiDimEngine.CELL_BYTES * cells
+
+    @staticmethod
+    def solve_dp(capacities: List[int], weights: List[List[int]], values: List[int],
+                 control: Optional[SolveControl] = None) -> Tuple[int, List[int]]:
+        """
+        Exact DP over a d-dimensional value array.
+
+        Args:
+            capacities: Capacity per dimension
+            weights: One weight vector per dimension
+            values: List of item values
+            control: Optional progress and cancellation handle
+
+        Returns:
+            Tuple containing (maximum_value, selected_item_indices)
+        """
+        n = len(values)
+        shape = tuple(c + 1 for c in capacities)
+        table = np.zeros(shape, dtype=np.int64)
+        take = np.zeros(shape, dtype=bool)
+        decisions = []
+
+        for i in range(n):
+            if control is not None:
+                control.update(i, n)
+            item = [vector[i] for vector in weights]
+            take[...] = False
+            if all(w <= c for w, c in zip(item, capacities)):
+                target = tuple(slice(w, None) for w in item)
+                source = tuple(slice(0, c + 1 - w) for w, c in zip(item, capacities))
+                candidate = table[source] + values[i]
+                np.greater(candidate, table[target], out=take[target])
+                np.maximum(table[target], candidate, out=table[target])
+            decisions.append(np.packbits(take))
+
+        selected_items = []
+        remaining = list(capacities)
+        for i in range(n - 1, -1, -1):
+            cell = int(np.ravel_multi_index(tuple(remaining), shape))
+            if (decisions[i][cell >> 3] >> (7 - (cell & 7))) & 1:
+                selected_items.append(i)
+                for k, vector in enumerate(weights):
+                    remaining[k] -= vector[i]
+
+        selected_items.reverse()
+        return int(table[tuple(capacities)]), selected_items
+
+    @staticmethod
+    def surrogate_weights(capacities: Sequence[int], weights: Sequence[Sequence[int]]) -> Tuple[List[int], List[int]]:
+        """
+        Aggregate all dimensions into one integer knapsack constraint.
+
+        Each dimension is scaled by ``P // capacities[k]`` with P the product
+        of capacities, i.e. normalized to the same range, which keeps the
+        surrogate exact in integer arithmetic.
+
+        Returns:
+            Tuple of (surrogate_weights, multipliers)
+        """
+        total = reduce(mul, capacities, 1)
+        multipliers = [total // c for c in capacities]
+        surrogate = [sum(m * vector[i] for m, vector in zip(multipliers, weights)) for i in range(len(weights[0]))]
+        return surrogate, multipliers
+
+    @staticmethod
+    def solve_branch_and_bound(capacities: List[int], weights: List[List[int]], values: List[int],
+                               node_limit: Optional[int] = None,
+                               time_limit: Optional[float] = None,
+                               control: Optional[SolveControl] = None) -> BranchAndBoundResult:
+        """
+        Depth-first branch-and-bound bounded by the surrogate relaxation.
+
+        Args:
+            capacities: Capacity per dimension
+            weights: One weight vector per dimension
+            values: List of item values
+            node_limit: Maximum number of nodes to expand
+            time_limit: Maximum wall time in seconds
+            control: Optional progress and cancellation handle
+
+        Returns:
+            BranchAndBoundResult with the incumbent and the remaining gap
+        """
+        deadline = None if time_limit is None else time.perf_counter() + time_limit
+        n = len(values)
+        surrogate, multipliers = MultiDimEngine.surrogate_weights(capacities, weights)
+
+        order = GreedySolver.ratio_order(surrogate, values)
+        bound = FractionalBound(order, surrogate, values)
+        item_weights = [tuple(vector[i] for vector in weights) for i in order]
+        ordered_values = bound.values
+
+        best_value = 0
+        best_path = None
+        stack = [(0, tuple(capacities), 0, None)]
+        nodes = 0
+        stopped = False
+
+        while stack:
+            if node_limit is not None and nodes >= node_limit:
+                stopped = True
+                break
+            if nodes % MultiDimEngine.CLOCK_INTERVAL == 0:
+                if control is not None:
+                    control.update(nodes, node_limit, "nodes")
+                if deadline is not None and time.perf_counter() > deadline:
+                    stopped = True
+                    break
+
+            k, remaining, value, path = stack.pop()
+            nodes += 1
+
+            if value > best_value:
+                best_value = value
+                best_path = path
+            if k == n:
+                continue
+            slack = sum(m * r for m, r in zip(multipliers, remaining))
+            if bound(k, slack, value) <= best_value:
+                continue
+
+            stack.append((k + 1, remaining, value, path))
+            item = item_weights[k]
+            if all(w <= r for w, r in zip(item, remaining)):
+                left = tuple(r - w for r, w in zip(remaining, item))
+                stack.append((k + 1, left, value + ordered_values[k], (k, path)))
+
+        selected_items = []
+        while best_path is not None:
+            position, best_path = best_path
+            selected_items.append(order[position])
+        selected_items.sort()
+
+        upper_bound = best_value
+        if stopped:
+            for k, remaining, value, _ in stack:
+                slack = sum(m * r for m, r in zip(multipliers, remaining))
+                upper_bound = max(upper_bound, bound(k, slack, value))
+
+        return BranchAndBoundResult(best_value, selected_items, upper_bound, nodes, not stopped)
@@ -0,0 +1,144 @@
+"""
+Sparse Pareto-Frontier Engine
+Nemhauser-Ullmann list algorithm for the 0/1 knapsack problem.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import logging
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .control import SolveControl
+from .stats import SolveStats
+
+logger = logging.getLogger(__name__)
+
+
+class ParetoEngine:
+    """
+    0/1 knapsack engine that keeps only non-dominated (weight, value) states.
+
+    After each item the frontier is merged with its shifted copy and pruned
+    so that values strictly increase with weight. Memory and time scale
+    with the frontier size instead of the capacity, which pays off on
+    instances with few distinct reachable weights.
+    """
+
+    # Frontier size above which the engine gives up and hands the instance
+    # to the engine KnapsackSolver.select_dp_engine picks for the budget.
+    MAX_STATES = 1 << 22
+
+    # Temporary bytes per merged state while the next frontier is built
+    # (weights, values, parent links, sort keys and order, pruning mask,
+    # the fitting-state indices).
+    WORK_BYTES = 64
+
+    @staticmethod
+    def solve(capacity: int, weights: List[int], values: List[int],
+              max_states: Optional[int] = None, memory_budget: Optional[int] = None,
+              control: Optional[SolveControl] = None,
+              stats: Optional[SolveStats] = None) -> Tuple[int, List[int]]:
+        """
+        Solve the 0/1 Knapsack problem over the Pareto frontier.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+            max_states: Frontier size cap (defaults to ``MAX_STATES``);
+                exceeding it falls back to the engine picked by
+                ``KnapsackSolver.select_dp_engine``
+            memory_budget: Peak memory budget in bytes for the parent links
+                kept for every item plus the working arrays (defaults to
+                ``KnapsackSolver.MEMORY_BUDGET``); exceeding it falls back
+                the same way
+            control: Optional progress and cancellation handle
+            stats: Optional record receiving phase timings and the number
+                of frontier states evaluated (as ``cells``)
+
+        Returns:
+            Tuple containing (maximum_value, selected_item_indices)
+        """
+        stats = stats or SolveStats(trace_memory=False)
+        with stats.phase("fill"):
+            frontier = ParetoEngine._frontier(capacity, weights, values, max_states, memory_budget, control, stats)
+        if frontier is None:
+            from .knapsack_solver import KnapsackSolver
+            engine = KnapsackSolver.select_dp_engine(capacity, weights, values, memory_budget)
+            return KnapsackSolver.solve_01_knapsack(capacity, weights, values, engine=engine,
+                                                    memory_budget=memory_budget, preprocess=False,
+                                                    control=control, stats=stats)
+        frontier_values, parents = frontier
+
+        with stats.phase("backtrack"):
+            # Values increase along the frontier, so the last state is optimal.
+            state = len(frontier_values) - 1
+            max_value = int(frontier_values[state])
+
+            selected_items = []
+            for i in range(len(weights) - 1, -1, -1):
+                origin, taken = parents[i]
+                if taken[state]:
+                    selected_items.append(i)
+                state = int(origin[state])
+
+            selected_items.reverse()
+        return max_value, selected_items
+
+    @staticmethod
+    def _frontier(capacity: int, weights: List[int], values: List[int], max_states: Optional[int],
+                  memory_budget: Optional[int], control: Optional[SolveControl],
+                  stats: SolveStats) -> Optional[tuple]:
+        """
+        Build the final frontier values and per-item parent links.
+
+        Returns None once the frontier exceeds the state cap, or once the
+        parent links stored so far plus the next merge would exceed the
+        memory budget.
+        """
+        from .knapsack_solver import KnapsackSolver
+        limit = ParetoEngine.MAX_STATES if max_states is None else max_states
+        budget = KnapsackSolver.MEMORY_BUDGET if memory_budget is None else memory_budget
+        frontier_weights = np.zeros(1, dtype=np.int64)
+        frontier_values = np.zeros(1, dtype=np.int64)
+        parents = []  # per item: (index into previous frontier, taken flag)
+        stored_bytes = 0
+
+        for i in range(len(weights)):
+            if control is not None:
+                control.update(i, len(weights))
+            fits = np.flatnonzero(frontier_weights <= capacity - weights[i])
+            size = len(frontier_weights)
+            if stored_bytes + (size + len(fits)) * ParetoEngine.WORK_BYTES > budget:
+                logger.info("Pareto parent links exceeded the %d byte budget, falling back to the "
+                            "budget-aware engine", budget)
+                return None
+
+            stats.cells += size + len(fits)
+            merged_weights = np.concatenate((frontier_weights, frontier_weights[fits] + weights[i]))
+            merged_values = np.concatenate((frontier_values, frontier_values[fits] + values[i]))
+            origin = np.concatenate((np.arange(size), fits))
+            taken = np.concatenate((np.zeros(size, dtype=bool), np.ones(len(fits), dtype=bool)))
+
+            # Sort by weight (value descending on ties) and keep a state only
+            # if it beats every lighter-or-equal state seen before it.
+            order = np.lexsort((-merged_values, merged_weights))
+            merged_values = merged_values[order]
+            keep = np.empty(len(order), dtype=bool)
+            keep[0] = True
+            keep[1:] = merged_values[1:] > np.maximum.accumulate(merged_values)[:-1]
+            order = order[keep]
+
+            frontier_weights = merged_weights[order]
+            frontier_values = merged_values[keep]
+            parents.append((origin[order], taken[order]))
+            stored_bytes += parents[-1][0].nbytes + parents[-1][1].nbytes
+
+            if len(frontier_weights) > limit:
+                logger.info("Pareto frontier exceeded %d states, falling back to the budget-aware engine", limit)
+                return None
+
+        return frontier_values, parents
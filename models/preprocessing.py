@@ -0,0 +1,169 @@
+"""
+Instance Preprocessing
+Reduces knapsack instances before the solvers run.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+from math import gcd
+from typing import List, Tuple
+
+
+class ReducedInstance:
+    """
+    A knapsack instance after preprocessing, with the bookkeeping needed to
+    map a solution back to the caller's original items.
+    """
+
+    def __init__(self, capacity: int, weights: List[int], values: List[int],
+                 index_map: List[int], fixed_items: List[int], fixed_value: int, scale: int):
+        self.capacity = capacity
+        self.weights = weights
+        self.values = values
+        self.index_map = index_map  # reduced index -> original index
+        self.fixed_items = fixed_items  # original indices always taken
+        self.fixed_value = fixed_value
+        self.scale = scale  # common divisor applied to capacity and weights
+
+    def restore_01(self, max_value: int, selected_items: List[int]) -> Tuple[int, List[int]]:
+        """
+        Map a 0/1 solution of the reduced instance back to the original one.
+
+        Args:
+            max_value: Maximum value found on the reduced instance
+            selected_items: Selected indices of the reduced instance
+
+        Returns:
+            Tuple containing (maximum_value, selected_item_indices)
+        """
+        original = [self.index_map[i] for i in selected_items] + self.fixed_items
+        original.sort()
+        return max_value + self.fixed_value, original
+
+    def restore_fractional(self, max_value: float,
+                           selected_items: List[Tuple[int, float]]) -> Tuple[float, List[Tuple[int, float]]]:
+        """
+        Map a fractional solution of the reduced instance back to the original one.
+
+        Args:
+            max_value: Maximum value found on the reduced instance
+            selected_items: (reduced_index, fraction) pairs
+
+        Returns:
+            Tuple containing (maximum_value, selected_items_with_fractions)
+        """
+        original = [(i, 1.0) for i in self.fixed_items]
+        original.extend((self.index_map[i], fraction) for i, fraction in selected_items)
+        return max_value + self.fixed_value, original
+
+
+class InstancePreprocessor:
+    """
+    Preprocessing stage applied before the knapsack solvers.
+
+    The reductions never change the optimal value. They shrink ``capacity``
+    by the common divisor of the weights, drop items that can never be
+    taken, remove dominated items and fix items that trivially fit.
+    """
+
+    @staticmethod
+    def reduce_01(capacity: int, weights: List[int], values: List[int]) -> ReducedInstance:
+        """
+        Reduce a 0/1 knapsack instance.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+
+        Returns:
+            The reduced instance
+        """
+        candidates = [i for i in range(len(weights)) if weights[i] <= capacity]
+        candidates = InstancePreprocessor._drop_dominated(capacity, weights, values, candidates)
+
+        if sum(weights[i] for i in candidates) <= capacity:
+            return InstancePreprocessor._fix_all(candidates, values)
+
+        scale = 0
+        for i in candidates:
+            scale = gcd(scale, weights[i])
+
+        return ReducedInstance(
+            capacity // scale,
+            [weights[i] // scale for i in candidates],
+            [values[i] for i in candidates],
+            candidates, [], 0, scale
+        )
+
+    @staticmethod
+    def reduce_fractional(capacity: int, weights: List[int], values: List[int]) -> ReducedInstance:
+        """
+        Reduce a fractional knapsack instance.
+
+        Heavy and dominated items can still be taken partially here, so only
+        the trivial fixing and an exact common-divisor scaling apply.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+
+        Returns:
+            The reduced instance
+        """
+        candidates = list(range(len(weights)))
+        if sum(weights) <= capacity:
+            return InstancePreprocessor._fix_all(candidates, values)
+
+        scale = capacity
+        for weight in weights:
+            scale = gcd(scale, weight)
+
+        return ReducedInstance(
+            capacity // scale,
+            [weight // scale for weight in weights],
+            list(values),
+            candidates, [], 0, scale
+        )
+
+    @staticmethod
+    def _fix_all(candidates: List[int], values: List[int]) -> ReducedInstance:
+        """Build a reduced instance where every candidate is fixed in."""
+        return ReducedInstance(0, [], [], [], list(candidates), sum(values[i] for i in candidates), 1)
+
+    @staticmethod
+    def _drop_dominated(capacity: int, weights: List[int], values: List[int],
+                        candidates: List[int]) -> List[int]:
+        """
+        Remove items that an optimal solution never needs.
+
+        Items are ordered by (weight ascending, value descending, index), so
+        every item dominating item j (no heavier, no less valuable) comes
+        before it. If the dominators of j cannot all fit alongside j, any
+        solution containing j misses one of them and swapping j for it loses
+        nothing, so j can be dropped. A Fenwick tree over value ranks keeps
+        the running dominator weight sums at O(n log n).
+        """
+        order = sorted(candidates, key=lambda i: (weights[i], -values[i], i))
+        ranks = {value: rank for rank, value in enumerate(sorted(set(values[i] for i in candidates), reverse=True), 1)}
+        tree = [0] * (len(ranks) + 1)
+
+        kept = []
+        for i in order:
+            rank = ranks[values[i]]
+            dominator_weight = 0
+            r = rank
+            while r > 0:
+                dominator_weight += tree[r]
+                r -= r & -r
+            if dominator_weight + weights[i] <= capacity:
+                kept.append(i)
+            r = rank
+            while r < len(tree):
+                tree[r] += weights[i]
+                r += r & -r
+
+        kept.sort()
+        return kept
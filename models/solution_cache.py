@@ -0,0 +1,237 @@
+"""
+Solved Instances and Result Caching
+Answers 0/1 knapsack queries for every capacity from a single DP run.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from math import gcd
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .control import SolveControl
+from .dense_engine import DenseEngine
+from .stats import SolveStats
+
+
+class SolvedInstance:
+    """
+    A 0/1 knapsack item set solved once up to ``capacity``.
+
+    The final DP row holds the optimum for every smaller capacity and the
+    packed decision table can be backtracked from any of them, so queries
+    for c <= capacity never re-run the DP. Weights are divided by their
+    common divisor first; unlike the other reductions it does not depend
+    on the capacity, so the table stays valid for every query.
+    """
+
+    def __init__(self, capacity: int, weights: List[int], values: List[int],
+                 control: Optional[SolveControl] = None):
+        self.capacity = capacity
+        self.weights = list(weights)
+        self.values = list(values)
+        self.scale = SolvedInstance.weight_scale(self.weights)
+        self.scaled_weights = [weight // self.scale for weight in self.weights]
+        self.row, self.decisions = DenseEngine.fill(capacity // self.scale, self.scaled_weights, self.values,
+                                                    control)
+
+    @staticmethod
+    def weight_scale(weights: List[int]) -> int:
+        """Greatest common divisor of the weights (1 when there is none)."""
+        scale = 0
+        for weight in weights:
+            scale = gcd(scale, weight)
+        return scale or 1
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the DP row and the decision table."""
+        return self.row.nbytes + self.decisions.nbytes
+
+    def _check(self, capacity: int) -> None:
+        if not 0 <= capacity <= self.capacity:
+            raise ValueError(f"Capacity must be between 0 and {self.capacity}")
+
+    def best_value(self, capacity: int) -> int:
+        """
+        Maximum value reachable within ``capacity``.
+
+        Args:
+            capacity: Knapsack capacity, at most the solved capacity
+
+        Returns:
+            The optimal 0/1 knapsack value
+        """
+        self._check(capacity)
+        return int(self.row[capacity // self.scale])
+
+    def selection(self, capacity: int) -> List[int]:
+        """
+        Optimal item selection within ``capacity``.
+
+        Args:
+            capacity: Knapsack capacity, at most the solved capacity
+
+        Returns:
+            Selected item indices in ascending order
+        """
+        self._check(capacity)
+        return DenseEngine.backtrack(capacity // self.scale, self.scaled_weights, self.decisions)
+
+    def solution(self, capacity: int) -> Tuple[int, List[int]]:
+        """Return (maximum_value, selected_item_indices) for ``capacity``."""
+        return self.best_value(capacity), self.selection(capacity)
+
+
+class SolutionCache:
+    """
+    LRU cache of solved instances keyed on a fingerprint of (weights, values).
+
+    A cached instance answers any capacity up to the one it was solved for;
+    a larger request re-solves and replaces it. Least recently used entries
+    are evicted once the total table size exceeds ``max_bytes``. Instances
+    the solver would not send to the dense engine (preprocessing and engine
+    selection find a cheaper route) or whose table alone would exceed the
+    budget are solved by ``KnapsackSolver.solve_01_knapsack`` without caching.
+    """
+
+    def __init__(self, max_bytes: int = 512 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(weights: List[int], values: List[int]) -> str:
+        """Hash an item set into a cache key."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(len(weights).to_bytes(8, "little"))
+        digest.update(np.asarray(weights, dtype=np.int64).tobytes())
+        digest.update(np.asarray(values, dtype=np.int64).tobytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def uses_dense(capacity: int, weights: List[int], values: List[int], options: dict) -> bool:
+        """
+        Tell whether ``solve_01_knapsack`` would run the dense engine.
+
+        Only then does the cached all-capacities table cost about the same
+        as a direct solve. The engine is picked for the instance after the
+        weight divisor scaling that :class:`SolvedInstance` applies.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+            options: Keyword arguments meant for ``solve_01_knapsack``
+
+        Returns:
+            True if the dense engine would be picked
+        """
+        from .knapsack_solver import KnapsackSolver
+        engine = options.get("engine", "auto")
+        if engine != "auto":
+            return engine == "dense"
+        scale = SolvedInstance.weight_scale(weights)
+        scaled_weights = [weight // scale for weight in weights]
+        return KnapsackSolver.select_engine(capacity // scale, scaled_weights, values,
+                                            options.get("memory_budget")) == "dense"
+
+    def get_instance(self, capacity: int, weights: List[int], values: List[int],
+                     control: Optional[SolveControl] = None, stats: Optional[SolveStats] = None,
+                     fill: bool = True) -> Optional[SolvedInstance]:
+        """
+        Return a solved instance able to answer ``capacity``, solving on a miss.
+
+        Args:
+            capacity: Knapsack capacity that must be answerable
+            weights: List of item weights
+            values: List of item values
+            control: Optional progress and cancellation handle
+            stats: Optional record; set to engine "cache" on a hit and
+                receives the fill timing on a miss
+            fill: Solve and cache the instance on a miss; when False only
+                an existing entry is returned
+
+        Returns:
+            The solved instance, or None on a miss that was not filled or
+            whose table exceeds ``max_bytes``
+        """
+        stats = stats or SolveStats(trace_memory=False)
+        key = SolutionCache.fingerprint(weights, values)
+        with self._lock:
+            instance = self._entries.get(key)
+            if instance is not None and instance.capacity >= capacity:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                stats.engine = "cache"
+                return instance
+            self.misses += 1
+
+        scale = SolvedInstance.weight_scale(weights)
+        if not fill or DenseEngine.table_bytes(capacity // scale, len(weights)) > self.max_bytes:
+            return None
+        stats.engine = "dense"
+        with stats.phase("fill"):
+            instance = SolvedInstance(capacity, weights, values, control)
+        stats.cells += DenseEngine.cells(capacity // scale, instance.scaled_weights)
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= previous.nbytes
+            self._entries[key] = instance
+            self.total_bytes += instance.nbytes
+            while self.total_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.total_bytes -= evicted.nbytes
+        return instance
+
+    def solve_01(self, capacity: int, weights: List[int], values: List[int],
+                 control: Optional[SolveControl] = None, stats: Optional[SolveStats] = None,
+                 **options) -> Tuple[int, List[int]]:
+        """
+        Solve a 0/1 knapsack instance, reusing a cached DP when possible.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+            control: Optional progress and cancellation handle
+            stats: Optional SolveStats filled in as by ``solve_01_knapsack``
+            **options: Passed to ``KnapsackSolver.solve_01_knapsack`` when the
+                instance is not cached
+
+        Returns:
+            Tuple containing (maximum_value, selected_item_indices)
+        """
+        stats = SolveStats.collect(stats)
+        if stats is None:
+            return self._solve_01(capacity, weights, values, control, SolveStats(trace_memory=False), options)
+        with stats.track(len(weights), capacity):
+            return self._solve_01(capacity, weights, values, control, stats, options)
+
+    def _solve_01(self, capacity: int, weights: List[int], values: List[int], control: Optional[SolveControl],
+                  stats: SolveStats, options: dict) -> Tuple[int, List[int]]:
+        """Answer from the cache or fall back to the solver."""
+        from .knapsack_solver import KnapsackSolver
+        fill = SolutionCache.uses_dense(capacity, weights, values, options)
+        instance = self.get_instance(capacity, weights, values, control, stats, fill)
+        if instance is None:
+            return KnapsackSolver.solve_01_knapsack(capacity, weights, values, control=control, stats=stats,
+                                                    **options)
+        with stats.phase("backtrack"):
+            return instance.solution(capacity)
+
+    def clear(self) -> None:
+        """Drop every cached instance."""
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
@@ -0,0 +1,163 @@
+"""
+Solve Statistics
+Timings, memory and work counters collected while solving.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import logging
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SolveStats:
+    """
+    Instrumentation record filled in by a solve.
+
+    Pass an instance as ``stats=`` to a solver and read it afterwards:
+    ``engine`` is the engine that ran, ``wall_time``/``cpu_time`` map each
+    phase ("preprocess", "fill", "backtrack", "search") to seconds,
+    ``cells`` counts evaluated DP cells (or frontier states) and ``nodes``
+    the branch-and-bound nodes expanded. With ``trace_memory=True``,
+    ``peak_bytes`` is the peak memory allocated during the solve as seen by
+    ``tracemalloc``; tracing covers the whole process and slows pure-Python
+    engines down many times over, so it is off by default.
+
+    Functions registered with :meth:`add_hook` receive every completed
+    stats object, e.g. to forward it to a metrics system. While any hook is
+    registered the solvers collect stats (without memory tracing) even when
+    the caller passed none.
+    """
+
+    hooks: List[Callable[["SolveStats"], None]] = []
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.engine: Optional[str] = None
+        self.n_items = 0
+        self.capacity = 0
+        self.items_removed = 0
+        self.cells = 0
+        self.nodes = 0
+        self.peak_bytes: Optional[int] = None
+        self.total_wall_time = 0.0
+        self.total_cpu_time = 0.0
+        self.wall_time: Dict[str, float] = {}
+        self.cpu_time: Dict[str, float] = {}
+        self._tracking = False
+
+    @property
+    def pruning_ratio(self) -> float:
+        """Fraction of the items removed by preprocessing before the engine ran."""
+        return self.items_removed / self.n_items if self.n_items else 0.0
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Add the wall and CPU time spent in the block to phase ``name``."""
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            self.wall_time[name] = self.wall_time.get(name, 0.0) + time.perf_counter() - wall
+            self.cpu_time[name] = self.cpu_time.get(name, 0.0) + time.process_time() - cpu
+
+    @contextmanager
+    def track(self, n_items: int, capacity: Any) -> Iterator[None]:
+        """
+        Measure a whole solve and publish the stats when it succeeds.
+
+        Nested calls (a solver delegating to another solver with the same
+        stats object) are no-ops, so each solve is measured and published
+        exactly once.
+        """
+        if self._tracking:
+            yield
+            return
+
+        self._tracking = True
+        self.n_items = n_items
+        self.capacity = capacity
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        elif self.trace_memory and hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0] if self.trace_memory else 0
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+            self.total_wall_time = time.perf_counter() - wall
+            self.total_cpu_time = time.process_time() - cpu
+            if self.trace_memory:
+                self.peak_bytes = max(0, tracemalloc.get_traced_memory()[1] - baseline)
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+            self._tracking = False
+        self.publish()
+
+    def publish(self) -> None:
+        """Pass the stats to every registered hook, logging hook failures."""
+        for hook in list(SolveStats.hooks):
+            try:
+                hook(self)
+            except Exception:
+                logger.exception("Solve stats hook %r failed", hook)
+
+    @staticmethod
+    def add_hook(hook: Callable[["SolveStats"], None]) -> None:
+        """Register a function called with the stats of every completed solve."""
+        SolveStats.hooks.append(hook)
+
+    @staticmethod
+    def remove_hook(hook: Callable[["SolveStats"], None]) -> None:
+        """Unregister a hook added with :meth:`add_hook`."""
+        SolveStats.hooks.remove(hook)
+
+    @staticmethod
+    def collect(stats: Optional["SolveStats"]) -> Optional["SolveStats"]:
+        """Return ``stats``, or a fresh object if hooks need one and none was given."""
+        if stats is None and SolveStats.hooks:
+            return SolveStats(trace_memory=False)
+        return stats
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Flatten the stats into a JSON-friendly dictionary."""
+        return {
+            "engine": self.engine,
+            "n_items": self.n_items,
+            "capacity": self.capacity,
+            "wall_time": self.total_wall_time,
+            "cpu_time": self.total_cpu_time,
+            "phase_wall_time": dict(self.wall_time),
+            "phase_cpu_time": dict(self.cpu_time),
+            "peak_bytes": self.peak_bytes,
+            "cells": self.cells,
+            "nodes": self.nodes,
+            "items_removed": self.items_removed,
+            "pruning_ratio": self.pruning_ratio,
+        }
+
+    def describe(self) -> List[str]:
+        """Human readable summary, one line per figure."""
+        lines = [
+            f"Engine: {self.engine}",
+            f"Wall time: {self.total_wall_time * 1000:.2f} ms (CPU {self.total_cpu_time * 1000:.2f} ms)",
+        ]
+        for name, seconds in self.wall_time.items():
+            lines.append(f"  {name}: {seconds * 1000:.2f} ms (CPU {self.cpu_time[name] * 1000:.2f} ms)")
+        if self.peak_bytes is not None:
+            lines.append(f"Peak memory: {self.peak_bytes / 2**20:.2f} MiB")
+        if self.cells:
+            lines.append(f"DP cells evaluated: {self.cells:,}")
+        if self.nodes:
+            lines.append(f"Nodes expanded: {self.nodes:,}")
+        lines.append(f"Items pruned: {self.items_removed} / {self.n_items} ({self.pruning_ratio:.1%})")
+        return lines
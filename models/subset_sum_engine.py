@@ -0,0 +1,98 @@
+"""
+Subset-Sum Engine
+Big-integer bitset reachability for 0/1 knapsack with proportional values.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+from typing import List, Optional, Tuple
+
+from .control import SolveControl
+from .stats import SolveStats
+
+
+class SubsetSumEngine:
+    """
+    0/1 knapsack engine for instances where every item has the same
+    value-to-weight ratio (values equal to weights being the usual case).
+
+    The best selection is then the heaviest one that fits, so only
+    reachability matters. A Python integer serves as the bitset of
+    reachable weights: ``reach |= reach << w`` adds an item to every
+    reachable sum at once, many capacities per machine word.
+
+    Backtracking needs the bitset before each item. Only every
+    ``step``-th one (step about sqrt(n)) is kept; the others are rebuilt one
+    block at a time, so memory stays at O(sqrt(n) * capacity) bits.
+    """
+
+    @staticmethod
+    def is_subset_sum(weights: List[int], values: List[int]) -> bool:
+        """Tell whether every item has the same value-to-weight ratio."""
+        if not weights:
+            return True
+        w0, v0 = weights[0], values[0]
+        return all(v * w0 == w * v0 for w, v in zip(weights, values))
+
+    @staticmethod
+    def table_bytes(capacity: int, n: int) -> int:
+        """Estimate the size of the kept and rebuilt bitsets in bytes."""
+        step = int(n ** 0.5) + 1
+        return (n // step + step + 1) * (capacity // 8 + 1)
+
+    @staticmethod
+    def solve(capacity: int, weights: List[int], values: List[int],
+              control: Optional[SolveControl] = None, stats: Optional[SolveStats] = None) -> Tuple[int, List[int]]:
+        """
+        Solve a subset-sum shaped 0/1 Knapsack problem with bitsets.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values, proportional to the weights
+            control: Optional progress and cancellation handle
+            stats: Optional record receiving phase timings and cell counts
+
+        Returns:
+            Tuple containing (maximum_value, selected_item_indices)
+
+        Raises:
+            ValueError: If the values are not proportional to the weights
+        """
+        if not SubsetSumEngine.is_subset_sum(weights, values):
+            raise ValueError("Subset-sum engine needs values proportional to weights")
+        stats = stats or SolveStats(trace_memory=False)
+        n = len(weights)
+        capacity = min(capacity, sum(weights))
+        mask = (1 << (capacity + 1)) - 1
+        step = int(n ** 0.5) + 1
+
+        with stats.phase("fill"):
+            checkpoints = []
+            reach = 1
+            for i in range(n):
+                if control is not None:
+                    control.update(i, n)
+                if i % step == 0:
+                    checkpoints.append(reach)
+                reach = (reach | reach << weights[i]) & mask
+        stats.cells += n * (capacity + 1)
+
+        with stats.phase("backtrack"):
+            target = reach.bit_length() - 1
+            selected_items = []
+            for block in range(len(checkpoints) - 1, -1, -1):
+                start = block * step
+                end = min(n, start + step)
+                # before[k] is the bitset before item start + k.
+                before = [checkpoints[block]]
+                for i in range(start, end - 1):
+                    before.append((before[-1] | before[-1] << weights[i]) & mask)
+                for i in range(end - 1, start - 1, -1):
+                    if not before[i - start] >> target & 1:
+                        selected_items.append(i)
+                        target -= weights[i]
+            selected_items.reverse()
+
+        return sum(values[i] for i in selected_items), selected_items
@@ -0,0 +1,95 @@
+"""
+Value-Indexed Dynamic Programming Engine
+Dual 0/1 knapsack formulation storing the minimum weight per value.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .control import SolveControl
+from .stats import SolveStats
+
+
+class ValueEngine:
+    """
+    0/1 knapsack engine indexed by achievable value instead of weight.
+
+    ``row[p]`` holds the minimum weight needed to reach value exactly p.
+    The table has ``sum(values) + 1`` columns, so this engine is the cheaper
+    one whenever the total value is small compared to the capacity.
+    """
+
+    # Sentinel weight for values that cannot be reached; leaves headroom so
+    # adding an item weight never overflows int64.
+    UNREACHABLE = np.iinfo(np.int64).max // 2
+
+    # Working bytes per column during the forward pass, laid out as in
+    # DenseEngine: int64 row, int64 candidate, overlap temporary, take flags.
+    ROW_BYTES = 25
+
+    @staticmethod
+    def table_bytes(values: List[int]) -> int:
+        """Estimate the peak memory of a solve: decision table plus working rows."""
+        total_value = sum(values)
+        return len(values) * ((total_value + 8) // 8) + ValueEngine.ROW_BYTES * (total_value + 1)
+
+    @staticmethod
+    def solve(capacity: int, weights: List[int], values: List[int],
+              control: Optional[SolveControl] = None, stats: Optional[SolveStats] = None,
+              value_limit: Optional[int] = None) -> Tuple[int, List[int]]:
+        """
+        Solve the 0/1 Knapsack problem with the min-weight-per-value DP.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+            control: Optional progress and cancellation handle
+            stats: Optional record receiving phase timings and cell counts
+            value_limit: Known upper bound on the value of any feasible
+                selection; columns above it are never allocated
+
+        Returns:
+            Tuple containing (maximum_value, selected_item_indices)
+        """
+        stats = stats or SolveStats(trace_memory=False)
+        n = len(weights)
+        total_value = sum(values)
+        if value_limit is not None:
+            total_value = min(total_value, value_limit)
+
+        with stats.phase("fill"):
+            row = np.full(total_value + 1, ValueEngine.UNREACHABLE, dtype=np.int64)
+            row[0] = 0
+            decisions = np.zeros((n, (total_value + 8) // 8), dtype=np.uint8)
+            take = np.zeros(total_value + 1, dtype=bool)
+
+            for i in range(n):
+                if control is not None:
+                    control.update(i, n)
+                value = values[i]
+                if value > total_value:
+                    continue
+                candidate = row[:total_value + 1 - value] + weights[i]
+                take[:value] = False
+                np.less(candidate, row[value:], out=take[value:])
+                np.minimum(row[value:], candidate, out=row[value:])
+                decisions[i] = np.packbits(take)
+        stats.cells += n * (total_value + 1) - total_value
+
+        with stats.phase("backtrack"):
+            max_value = int(np.flatnonzero(row <= capacity)[-1])
+
+            selected_items = []
+            p = max_value
+            for i in range(n - 1, -1, -1):
+                if (decisions[i, p >> 3] >> (7 - (p & 7))) & 1:
+                    selected_items.append(i)
+                    p -= values[i]
+
+            selected_items.reverse()
+        return max_value, selected_items
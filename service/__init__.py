@@ -0,0 +1,8 @@
+"""
+Service package for the Knapsack Problem Solver.
+"""
+
+from .client import SolveClient
+from .server import ServiceError, SolveService
+
+__all__ = ['ServiceError', 'SolveClient', 'SolveService']
@@ -0,0 +1,55 @@
+"""
+Solve service entry point.
+
+Usage:
+    python -m service --port 8750 --workers 4 --max-pending 64
+    python -m service --unix /tmp/knapsack.sock
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from typing import List, Optional
+
+from .server import SolveService
+
+
+async def serve(args: argparse.Namespace) -> None:
+    """Run the service until interrupted."""
+    service = SolveService(args.workers, args.max_pending, args.deadline)
+    server = await service.start(args.host, args.port, args.unix)
+    where = args.unix or f"http://{args.host}:{args.port}"
+    logging.getLogger(__name__).info("Knapsack solve service listening on %s", where)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Parse arguments and run the service."""
+    parser = argparse.ArgumentParser(prog="python -m service", description="Run the knapsack solve service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8750)
+    parser.add_argument("--unix", default=None, help="listen on this Unix socket instead of TCP")
+    parser.add_argument("--workers", type=int, default=None, help="solver processes (default: all cores)")
+    parser.add_argument("--max-pending", type=int, default=64,
+                        help="distinct solves queued or running before requests are refused")
+    parser.add_argument("--deadline", type=float, default=30.0, help="default per-request deadline in seconds")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""
+Solve Service Client
+Blocking client for the local solve service over TCP or a Unix socket.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import http.client
+import json
+import socket
+from typing import Any, Dict, List, Optional
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix domain socket."""
+
+    def __init__(self, path: str, timeout: Optional[float] = None):
+        super().__init__("localhost", timeout=timeout)
+        self.path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.path)
+
+
+class SolveClient:
+    """
+    Client for :class:`service.server.SolveService`.
+
+    Keeps one persistent connection; not thread-safe, so concurrent callers
+    should use one client each.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8750, unix_path: Optional[str] = None,
+                 timeout: Optional[float] = 60.0):
+        if unix_path is not None:
+            self.connection = UnixHTTPConnection(unix_path, timeout=timeout)
+        else:
+            self.connection = http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def request(self, method: str, path: str, body: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Send one request and decode the JSON answer.
+
+        Returns:
+            Response body with the HTTP status added as ``status``
+        """
+        payload = None if body is None else json.dumps(body)
+        headers = {"Content-Type": "application/json"} if payload is not None else {}
+        try:
+            self.connection.request(method, path, payload, headers)
+            response = self.connection.getresponse()
+            data = response.read()
+        except (ConnectionError, http.client.HTTPException):
+            self.connection.close()
+            raise
+        if response.getheader("Connection", "").lower() == "close":
+            self.connection.close()
+        result = json.loads(data)
+        result["status"] = response.status
+        return result
+
+    def solve(self, capacity: int, weights: List[int], values: List[int], kind: str = "01",
+              engine: Optional[str] = None, deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Solve an instance on the service.
+
+        Args:
+            capacity: Maximum weight capacity of the knapsack
+            weights: List of item weights
+            values: List of item values
+            kind: "01" or "fractional"
+            engine: Optional engine name
+            deadline: Optional deadline in seconds
+
+        Returns:
+            Response with ``max_value``/``selected_items`` on status 200 or ``error`` otherwise
+        """
+        body = {"capacity": capacity, "weights": list(weights), "values": list(values), "kind": kind}
+        if engine is not None:
+            body["engine"] = engine
+        if deadline is not None:
+            body["deadline"] = deadline
+        return self.request("POST", "/solve", body)
+
+    def health(self) -> Dict[str, Any]:
+        """Fetch the service counters."""
+        return self.request("GET", "/health")
+
+    def close(self) -> None:
+        """Close the connection."""
+        self.connection.close()
@@ -0,0 +1,93 @@
+"""
+Solve Service Load Test
+Fires concurrent requests at a running solve service and reports latency.
+
+Usage:
+    python -m service --port 8750 &
+    python -m service.load_test --port 8750 --requests 500 --concurrency 32 --distinct 20
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import argparse
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from benchmarks import InstanceGenerator
+
+from .client import SolveClient
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a sorted list."""
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the load test and print a summary."""
+    parser = argparse.ArgumentParser(prog="python -m service.load_test", description="Load test the solve service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8750)
+    parser.add_argument("--unix", default=None, help="connect to this Unix socket instead of TCP")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--distinct", type=int, default=10,
+                        help="number of different instances; repeats exercise coalescing")
+    parser.add_argument("--n", type=int, default=1000, help="items per instance")
+    parser.add_argument("--class", dest="instance_class", choices=InstanceGenerator.CLASSES,
+                        default="weakly_correlated")
+    parser.add_argument("--deadline", type=float, default=None)
+    parser.add_argument("--retry", action="store_true", help="retry refused (503) requests after a short pause")
+    args = parser.parse_args(argv)
+
+    instances = [InstanceGenerator.generate(args.instance_class, args.n, seed=seed) for seed in range(args.distinct)]
+
+    def worker(job: tuple) -> List[tuple]:
+        offset, count = job
+        client = SolveClient(args.host, args.port, args.unix)
+        results = []
+        try:
+            for i in range(offset, offset + count):
+                capacity, weights, values = instances[i % len(instances)]
+                start = time.perf_counter()
+                while True:
+                    response = client.solve(capacity, weights, values, deadline=args.deadline)
+                    if response["status"] != 503 or not args.retry:
+                        break
+                    time.sleep(0.05)
+                results.append((response["status"], response.get("coalesced", False), time.perf_counter() - start))
+        finally:
+            client.close()
+        return results
+
+    # Each worker starts at a different instance so that coalescing only
+    # happens when workers really overlap.
+    jobs = [(i, args.requests // args.concurrency + (i < args.requests % args.concurrency))
+            for i in range(args.concurrency)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = [r for chunk in executor.map(worker, jobs) for r in chunk]
+    elapsed = time.perf_counter() - start
+
+    statuses = Counter(status for status, _, _ in results)
+    latencies = sorted(latency for status, _, latency in results if status == 200)
+    coalesced = sum(1 for _, was_coalesced, _ in results if was_coalesced)
+
+    print(f"Requests:    {len(results)} in {elapsed:.2f}s ({len(results) / elapsed:.1f} req/s)")
+    print(f"Statuses:    {dict(sorted(statuses.items()))}")
+    print(f"Coalesced:   {coalesced}")
+    print(f"Latency ms:  p50={percentile(latencies, 0.5) * 1000:.1f} "
+          f"p95={percentile(latencies, 0.95) * 1000:.1f} p99={percentile(latencies, 0.99) * 1000:.1f}")
+    health = SolveClient(args.host, args.port, args.unix).health()
+    print(f"Service:     {health}")
+    return 0 if statuses.get(200) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""
+Solve Service
+Long-lived asyncio HTTP server offloading knapsack solves to a process pool.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import asyncio
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from models import KnapsackSolver, SolutionCache, SolveCancelled, SolveControl
+from utils import InstanceLoader
+
+logger = logging.getLogger(__name__)
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable",
+           504: "Gateway Timeout"}
+
+
+class ServiceError(Exception):
+    """Error answered with an HTTP status instead of a solution."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _solve(kind: str, capacity: int, weights: list, values: list, options: Dict[str, Any],
+           time_limit: Optional[float]) -> Tuple[Any, list]:
+    """Worker entry point: solve one instance under an optional time limit."""
+    if kind == "fractional":
+        return KnapsackSolver.solve_fractional_knapsack(capacity, weights, values, **options)
+    control = None if time_limit is None else SolveControl(time_limit)
+    return KnapsackSolver.solve_01_knapsack(capacity, weights, values, control=control, **options)
+
+
+class SolveService:
+    """
+    Asyncio HTTP front end for :class:`KnapsackSolver`.
+
+    ``POST /solve`` takes ``{"capacity", "weights", "values"}`` plus optional
+    ``kind`` ("01" or "fractional"), ``engine`` and ``deadline`` (seconds)
+    and answers ``{"max_value", "selected_items", "coalesced"}``;
+    ``GET /health`` reports the service counters.
+
+    - Coalescing: requests for an instance that is already being solved
+      wait for that computation instead of starting another one.
+    - Admission control: at most ``max_pending`` distinct computations are
+      queued or running; beyond that requests are refused with 503 and a
+      ``Retry-After`` header so clients back off.
+    - Deadlines: a request that is not answered within its deadline gets
+      504. The worker runs under the deadline of the request that started
+      the computation, so abandoned solves free their worker too.
+    """
+
+    MAX_BODY_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, workers: Optional[int] = None, max_pending: int = 64,
+                 default_deadline: float = 30.0):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.default_deadline = default_deadline
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.in_flight: Dict[tuple, asyncio.Future] = {}
+        self.counters = {"requests": 0, "solved": 0, "coalesced": 0, "rejected": 0, "timeouts": 0, "errors": 0}
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8750,
+                    unix_path: Optional[str] = None) -> asyncio.AbstractServer:
+        """
+        Create the worker pool and start listening.
+
+        Args:
+            host: Interface to bind for TCP
+            port: TCP port
+            unix_path: Listen on this Unix socket instead of TCP
+
+        Returns:
+            The running asyncio server
+        """
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        if unix_path is not None:
+            return await asyncio.start_unix_server(self.handle_connection, path=unix_path)
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    def close(self) -> None:
+        """Shut the worker pool down."""
+        if self.executor is not None:
+            try:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+            except TypeError:  # Python < 3.9
+                self.executor.shutdown(wait=False)
+            self.executor = None
+
+    async def solve(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Solve one decoded request, coalescing and admitting it.
+
+        Args:
+            request: JSON object with the instance and options
+
+        Returns:
+            Response body
+        """
+        self.counters["requests"] += 1
+        kind = request.get("kind", "01")
+        if kind not in ("01", "fractional"):
+            raise ServiceError(400, f"Unknown knapsack kind '{kind}', expected '01' or 'fractional'")
+        engine = request.get("engine")
+        engines = KnapsackSolver.ENGINES if kind == "01" else KnapsackSolver.FRACTIONAL_ENGINES
+        if engine is not None and engine not in engines:
+            raise ServiceError(400, f"Unknown engine '{engine}', expected one of {engines}")
+        deadline = request.get("deadline", self.default_deadline)
+        if not isinstance(deadline, (int, float)) or deadline <= 0:
+            raise ServiceError(400, "Deadline must be a positive number of seconds")
+
+        try:
+            capacity, weights, values = InstanceLoader.parse_record(request)
+        except (TypeError, ValueError) as e:
+            raise ServiceError(400, str(e))
+
+        key = (kind, engine, capacity, SolutionCache.fingerprint(weights, values))
+        computation = self.in_flight.get(key)
+        coalesced = computation is not None
+        if coalesced:
+            self.counters["coalesced"] += 1
+        else:
+            if len(self.in_flight) >= self.max_pending:
+                self.counters["rejected"] += 1
+                raise ServiceError(503, f"Too many pending solves ({self.max_pending}), retry later")
+            options = {} if engine is None else {"engine": engine}
+            computation = asyncio.get_running_loop().run_in_executor(
+                self.executor, _solve, kind, capacity, weights.tolist(), values.tolist(), options, deadline
+            )
+            self.in_flight[key] = computation
+            computation.add_done_callback(lambda _: self.in_flight.pop(key, None))
+
+        try:
+            max_value, selected_items = await asyncio.wait_for(asyncio.shield(computation), deadline)
+        except asyncio.TimeoutError:
+            self.counters["timeouts"] += 1
+            raise ServiceError(504, f"Deadline of {deadline:g}s exceeded")
+        except SolveCancelled as e:
+            self.counters["timeouts"] += 1
+            raise ServiceError(504, str(e))
+        except Exception as e:
+            self.counters["errors"] += 1
+            logger.warning("Solve of n=%d capacity=%d failed: %r", len(weights), capacity, e)
+            raise ServiceError(500, f"{type(e).__name__}: {e}")
+
+        self.counters["solved"] += 1
+        return {"max_value": max_value, "selected_items": selected_items, "coalesced": coalesced}
+
+    def health(self) -> Dict[str, Any]:
+        """Current counters and queue depth."""
+        return dict(self.counters, pending=len(self.in_flight), max_pending=self.max_pending,
+                    workers=self.workers)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve HTTP/1.1 requests on one connection until it closes."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0))
+                if length > SolveService.MAX_BODY_BYTES:
+                    await self.respond(writer, 413, {"error": "Request body too large"}, close=True)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                status, response, extra = await self.route(method, path, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await self.respond(writer, status, response, extra, close=not keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def route(self, method: str, path: str, body: bytes) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        """Dispatch one request to its endpoint."""
+        if path == "/health":
+            return 200, self.health(), {}
+        if path != "/solve":
+            return 404, {"error": f"No such endpoint: {path}"}, {}
+        if method != "POST":
+            return 405, {"error": "Use POST /solve"}, {}
+        try:
+            request = json.loads(body)
+            if not isinstance(request, dict):
+                raise ServiceError(400, "Request body must be a JSON object")
+            return 200, await self.solve(request), {}
+        except ServiceError as e:
+            extra = {"Retry-After": "1"} if e.status == 503 else {}
+            return e.status, {"error": str(e)}, extra
+        except ValueError as e:
+            return 400, {"error": f"Invalid JSON: {e}"}, {}
+
+    @staticmethod
+    async def respond(writer: asyncio.StreamWriter, status: int, body: Dict[str, Any],
+                      extra_headers: Optional[Dict[str, str]] = None, close: bool = False) -> None:
+        """Write a JSON response."""
+        payload = json.dumps(body, default=lambda value: np.asarray(value).tolist()).encode()
+        headers = {
+            "Content-Type": "application/json",
+            "Content-Length": str(len(payload)),
+            "Connection": "close" if close else "keep-alive",
+        }
+        headers.update(extra_headers or {})
+        head = f"HTTP/1.1 {status} {REASONS.get(status, 'Error')}\r\n"
+        head += "".join(f"{name}: {value}\r\n" for name, value in headers.items()) + "\r\n"
+        writer.write(head.encode("latin-1") + payload)
+        await writer.drain()
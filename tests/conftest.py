@@ -0,0 +1,56 @@
+"""
+Shared Test Helpers
+Reference solutions and random instances used across the test modules.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import os
+import random
+import sys
+from itertools import combinations
+
+# Make the repository packages importable however pytest is started.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def brute_force(capacity, weights, values):
+    """Best value over every subset of the items."""
+    best = 0
+    for size in range(len(weights) + 1):
+        for subset in combinations(range(len(weights)), size):
+            if sum(weights[i] for i in subset) <= capacity:
+                best = max(best, sum(values[i] for i in subset))
+    return best
+
+
+def random_instances(seed, count, proportional=False):
+    """Small random instances, including items heavier than the capacity."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        n = rng.randint(1, 10)
+        weights = [rng.randint(1, 30) for _ in range(n)]
+        if proportional:
+            ratio = rng.randint(1, 3)
+            values = [ratio * w for w in weights]
+        else:
+            values = [rng.randint(1, 40) for _ in range(n)]
+        yield rng.randint(1, 80), weights, values
+
+
+def huge_capacity_instance(n, low, high, seed=5):
+    """Uncorrelated instance with capacity half the total weight."""
+    rng = random.Random(seed)
+    weights = [rng.randint(low, high) for _ in range(n)]
+    values = [rng.randint(low, high) for _ in range(n)]
+    return sum(weights) // 2, weights, values
+
+
+def assert_solution(capacity, weights, values, result, expected):
+    """The result is feasible, consistent and optimal."""
+    max_value, selected_items = result
+    assert max_value == expected
+    assert selected_items == sorted(set(selected_items))
+    assert sum(weights[i] for i in selected_items) <= capacity
+    assert sum(values[i] for i in selected_items) == max_value
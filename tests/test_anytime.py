@@ -0,0 +1,33 @@
+"""
+Anytime Solver Tests
+Checks the incumbent, upper bound and gap reported within a time budget.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import pytest
+
+from conftest import assert_solution, brute_force, random_instances
+from models import KnapsackSolver
+
+
+@pytest.mark.parametrize("preprocess", [True, False])
+def test_anytime_is_optimal_with_enough_time(preprocess):
+    for capacity, weights, values in random_instances(seed=3, count=40):
+        optimum = brute_force(capacity, weights, values)
+        result = KnapsackSolver.solve_01_anytime(capacity, weights, values, time_budget=1.0, preprocess=preprocess)
+        assert_solution(capacity, weights, values, result.as_tuple(), optimum)
+        assert result.optimal
+        assert result.upper_bound == optimum
+        assert result.gap == 0
+
+
+@pytest.mark.parametrize("preprocess", [True, False])
+def test_anytime_without_time_returns_a_bounded_incumbent(preprocess):
+    for capacity, weights, values in random_instances(seed=8, count=40):
+        optimum = brute_force(capacity, weights, values)
+        result = KnapsackSolver.solve_01_anytime(capacity, weights, values, time_budget=0.0, preprocess=preprocess)
+        assert_solution(capacity, weights, values, result.as_tuple(), result.max_value)
+        assert result.max_value <= optimum <= result.upper_bound
+        assert 0 <= result.gap <= 1
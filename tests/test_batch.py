@@ -0,0 +1,73 @@
+"""
+Batch Solving Tests
+Checks ordering, error capture and the shared-memory path of the batch API.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import numpy as np
+import pytest
+
+from conftest import brute_force, random_instances
+from models import KnapsackSolver
+from models import batch
+from models.batch import BatchSolver
+
+
+def test_batch_results_follow_input_order():
+    instances = list(random_instances(seed=8, count=20))
+    results = list(KnapsackSolver.solve_batch(instances, workers=2, chunk_size=3))
+    assert [result.index for result in results] == list(range(len(instances)))
+    assert [result.max_value for result in results] == [brute_force(*instance) for instance in instances]
+
+
+def test_unordered_batch_covers_every_instance():
+    instances = list(random_instances(seed=9, count=20))
+    results = list(KnapsackSolver.solve_batch(instances, workers=2, chunk_size=3, ordered=False))
+    assert sorted(result.index for result in results) == list(range(len(instances)))
+
+
+def test_failing_instance_does_not_abort_the_batch():
+    instances = [(10, [3, 4], [3, 5]), (10, [3, 4], [3]), (5, [5], [7])]
+    results = list(KnapsackSolver.solve_batch(instances, workers=1))
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[1].error and results[1].max_value is None
+    assert results[2].max_value == 7
+
+
+def test_load_failures_keep_their_place_without_reading_ahead():
+    consumed = []
+
+    def instances():
+        for index in range(10 ** 6):
+            consumed.append(index)
+            yield ValueError("bad line") if index % 2 else (7, [3, 4, 5], [3, 4, 5])
+
+    results = KnapsackSolver.solve_batch(instances(), workers=1, chunk_size=4)
+    first, second = next(results), next(results)
+    results.close()
+    assert (first.index, first.max_value) == (0, 7)
+    assert (second.index, second.error) == (1, "ValueError: bad line")
+    assert len(consumed) <= 3 * 4
+
+
+def test_batch_workers_receive_python_ints():
+    instances = [(7, np.array([3, 4, 5]), np.array([3, 4, 5]))]
+    results = list(KnapsackSolver.solve_batch(instances, workers=1, engine="subset_sum"))
+    assert results[0].ok, results[0].error
+    assert results[0].max_value == 7
+
+
+def test_large_arrays_travel_through_shared_memory(monkeypatch):
+    if batch.shared_memory is None:
+        pytest.skip("shared memory is unavailable")
+    monkeypatch.setattr(BatchSolver, "SHARED_MEMORY_THRESHOLD", 4)
+    instances = list(random_instances(seed=10, count=12))
+    results = list(KnapsackSolver.solve_batch(instances, workers=2, chunk_size=2))
+    assert [result.max_value for result in results] == [brute_force(*instance) for instance in instances]
+
+
+def test_unknown_kind():
+    with pytest.raises(ValueError):
+        list(KnapsackSolver.solve_batch([], kind="nope"))
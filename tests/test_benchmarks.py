@@ -0,0 +1,38 @@
+"""
+Benchmark Suite Tests
+Checks the instance generators and the regression comparison.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import pytest
+
+from benchmarks.generators import InstanceGenerator
+from benchmarks.runner import BenchmarkRunner
+
+
+@pytest.mark.parametrize("kind", InstanceGenerator.CLASSES)
+def test_generators_are_deterministic_and_valid(kind):
+    capacity, weights, values = InstanceGenerator.generate(kind, 50, seed=3)
+    assert (capacity, weights, values) == InstanceGenerator.generate(kind, 50, seed=3)
+    assert len(weights) == len(values) == 50
+    assert min(weights) > 0 and min(values) > 0
+    assert 0 < capacity <= sum(weights)
+    if kind == "subset_sum":
+        assert weights == values
+
+
+def test_small_sweep_agrees_across_engines():
+    records = BenchmarkRunner.run(classes=["uncorrelated"], sizes=[30], engines=["dense", "branch_and_bound"],
+                                  repeats=1)
+    assert len(records) == 2
+    assert records[0]["max_value"] == records[1]["max_value"]
+
+
+def test_compare_flags_regressions():
+    old = {"kind": "01", "class": "uncorrelated", "n": 10, "capacity_ratio": 0.5, "engine": "dense", "seed": 0,
+           "seconds": 0.1, "peak_bytes": 1000, "max_value": 5}
+    assert BenchmarkRunner.compare([old], [dict(old)]) == []
+    slower = dict(old, seconds=0.2, peak_bytes=2000, max_value=6)
+    assert len(BenchmarkRunner.compare([old], [slower])) == 3
@@ -0,0 +1,68 @@
+"""
+Bounded and Unbounded Knapsack Tests
+Checks the copy counts against an exhaustive search.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import random
+
+import pytest
+
+from models import KnapsackSolver
+from models.bounded_engine import BoundedEngine
+
+
+def best_with_copies(capacity, weights, values, counts):
+    """Reference DP trying every number of copies of every item."""
+    best = [0] * (capacity + 1)
+    for weight, value, count in zip(weights, values, counts):
+        limit = capacity // weight if count is None else count
+        best = [max(best[c - k * weight] + k * value for k in range(min(limit, c // weight) + 1))
+                for c in range(capacity + 1)]
+    return best[capacity]
+
+
+def check(capacity, weights, values, counts, result):
+    max_value, taken = result
+    assert all(0 <= k for k in taken)
+    assert all(count is None or k <= count for k, count in zip(taken, counts))
+    assert sum(k * w for k, w in zip(taken, weights)) <= capacity
+    assert sum(k * v for k, v in zip(taken, values)) == max_value
+    assert max_value == best_with_copies(capacity, weights, values, counts)
+
+
+def instances(seed, count):
+    rng = random.Random(seed)
+    for _ in range(count):
+        n = rng.randint(1, 5)
+        yield (rng.randint(1, 60), [rng.randint(1, 25) for _ in range(n)], [rng.randint(1, 40) for _ in range(n)],
+               [rng.choice([None, 0, 1, 2, 5]) for _ in range(n)])
+
+
+def test_bounded_counts_are_optimal():
+    for capacity, weights, values, counts in instances(seed=14, count=60):
+        check(capacity, weights, values, counts,
+              KnapsackSolver.solve_bounded_knapsack(capacity, weights, values, counts))
+
+
+@pytest.mark.parametrize("memory_budget", [None, 0])
+def test_unbounded_counts_are_optimal(memory_budget):
+    for capacity, weights, values, _ in instances(seed=15, count=60):
+        counts = [None] * len(weights)
+        check(capacity, weights, values, counts,
+              KnapsackSolver.solve_unbounded_knapsack(capacity, weights, values, memory_budget))
+
+
+def test_unbounded_huge_capacity_stays_within_budget():
+    capacity, weights, values = 10 ** 12, [3 * 10 ** 11, 7 * 10 ** 11], [5, 12]
+    assert BoundedEngine.table_bytes(capacity, 2) > KnapsackSolver.MEMORY_BUDGET
+    assert KnapsackSolver.solve_unbounded_knapsack(capacity, weights, values) == (17, [1, 1])
+
+
+def test_counts_must_match_items():
+    with pytest.raises(ValueError):
+        KnapsackSolver.solve_bounded_knapsack(10, [3, 4], [3, 5], [1])
+    with pytest.raises(ValueError):
+        KnapsackSolver.solve_bounded_knapsack(10, [3, 4], [3, 5], [1, -1])
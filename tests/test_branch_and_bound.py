@@ -0,0 +1,34 @@
+"""
+Branch-and-Bound Tests
+Checks the search, its limits and the reported bound.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+from conftest import assert_solution, brute_force, huge_capacity_instance, random_instances
+from models.branch_and_bound import BranchAndBoundSolver
+
+
+def test_search_is_optimal_and_closes_the_gap():
+    for capacity, weights, values in random_instances(seed=4, count=60):
+        result = BranchAndBoundSolver.solve(capacity, weights, values)
+        assert result.optimal and result.gap == 0
+        assert_solution(capacity, weights, values, result.as_tuple(), brute_force(capacity, weights, values))
+
+
+def test_node_limit_returns_incumbent_with_valid_bound():
+    capacity, weights, values = huge_capacity_instance(60, 10 ** 6, 10 ** 7)
+    exact = BranchAndBoundSolver.solve(capacity, weights, values)
+    limited = BranchAndBoundSolver.solve(capacity, weights, values, node_limit=10)
+    assert not limited.optimal
+    assert limited.nodes == 10
+    assert limited.max_value <= exact.max_value <= limited.upper_bound
+    assert sum(weights[i] for i in limited.selected_items) <= capacity
+    assert sum(values[i] for i in limited.selected_items) == limited.max_value
+
+
+def test_incumbent_is_kept_when_better_than_greedy():
+    capacity, weights, values = 10, [6, 5, 5], [7, 5, 5]
+    result = BranchAndBoundSolver.solve(capacity, weights, values, node_limit=0, incumbent=(10, [1, 2]))
+    assert result.as_tuple() == (10, [1, 2])
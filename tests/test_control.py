@@ -0,0 +1,63 @@
+"""
+Solve Control Tests
+Checks progress reporting, cancellation and time limits of running solves.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import threading
+import time
+
+import pytest
+
+from conftest import huge_capacity_instance
+from models import KnapsackSolver
+from models.control import SolveCancelled, SolveControl
+
+
+def test_progress_is_reported():
+    control = SolveControl()
+    KnapsackSolver.solve_01_knapsack(1000, list(range(1, 41)), list(range(40, 0, -1)), engine="dense",
+                                     preprocess=False, control=control)
+    assert control.total == 40
+    assert control.describe().endswith("/ 40 rows")
+
+
+@pytest.mark.parametrize("engine", ["dense", "hirschberg"])
+def test_cancel_from_another_thread(engine):
+    capacity, weights, values = huge_capacity_instance(300, 1, 10 ** 4)
+    control = SolveControl()
+    outcome = []
+
+    def work():
+        try:
+            outcome.append(KnapsackSolver.solve_01_knapsack(capacity, weights, values, engine=engine,
+                                                            preprocess=False, control=control))
+        except SolveCancelled as e:
+            outcome.append(e)
+
+    worker = threading.Thread(target=work)
+    worker.start()
+    while worker.is_alive() and control.done == 0:
+        time.sleep(0.001)
+    control.cancel()
+    worker.join(timeout=30)
+    assert not worker.is_alive()
+    assert isinstance(outcome[0], SolveCancelled)
+    assert control.done < len(weights)
+
+
+def test_cancelled_search_stops_immediately():
+    capacity, weights, values = huge_capacity_instance(300, 10 ** 6, 10 ** 7)
+    control = SolveControl()
+    control.cancel()
+    with pytest.raises(SolveCancelled):
+        KnapsackSolver.solve_01_knapsack(capacity, weights, values, engine="branch_and_bound", control=control)
+
+
+def test_time_limit_cancels():
+    capacity, weights, values = huge_capacity_instance(400, 1, 10 ** 5)
+    with pytest.raises(SolveCancelled, match="Time limit"):
+        KnapsackSolver.solve_01_knapsack(capacity, weights, values, engine="dense", preprocess=False,
+                                         control=SolveControl(time_limit=0))
@@ -0,0 +1,85 @@
+"""
+Core Engine Tests
+Checks the expanding core against exact engines, the break item and the
+dispatch of large instances with huge residual capacity.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from conftest import assert_solution, brute_force, huge_capacity_instance, random_instances
+from models import KnapsackSolver, SolveStats
+from models.branch_and_bound import BranchAndBoundSolver
+from models.core_engine import CoreEngine
+from models.pareto_engine import ParetoEngine
+
+
+def counting_solver():
+    """Pareto core solver that records every core it is asked to solve."""
+    cores = []
+
+    def solve_core(capacity, weights, values):
+        cores.append(len(weights))
+        return ParetoEngine.solve(capacity, weights, values)
+
+    return cores, solve_core
+
+
+def test_core_engine_matches_brute_force():
+    for capacity, weights, values in random_instances(seed=9, count=60):
+        result = CoreEngine.solve(capacity, weights, values)
+        assert_solution(capacity, weights, values, result, brute_force(capacity, weights, values))
+
+
+def test_core_engine_matches_branch_and_bound_on_large_instances():
+    rng = random.Random(10)
+    for _ in range(5):
+        weights = [rng.randint(1, 1000) for _ in range(2000)]
+        values = [w + rng.randint(-50, 50) + 100 for w in weights]
+        capacity = sum(weights) // 3
+        expected = BranchAndBoundSolver.solve(capacity, weights, values).max_value
+        cores, solve_core = counting_solver()
+        result = CoreEngine.solve(capacity, weights, values, solve_core=solve_core)
+        assert_solution(capacity, weights, values, result, expected)
+        assert max(cores) < len(weights)
+
+
+@pytest.mark.parametrize("capacity, weights, values", [
+    (11, [3, 4, 14, 25, 5, 24, 1], [29, 28, 27, 2, 32, 21, 17]),
+    (46, [29, 30, 7], [29, 28, 10]),
+    (11, [10, 4, 15, 21], [18, 16, 17, 20]),
+])
+def test_core_holding_every_item_is_solved_once(capacity, weights, values):
+    cores, solve_core = counting_solver()
+    result = CoreEngine.solve(capacity, weights, values, solve_core=solve_core)
+    assert_solution(capacity, weights, values, result, brute_force(capacity, weights, values))
+    assert cores == [sum(w <= capacity for w in weights)]
+
+
+def test_break_item_is_the_first_item_greedy_cannot_take():
+    rng = np.random.default_rng(12)
+    for _ in range(20):
+        weights = rng.integers(1, 50, 200)
+        values = rng.integers(1, 50, 200)
+        capacity = int(weights.sum()) // 2
+        b = CoreEngine.break_item(capacity, weights, values)
+        ratio = values[b] / weights[b]
+        ratios = values / weights
+        assert weights[ratios > ratio].sum() <= capacity
+        assert weights[ratios >= ratio].sum() > capacity
+    assert CoreEngine.break_item(100, np.array([10, 20]), np.array([1, 2])) is None
+
+
+@pytest.mark.parametrize("preprocess", [True, False])
+def test_core_engine_with_huge_residual_capacity(preprocess):
+    capacity, weights, values = huge_capacity_instance(KnapsackSolver.CORE_MIN_ITEMS, 10 ** 11, 10 ** 12)
+    expected = BranchAndBoundSolver.solve(capacity, weights, values).max_value
+    stats = SolveStats()
+    result = KnapsackSolver.solve_01_knapsack(capacity, weights, values, stats=stats, preprocess=preprocess)
+    assert_solution(capacity, weights, values, result, expected)
+    assert stats.engine == "core"
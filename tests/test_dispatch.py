@@ -0,0 +1,44 @@
+"""
+Engine Dispatch Tests
+Checks which engine the automatic selection picks.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+from conftest import assert_solution, huge_capacity_instance
+from models import KnapsackSolver, SolveStats
+from models.dense_engine import DenseEngine
+from models.hirschberg_engine import HirschbergEngine
+
+
+def test_small_total_value_uses_the_value_engine():
+    capacity, weights, values = huge_capacity_instance(80, 10 ** 6, 10 ** 7)
+    values = [value % 7 + 1 for value in values]
+    assert KnapsackSolver.select_engine(capacity, weights, values) == "value"
+    stats = SolveStats()
+    result = KnapsackSolver.solve_01_knapsack(capacity, weights, values, preprocess=False, stats=stats)
+    assert stats.engine == "value"
+    expected = KnapsackSolver.solve_01_knapsack(capacity, weights, values, engine="branch_and_bound")[0]
+    assert_solution(capacity, weights, values, result, expected)
+
+
+def test_small_capacity_uses_the_dense_engine():
+    assert KnapsackSolver.select_dp_engine(50, [10, 20, 30], [60, 100, 120]) == "dense"
+
+
+def test_tight_budget_uses_the_linear_memory_engine():
+    capacity, weights, values = 10 ** 5, [3 * 10 ** 4] * 40, list(range(10 ** 5, 10 ** 5 + 40))
+    budget = HirschbergEngine.table_bytes(capacity)
+    assert DenseEngine.table_bytes(capacity, len(weights)) > budget
+    assert KnapsackSolver.select_dp_engine(capacity, weights, values, memory_budget=budget) == "hirschberg"
+
+
+def test_dispatch_without_room_for_any_dp_table():
+    capacity, weights, values = huge_capacity_instance(300, 10 ** 6, 10 ** 7)
+    assert KnapsackSolver.select_dp_engine(capacity, weights, values) == "branch_and_bound"
+    stats = SolveStats()
+    max_value, selected_items = KnapsackSolver.solve_01_knapsack(capacity, weights, values, stats=stats)
+    assert stats.engine == "branch_and_bound"
+    assert sum(weights[i] for i in selected_items) <= capacity
+    assert sum(values[i] for i in selected_items) == max_value
@@ -0,0 +1,46 @@
+"""
+FPTAS Tests
+Checks the (1 - epsilon) guarantee, the reported bound and epsilon validation.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import pytest
+
+from conftest import assert_solution, brute_force, huge_capacity_instance, random_instances
+from models import KnapsackSolver
+from utils import InputValidator
+
+
+@pytest.mark.parametrize("preprocess", [True, False])
+@pytest.mark.parametrize("epsilon", [0.05, 0.2, 0.5])
+def test_fptas_respects_its_guarantee(epsilon, preprocess):
+    for capacity, weights, values in random_instances(seed=3, count=40):
+        optimum = brute_force(capacity, weights, values)
+        result = KnapsackSolver.solve_01_fptas(capacity, weights, values, epsilon=epsilon, preprocess=preprocess)
+        assert_solution(capacity, weights, values, result.as_tuple(), result.max_value)
+        assert (1 - epsilon) * optimum <= result.max_value <= optimum <= result.upper_bound
+        assert result.gap <= epsilon
+
+
+def test_fptas_ignores_the_capacity_scale():
+    capacity, weights, values = huge_capacity_instance(60, 10 ** 11, 10 ** 12)
+    exact = KnapsackSolver.solve_01_knapsack(capacity, weights, values, engine="branch_and_bound")[0]
+    result = KnapsackSolver.solve_01_fptas(capacity, weights, values, epsilon=0.1)
+    assert_solution(capacity, weights, values, result.as_tuple(), result.max_value)
+    assert 0.9 * exact <= result.max_value <= exact <= result.upper_bound
+
+
+@pytest.mark.parametrize("epsilon", [0, 1, -0.5, 2])
+def test_fptas_rejects_epsilon_outside_the_unit_interval(epsilon):
+    with pytest.raises(ValueError):
+        KnapsackSolver.solve_01_fptas(10, [3, 4], [3, 5], epsilon=epsilon)
+
+
+def test_validate_epsilon():
+    assert InputValidator.validate_epsilon("  ") is None
+    assert InputValidator.validate_epsilon("0.25") == 0.25
+    for text in ("abc", "0", "1", "-0.1"):
+        with pytest.raises(ValueError):
+            InputValidator.validate_epsilon(text)
@@ -0,0 +1,35 @@
+"""
+Fractional Knapsack Tests
+Checks that the sorting, selection and vectorized greedy passes agree.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import pytest
+
+from conftest import random_instances
+from models import KnapsackSolver
+
+
+def test_fractional_engines_agree():
+    for capacity, weights, values in random_instances(seed=4, count=40):
+        results = [KnapsackSolver.solve_fractional_knapsack(capacity, weights, values, preprocess=preprocess,
+                                                            engine=engine)[0]
+                   for engine in KnapsackSolver.FRACTIONAL_ENGINES for preprocess in (True, False)]
+        assert max(results) - min(results) < 1e-9
+
+
+@pytest.mark.parametrize("engine", KnapsackSolver.FRACTIONAL_ENGINES)
+def test_fractional_selection_is_feasible(engine):
+    for capacity, weights, values in random_instances(seed=7, count=40):
+        max_value, selected = KnapsackSolver.solve_fractional_knapsack(capacity, weights, values, engine=engine)
+        assert len({i for i, _ in selected}) == len(selected)
+        assert all(0 < fraction <= 1 for _, fraction in selected)
+        assert sum(weights[i] * fraction for i, fraction in selected) <= capacity + 1e-9
+        assert sum(values[i] * fraction for i, fraction in selected) == pytest.approx(max_value)
+
+
+def test_unknown_fractional_engine():
+    with pytest.raises(ValueError):
+        KnapsackSolver.solve_fractional_knapsack(10, [3, 4], [3, 5], engine="nope")
@@ -0,0 +1,24 @@
+"""
+Linear-Memory Engine Tests
+Checks the divide-and-conquer reconstruction and the memory estimates.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+from conftest import assert_solution, brute_force, random_instances
+from models.dense_engine import DenseEngine
+from models.hirschberg_engine import HirschbergEngine
+
+
+def test_recursion_down_to_single_items_is_optimal():
+    for capacity, weights, values in random_instances(seed=20, count=60):
+        result = HirschbergEngine.solve(capacity, weights, values, leaf_budget=0)
+        assert_solution(capacity, weights, values, result, brute_force(capacity, weights, values))
+
+
+def test_memory_estimates_include_working_rows():
+    capacity = 10 ** 7
+    assert DenseEngine.table_bytes(capacity, 30) >= DenseEngine.decision_bytes(capacity, 30) + 20 * capacity
+    assert HirschbergEngine.table_bytes(capacity) > 20 * capacity
+    assert HirschbergEngine.table_bytes(capacity) < DenseEngine.table_bytes(capacity, 1000)
@@ -0,0 +1,55 @@
+"""
+Incremental Solver Tests
+Checks additions and removals against a fresh solve of the current items.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import random
+
+import pytest
+
+from conftest import brute_force
+from models.incremental import IncrementalSolver
+
+
+def check(solver):
+    """The incremental optimum matches a fresh solve and its selection is consistent."""
+    items = solver.items
+    weights = [weight for weight, _ in items.values()]
+    values = [value for _, value in items.values()]
+    max_value, selected = solver.solution()
+    assert max_value == brute_force(solver.capacity, weights, values)
+    assert sum(items[item_id][0] for item_id in selected) <= solver.capacity
+    assert sum(items[item_id][1] for item_id in selected) == max_value
+
+
+@pytest.mark.parametrize("checkpoint_interval", [1, 3, 32])
+def test_random_additions_and_removals(checkpoint_interval):
+    rng = random.Random(13)
+    solver = IncrementalSolver(60, checkpoint_interval)
+    for _ in range(40):
+        if len(solver) < 3 or rng.random() < 0.6:
+            solver.add_item(rng.randint(1, 30), rng.randint(1, 40))
+        else:
+            solver.remove_items(rng.sample(list(solver.items), rng.randint(1, 2)))
+        if len(solver) <= 12:
+            check(solver)
+
+
+def test_ids_stay_valid_after_removal():
+    solver = IncrementalSolver(10)
+    first, second, third = solver.add_items([(5, 10), (5, 6), (5, 8)])
+    assert solver.solution() == (18, [first, third])
+    solver.remove_item(first)
+    assert solver.solution() == (14, [second, third])
+    with pytest.raises(KeyError):
+        solver.remove_item(first)
+
+
+def test_rejects_invalid_items():
+    with pytest.raises(ValueError):
+        IncrementalSolver(-1)
+    with pytest.raises(ValueError):
+        IncrementalSolver(10).add_item(0, 5)
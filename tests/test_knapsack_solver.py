@@ -0,0 +1,42 @@
+"""
+Knapsack Solver Tests
+Checks every 0/1 engine against the reference table and brute force.
+
+Run with ``python -m pytest`` from the repository root.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import pytest
+
+from conftest import assert_solution, brute_force, random_instances
+from models import KnapsackSolver
+
+EXACT_ENGINES = [engine for engine in KnapsackSolver.ENGINES if engine != "subset_sum"]
+
+
+@pytest.mark.parametrize("preprocess", [True, False])
+@pytest.mark.parametrize("engine", EXACT_ENGINES)
+def test_engine_matches_table_and_brute_force(engine, preprocess):
+    for capacity, weights, values in random_instances(seed=1, count=60):
+        expected = KnapsackSolver._solve_01_table(capacity, weights, values)[0]
+        assert expected == brute_force(capacity, weights, values)
+        result = KnapsackSolver.solve_01_knapsack(capacity, weights, values, engine=engine, preprocess=preprocess)
+        assert_solution(capacity, weights, values, result, expected)
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        KnapsackSolver.solve_01_knapsack(10, [3, 4], [3, 5], engine="nope")
+
+
+@pytest.mark.parametrize("preprocess", [True, False])
+def test_sums_beyond_int64_stay_exact(preprocess):
+    capacity, weights, values = 3, [1, 2, 2, 1], [2 ** 62, 2 ** 62, 2 ** 62 - 5, 2 ** 62 - 1]
+    assert not KnapsackSolver.fits_int64(weights, values)
+    result = KnapsackSolver.solve_01_knapsack(capacity, weights, values, preprocess=preprocess)
+    assert_solution(capacity, weights, values, result, 2 ** 63)
+    for engine in KnapsackSolver.INT64_ENGINES:
+        with pytest.raises(ValueError):
+            KnapsackSolver.solve_01_knapsack(capacity, weights, values, engine=engine, preprocess=preprocess)
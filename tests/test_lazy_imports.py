@@ -0,0 +1,34 @@
+"""
+Lazy Import Tests
+Checks that headless starts skip NumPy and the GUI toolkit and that every
+lazily exported name resolves.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import importlib
+
+import pytest
+
+from benchmarks.import_time import (BATCH_INPUT, BATCH_START, GUI_MODULES, HEADLESS_START, HEAVY_MODULES,
+                                    loaded_modules)
+
+
+@pytest.mark.parametrize("code", ["import models", "import utils", "import gui", "import main", HEADLESS_START])
+def test_library_start_skips_heavy_modules(code):
+    assert loaded_modules(code, HEAVY_MODULES) == []
+
+
+def test_batch_start_skips_the_gui_toolkit():
+    assert loaded_modules(BATCH_START, GUI_MODULES, BATCH_INPUT) == []
+
+
+@pytest.mark.parametrize("package", ["models", "utils"])
+def test_every_export_resolves(package):
+    module = importlib.import_module(package)
+    assert sorted(module.__all__) == sorted(module._EXPORTS)
+    for name in module.__all__:
+        assert getattr(module, name).__name__ == name
+    with pytest.raises(AttributeError):
+        getattr(module, "Missing")
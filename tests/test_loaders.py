@@ -0,0 +1,82 @@
+"""
+Instance Loader Tests
+Checks the CSV, .npy and JSON readers and the text input validator.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import numpy as np
+import pytest
+
+from utils.loaders import InstanceLoader
+from utils.validators import InputValidator
+
+
+def write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+
+def test_csv_with_header_blank_lines_and_mixed_separators(tmp_path):
+    path = write(tmp_path, "items.csv", "weight,value\n3,4\n\n5 6\r\n7,8")
+    capacity, weights, values = InstanceLoader.load(path, 10)
+    assert capacity == 10
+    assert weights.tolist() == [3, 5, 7]
+    assert values.tolist() == [4, 6, 8]
+
+
+@pytest.mark.parametrize("text, line", [("1,2,3\n4\n", 1), ("3,4\n5\n", 2), ("3,4\n5,6\n7", 3)])
+def test_csv_lines_must_hold_one_pair(tmp_path, text, line):
+    path = write(tmp_path, "items.csv", text)
+    with pytest.raises(ValueError, match=f"Line {line}:"):
+        InstanceLoader.load(path, 10)
+
+
+def test_csv_line_numbers_across_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(InstanceLoader, "CHUNK_SIZE", 8)
+    path = write(tmp_path, "items.csv", "".join(f"{i},{i}\n" for i in range(1, 30)) + "9\n")
+    with pytest.raises(ValueError, match="Line 30:"):
+        InstanceLoader.load(path, 10)
+
+
+def test_npy_is_memory_mapped_and_checked(tmp_path):
+    path = str(tmp_path / "items.npy")
+    np.save(path, np.array([[3, 4], [5, 6]], dtype=np.int64))
+    capacity, weights, values = InstanceLoader.load(path, 10)
+    assert isinstance(weights, np.memmap) or isinstance(weights.base, np.memmap)
+    assert (weights.tolist(), values.tolist()) == ([3, 5], [4, 6])
+
+    np.save(path, np.array([[3, 4, 5]], dtype=np.int64))
+    with pytest.raises(ValueError):
+        InstanceLoader.load(path, 10)
+    np.save(path, np.array([[3.0, 4.0]]))
+    with pytest.raises(ValueError):
+        InstanceLoader.load(path, 10)
+
+
+def test_loader_rejects_overflow_and_fractional_capacity():
+    with pytest.raises(ValueError):
+        InputValidator.validate_input("50", f"10 {2 ** 63}", "1 2")
+    with pytest.raises(ValueError):
+        InstanceLoader.parse_json('{"capacity": 1.7, "weights": [1], "values": [1]}')
+    with pytest.raises(ValueError):
+        InstanceLoader.parse_json('{"capacity": true, "weights": [1], "values": [1]}')
+
+
+@pytest.mark.parametrize("weights, values, message", [
+    ("", "1", "Weights cannot be empty"),
+    ("1 2", "3", "must equal"),
+    ("1 0", "3 4", "All weights must be positive"),
+    ("1 2", "3 -4", "All values must be positive"),
+])
+def test_validator_messages(weights, values, message):
+    with pytest.raises(ValueError, match=message):
+        InputValidator.validate_input("10", weights, values)
+
+
+def test_validator_returns_python_ints():
+    capacity, weights, values = InputValidator.validate_input(" 10 ", "1, 2", "3 4")
+    assert (capacity, weights, values) == (10, [1, 2], [3, 4])
+    assert all(type(x) is int for x in weights + values)
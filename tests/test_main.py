@@ -0,0 +1,57 @@
+"""
+Command Line Tests
+Checks the headless JSON Lines batch mode of main.py.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import main
+
+MAIN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+
+
+def run(args, stdin=""):
+    completed = subprocess.run([sys.executable, MAIN] + args, input=stdin, capture_output=True, text=True,
+                               timeout=120)
+    assert completed.returncode == 0, completed.stderr
+    return [json.loads(line) for line in completed.stdout.splitlines()]
+
+
+def test_batch_keeps_input_order_and_reports_errors():
+    lines = [
+        '{"capacity": 50, "weights": [10, 20, 30], "values": [60, 100, 120]}',
+        'not json',
+        '{"capacity": 10, "weights": [5], "values": [-1]}',
+        '{"capacity": 7, "weights": [3, 4, 5], "values": [3, 4, 5]}',
+    ]
+    records = run(["--batch", "--workers", "1", "--chunk-size", "2"], "\n".join(lines) + "\n")
+    assert [record["index"] for record in records] == [0, 1, 2, 3]
+    assert records[0]["max_value"] == 220 and records[0]["selected_items"] == [1, 2]
+    assert records[1]["error"].startswith("JSONDecodeError")
+    assert records[2]["error"] == "ValueError: All values must be positive"
+    assert records[3]["max_value"] == 7
+
+
+def test_csv_input_file(tmp_path):
+    path = tmp_path / "items.csv"
+    path.write_text("weight,value\n10,60\n20,100\n30,120\n")
+    records = run([str(path), "--capacity", "50", "--kind", "fractional", "--workers", "1"])
+    assert records[0]["max_value"] == pytest.approx(240.0)
+
+
+@pytest.mark.parametrize("argv", [
+    ["--batch", "--kind", "fractional", "--time-limit", "1"],
+    ["--batch", "--kind", "fractional", "--engine", "dense"],
+    ["--batch", "--workers", "0"],
+])
+def test_invalid_arguments(argv):
+    with pytest.raises(SystemExit):
+        main.parse_args(argv)
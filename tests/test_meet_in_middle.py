@@ -0,0 +1,42 @@
+"""
+Meet-in-the-Middle Engine Tests
+Checks the half-enumeration engine on small and huge-capacity instances.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import pytest
+
+from conftest import assert_solution, brute_force, huge_capacity_instance, random_instances
+from models import KnapsackSolver, SolveStats
+from models.branch_and_bound import BranchAndBoundSolver
+from models.meet_in_middle_engine import MeetInMiddleEngine
+
+
+def test_meet_in_middle_matches_brute_force():
+    for capacity, weights, values in random_instances(seed=13, count=60):
+        result = MeetInMiddleEngine.solve(capacity, weights, values)
+        assert_solution(capacity, weights, values, result, brute_force(capacity, weights, values))
+
+
+@pytest.mark.parametrize("n", [1, 17, MeetInMiddleEngine.MAX_ITEMS // 2])
+def test_meet_in_middle_with_huge_capacity(n):
+    capacity, weights, values = huge_capacity_instance(n, 10 ** 11, 10 ** 12)
+    expected = BranchAndBoundSolver.solve(capacity, weights, values).max_value
+    result = MeetInMiddleEngine.solve(capacity, weights, values)
+    assert_solution(capacity, weights, values, result, expected)
+
+
+def test_meet_in_middle_rejects_too_many_items():
+    n = MeetInMiddleEngine.MAX_ITEMS + 1
+    with pytest.raises(ValueError):
+        MeetInMiddleEngine.solve(10, [1] * n, [1] * n)
+
+
+def test_auto_picks_meet_in_middle_for_few_items_with_huge_capacity():
+    capacity, weights, values = huge_capacity_instance(24, 10 ** 11, 10 ** 12)
+    stats = SolveStats()
+    result = KnapsackSolver.solve_01_knapsack(capacity, weights, values, stats=stats, preprocess=False)
+    assert_solution(capacity, weights, values, result, BranchAndBoundSolver.solve(capacity, weights, values).max_value)
+    assert stats.engine == "meet_in_middle"
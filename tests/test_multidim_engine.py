@@ -0,0 +1,56 @@
+"""
+Multi-Dimensional Knapsack Tests
+Checks the DP and the surrogate branch-and-bound against brute force.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import random
+from itertools import combinations
+
+import pytest
+
+from models.multidim_engine import MultiDimEngine
+
+
+def brute_force(capacities, weights, values):
+    """Best value over every subset fitting all dimensions."""
+    best = 0
+    for size in range(len(values) + 1):
+        for subset in combinations(range(len(values)), size):
+            if all(sum(vector[i] for i in subset) <= c for c, vector in zip(capacities, weights)):
+                best = max(best, sum(values[i] for i in subset))
+    return best
+
+
+def instances(seed, count):
+    rng = random.Random(seed)
+    for _ in range(count):
+        n = rng.randint(1, 8)
+        capacities = [rng.randint(5, 30) for _ in range(rng.randint(1, 3))]
+        weights = [[rng.randint(1, 12) for _ in range(n)] for _ in capacities]
+        yield capacities, weights, [rng.randint(1, 30) for _ in range(n)]
+
+
+@pytest.mark.parametrize("solver", [MultiDimEngine.solve, MultiDimEngine.solve_branch_and_bound])
+def test_solvers_are_optimal(solver):
+    for capacities, weights, values in instances(seed=6, count=40):
+        result = solver(capacities, weights, values)
+        assert result.optimal
+        assert result.max_value == brute_force(capacities, weights, values)
+        assert sum(values[i] for i in result.selected_items) == result.max_value
+        for capacity, vector in zip(capacities, weights):
+            assert sum(vector[i] for i in result.selected_items) <= capacity
+
+
+def test_multidim_dp_gated_on_decision_bytes():
+    assert MultiDimEngine.dp_bytes([255, 255, 255], 300) > MultiDimEngine.MEMORY_BUDGET
+    assert MultiDimEngine.dp_bytes([30, 20], 8) < MultiDimEngine.MEMORY_BUDGET
+
+
+def test_rejects_mismatched_dimensions():
+    with pytest.raises(ValueError):
+        MultiDimEngine.solve([10, 10], [[1, 2]], [3, 4])
+    with pytest.raises(ValueError):
+        MultiDimEngine.solve([10, 10], [[1, 0], [2, 0]], [3, 4])
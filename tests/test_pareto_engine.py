@@ -0,0 +1,31 @@
+"""
+Pareto-Frontier Engine Tests
+Checks the fallbacks of the sparse frontier engine.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import pytest
+
+from conftest import assert_solution, huge_capacity_instance
+from models import KnapsackSolver, SolveStats
+from models.pareto_engine import ParetoEngine
+
+
+@pytest.mark.parametrize("limits", [{"max_states": 100}, {"memory_budget": 1 << 16}])
+def test_pareto_fallback_fits_the_memory_budget(limits):
+    capacity, weights, values = huge_capacity_instance(60, 10 ** 8, 10 ** 9)
+    expected = KnapsackSolver.solve_01_knapsack(capacity, weights, values, engine="branch_and_bound")[0]
+    stats = SolveStats()
+    result = ParetoEngine.solve(capacity, weights, values, stats=stats, **limits)
+    assert stats.engine == "branch_and_bound"
+    assert_solution(capacity, weights, values, result, expected)
+
+
+def test_memory_budget_reaches_the_engine():
+    capacity, weights, values = huge_capacity_instance(60, 10 ** 8, 10 ** 9)
+    stats = SolveStats()
+    KnapsackSolver.solve_01_knapsack(capacity, weights, values, engine="pareto", memory_budget=1 << 16,
+                                     preprocess=False, stats=stats)
+    assert stats.engine == "branch_and_bound"
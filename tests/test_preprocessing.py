@@ -0,0 +1,34 @@
+"""
+Preprocessing Tests
+Checks that the reductions keep the optimum and map solutions back.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+from conftest import assert_solution, brute_force, random_instances
+from models import KnapsackSolver
+from models.preprocessing import InstancePreprocessor
+
+
+def test_reduce_01_keeps_the_optimum():
+    for capacity, weights, values in random_instances(seed=3, count=80):
+        scaled = [3 * w for w in weights]
+        reduced = InstancePreprocessor.reduce_01(3 * capacity, scaled, values)
+        assert reduced.scale % 3 == 0 or not reduced.weights
+        result = reduced.restore_01(*KnapsackSolver._solve_01_table(reduced.capacity, reduced.weights,
+                                                                    reduced.values))
+        assert_solution(3 * capacity, scaled, values, result, brute_force(capacity, weights, values))
+
+
+def test_reduce_01_fixes_everything_that_fits():
+    reduced = InstancePreprocessor.reduce_01(10, [2, 3, 20], [4, 5, 100])
+    assert reduced.weights == []
+    assert reduced.restore_01(0, []) == (9, [0, 1])
+
+
+def test_reduce_fractional_scales_capacity_and_weights():
+    reduced = InstancePreprocessor.reduce_fractional(12, [4, 6, 8], [1, 2, 3])
+    assert reduced.scale == 2
+    assert (reduced.capacity, reduced.weights, reduced.values) == (6, [2, 3, 4], [1, 2, 3])
+    assert reduced.restore_fractional(3.5, [(2, 0.5)]) == (3.5, [(2, 0.5)])
@@ -0,0 +1,51 @@
+"""
+Result Report Tests
+Checks paging and export of the results panel model (no Tk needed).
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import csv
+
+from gui.report import ReportTable, ResultReport
+
+
+def make_report(rows, calls=None):
+    def row(i):
+        if calls is not None:
+            calls.append(i)
+        return i, i * i
+
+    report = ResultReport()
+    report.text("Header\n")
+    report.table(ReportTable("Items:", [("Item", 6, ""), ("Square", 8, "")], rows, row))
+    report.text("Footer\n")
+    return report
+
+
+def test_render_builds_only_the_page_rows():
+    calls = []
+    report = make_report(1_000_000, calls)
+    text = report.render(page=2, page_size=10)
+    assert calls == list(range(20, 30))
+    assert text.startswith("Header\n") and text.endswith("Footer\n")
+    assert "rows 21-30 of 1000000" in text
+
+
+def test_page_count_and_clamping():
+    report = make_report(25)
+    assert report.page_count(10) == 3
+    assert report.render(page=99, page_size=10) == report.render(page=2, page_size=10)
+    assert "… rows" not in make_report(5).render(page_size=10)
+    assert ResultReport().page_count(10) == 1
+
+
+def test_export_writes_every_row(tmp_path):
+    path = tmp_path / "report.csv"
+    make_report(250).export_csv(str(path))
+    with open(path, newline="", encoding="utf-8") as fh:
+        rows = list(csv.reader(fh))
+    assert rows[0] == ["Items"]
+    assert rows[1] == ["Item", "Square"]
+    assert rows[2:252] == [[str(i), str(i * i)] for i in range(250)]
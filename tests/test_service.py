@@ -0,0 +1,109 @@
+"""
+Solve Service Tests
+Checks the HTTP endpoints, coalescing, admission control and deadlines.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from conftest import huge_capacity_instance
+from service import ServiceError, SolveClient, SolveService
+
+# Slow enough in the pure-Python table engine to overlap concurrent requests.
+SLOW = dict(zip(("capacity", "weights", "values"), huge_capacity_instance(120, 1, 300)), engine="table")
+
+
+@pytest.fixture
+def service():
+    return SolveService(workers=1, max_pending=1)
+
+
+def run_with_pool(service, coroutine):
+    async def main():
+        service.executor = ProcessPoolExecutor(max_workers=1)
+        try:
+            return await coroutine()
+        finally:
+            service.close()
+
+    return asyncio.run(main())
+
+
+def test_identical_requests_are_coalesced(service):
+    async def both():
+        return await asyncio.gather(service.solve(dict(SLOW)), service.solve(dict(SLOW)))
+
+    first, second = run_with_pool(service, both)
+    assert first["max_value"] == second["max_value"]
+    assert (first["coalesced"], second["coalesced"]) == (False, True)
+    assert service.counters["coalesced"] == 1
+    assert service.health()["pending"] == 0
+
+
+def test_admission_control_and_deadlines(service):
+    async def overload():
+        first = asyncio.ensure_future(service.solve(dict(SLOW)))
+        await asyncio.sleep(0)
+        with pytest.raises(ServiceError) as rejected:
+            await service.solve(dict(SLOW, capacity=SLOW["capacity"] - 1))
+        with pytest.raises(ServiceError) as timed_out:
+            await service.solve(dict(SLOW, deadline=0.01))
+        await first
+        return rejected.value.status, timed_out.value.status
+
+    assert run_with_pool(service, overload) == (503, 504)
+
+
+@pytest.mark.parametrize("request_body", [
+    {"capacity": 10, "weights": [1], "values": [1], "kind": "nope"},
+    {"capacity": 10, "weights": [1], "values": [1], "engine": "nope"},
+    {"capacity": 10, "weights": [1], "values": [1], "deadline": 0},
+    {"capacity": 10, "weights": [1, 2], "values": [1]},
+])
+def test_bad_requests(service, request_body):
+    with pytest.raises(ServiceError) as error:
+        asyncio.run(service.solve(request_body))
+    assert error.value.status == 400
+
+
+@pytest.mark.skipif(not hasattr(asyncio, "start_unix_server"), reason="needs Unix sockets")
+def test_http_round_trip(tmp_path):
+    path = os.path.join(str(tmp_path), "solve.sock")
+    service = SolveService(workers=1)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    server = asyncio.run_coroutine_threadsafe(service.start(unix_path=path), loop).result(10)
+    # Fork the worker before the client socket exists, so it does not
+    # inherit a copy that would keep the connection open after close().
+    service.executor.submit(int).result(10)
+
+    async def shutdown():
+        # Let the connection handlers see the closed client before stopping.
+        server.close()
+        await server.wait_closed()
+        handlers = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        if handlers:
+            await asyncio.wait(handlers, timeout=10)
+
+    client = SolveClient(unix_path=path)
+    try:
+        result = client.solve(50, [10, 20, 30], [60, 100, 120])
+        assert (result["status"], result["max_value"], result["selected_items"]) == (200, 220, [1, 2])
+        assert client.solve(50, [10, 20], [60])["status"] == 400
+        assert client.request("GET", "/nope")["status"] == 404
+        assert client.health()["solved"] == 1
+    finally:
+        client.close()
+        asyncio.run_coroutine_threadsafe(shutdown(), loop).result(20)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(10)
+        loop.close()
+        service.close()
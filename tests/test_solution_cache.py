@@ -0,0 +1,51 @@
+"""
+Solution Cache Tests
+Checks the all-capacities instances and when the cache stores them.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import random
+
+from conftest import assert_solution, brute_force, huge_capacity_instance, random_instances
+from models import KnapsackSolver, SolveStats
+from models.solution_cache import SolutionCache, SolvedInstance
+
+
+def test_solved_instance_answers_every_capacity():
+    for _, weights, values in random_instances(seed=11, count=20):
+        scaled = [4 * weight for weight in weights]
+        instance = SolvedInstance(120, scaled, values)
+        assert instance.scale % 4 == 0
+        for capacity in range(0, 121, 7):
+            assert_solution(capacity, scaled, values, instance.solution(capacity),
+                            brute_force(capacity, scaled, values))
+
+
+def test_solution_cache_skips_instances_not_solved_densely():
+    cache = SolutionCache()
+    capacity, weights, values = huge_capacity_instance(12, 10 ** 6, 10 ** 7)
+    expected = brute_force(capacity, weights, values)
+    assert_solution(capacity, weights, values, cache.solve_01(capacity, weights, values), expected)
+    assert cache.total_bytes == 0
+
+    weights, values = list(range(1, 61)), list(range(60, 0, -1))
+    first = cache.solve_01(100, weights, values)
+    assert cache.total_bytes > 0
+    stats = SolveStats()
+    assert cache.solve_01(100, weights, values, stats=stats) == first
+    assert stats.engine == "cache"
+
+
+def test_solution_cache_scales_weights_before_filling():
+    rng = random.Random(12)
+    weights = [1000 * rng.randint(1, 40000) for _ in range(200)]
+    values = [rng.randint(1, 10 ** 6) for _ in range(200)]
+    capacity = 4 * 10 ** 6
+    cache = SolutionCache()
+    for query in (capacity, capacity - 1234):
+        expected = KnapsackSolver.solve_01_knapsack(query, weights, values)[0]
+        assert_solution(query, weights, values, cache.solve_01(query, weights, values), expected)
+    assert cache.hits == 1
+    assert 0 < cache.total_bytes < 1 << 20
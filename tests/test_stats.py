@@ -0,0 +1,43 @@
+"""
+Solve Statistics Tests
+Checks the instrumentation record filled in by the solvers.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+from models import KnapsackSolver, SolveStats
+
+
+def test_stats_do_not_trace_memory_by_default():
+    stats = SolveStats()
+    KnapsackSolver.solve_01_knapsack(50, [10, 20, 30], [60, 100, 120], stats=stats)
+    assert stats.peak_bytes is None
+
+
+def test_stats_record_engine_phases_and_work():
+    stats = SolveStats(trace_memory=True)
+    weights = [(7 * i) % 50 + 10 for i in range(60)]
+    values = [(11 * i) % 40 + 1 for i in range(60)]
+    KnapsackSolver.solve_01_knapsack(1000, weights, values, engine="dense", stats=stats)
+    assert stats.engine == "dense"
+    assert stats.n_items == 60 and stats.capacity == 1000
+    assert stats.cells > 0
+    assert stats.peak_bytes > 0
+    assert {"preprocess", "fill", "backtrack"} <= set(stats.wall_time)
+    assert 0 <= stats.pruning_ratio <= 1
+    assert stats.as_dict()["engine"] == "dense"
+
+
+def test_hooks_receive_every_solve_once():
+    seen = []
+    SolveStats.add_hook(seen.append)
+    try:
+        KnapsackSolver.solve_01_knapsack(50, [10, 20, 30], [60, 100, 120])
+        KnapsackSolver.solve_fractional_knapsack(50, [10, 20, 30], [60, 100, 120])
+    finally:
+        SolveStats.remove_hook(seen.append)
+    assert len(seen) == 2
+    assert seen[1].engine == "sort"
+    KnapsackSolver.solve_01_knapsack(50, [10, 20, 30], [60, 100, 120])
+    assert len(seen) == 2
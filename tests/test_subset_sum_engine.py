@@ -0,0 +1,44 @@
+"""
+Subset-Sum Engine Tests
+Checks the bitset engine on instances with values proportional to weights.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import pytest
+
+from conftest import assert_solution, brute_force, random_instances
+from models import KnapsackSolver
+from models.subset_sum_engine import SubsetSumEngine
+
+
+@pytest.mark.parametrize("preprocess", [True, False])
+def test_subset_sum_engine_on_proportional_instances(preprocess):
+    for capacity, weights, values in random_instances(seed=2, count=60, proportional=True):
+        expected = brute_force(capacity, weights, values)
+        result = KnapsackSolver.solve_01_knapsack(capacity, weights, values, engine="subset_sum",
+                                                  preprocess=preprocess)
+        assert_solution(capacity, weights, values, result, expected)
+
+
+def test_subset_sum_engine_backtracks_many_items():
+    weights = [3 + (i * 7919) % 97 for i in range(150)]
+    values = [2 * w for w in weights]
+    capacity = sum(weights) // 2 + 1
+    result = SubsetSumEngine.solve(capacity, weights, values)
+    assert_solution(capacity, weights, values, result,
+                    KnapsackSolver.solve_01_knapsack(capacity, weights, values, engine="dense")[0])
+
+
+def test_subset_sum_engine_rejects_other_instances():
+    assert not SubsetSumEngine.is_subset_sum([3, 4], [3, 5])
+    with pytest.raises(ValueError):
+        KnapsackSolver.solve_01_knapsack(10, [3, 4], [3, 5], engine="subset_sum", preprocess=False)
+
+
+def test_dispatch_picks_subset_sum_for_proportional_values():
+    weights = list(range(1, 61))
+    values = [5 * w for w in weights]
+    assert KnapsackSolver.select_dp_engine(1000, weights, values) == "subset_sum"
+    assert KnapsackSolver.select_dp_engine(1000, weights, values, memory_budget=1) != "subset_sum"
@@ -1,7 +1,32 @@
 """
 Utils package for the Knapsack Problem Solver.
+
+Classes are imported on first access, so NumPy is only loaded once a
+loader or validator is used.
 """
 
-from .validators import InputValidator
+import importlib
+from typing import Any, List
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    'InputValidator': 'validators',
+    'InstanceLoader': 'loaders',
+}
+
+__all__ = ['InputValidator', 'InstanceLoader']
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public class from its submodule on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ['InputValidator']
+def __dir__() -> List[str]:
+    """List the public names, including those not imported yet."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,281 @@
+"""
+Instance Loaders
+Streaming readers for knapsack instances stored in files.
+
+Author: GitHub Copilot
+Created: 2025
+"""
+
+import json
+from typing import IO, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+Instance = Tuple[int, np.ndarray, np.ndarray]
+
+
+class InstanceLoader:
+    """
+    Loads knapsack instances from CSV, JSON Lines and ``.npy`` files.
+
+    Items come back as compact int64 NumPy arrays. ``.npy`` files are
+    memory-mapped, CSV text is parsed in fixed-size chunks, and every
+    instance is validated with a single vectorized pass using the same
+    error messages as :class:`InputValidator`.
+
+    Supported layouts:
+
+    - CSV / text: one ``weight,value`` pair per line, optional header line
+    - ``.npy``: integer array of shape (n, 2) holding (weight, value) rows
+    - JSON Lines: one ``{"capacity": C, "weights": [...], "values": [...]}``
+      object per line
+    """
+
+    CHUNK_SIZE = 1 << 20
+    # Bytes that separate fields in CSV / text files.
+    _SEPARATORS = np.zeros(256, dtype=bool)
+    _SEPARATORS[list(b", \t\r\n")] = True
+    JSONL_SUFFIXES = (".jsonl", ".ndjson")
+
+    @staticmethod
+    def parse_integers(text: Union[str, bytes]) -> np.ndarray:
+        """
+        Parse comma and/or whitespace separated integers into an int64 array.
+
+        Args:
+            text: Text to parse
+
+        Returns:
+            Parsed integers
+
+        Raises:
+            ValueError: If an entry is not an integer or does not fit in int64
+        """
+        if isinstance(text, bytes):
+            text = text.decode()
+        try:
+            return np.array(text.replace(",", " ").split(), dtype=np.int64)
+        except OverflowError:
+            raise ValueError("Weights and values must be integers between -2^63 and 2^63 - 1")
+
+    @staticmethod
+    def validate(capacity: Optional[int], weights: np.ndarray, values: np.ndarray) -> Instance:
+        """
+        Validate an instance in one vectorized pass.
+
+        Args:
+            capacity: Knapsack capacity
+            weights: Item weights
+            values: Item values
+
+        Returns:
+            Tuple of (capacity, weights, values)
+        """
+        if capacity is None:
+            raise ValueError("Capacity cannot be empty")
+        capacity = int(capacity)
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if len(weights) == 0:
+            raise ValueError("No valid weights found")
+        if len(values) == 0:
+            raise ValueError("No valid values found")
+        if len(weights) != len(values):
+            raise ValueError(f"Number of weights ({len(weights)}) must equal number of values ({len(values)})")
+
+        if weights.min() <= 0:
+            raise ValueError("All weights must be positive")
+        if values.min() <= 0:
+            raise ValueError("All values must be positive")
+        return capacity, weights, values
+
+    @staticmethod
+    def load(path: str, capacity: Optional[int] = None) -> Instance:
+        """
+        Load a single instance from a CSV or ``.npy`` file.
+
+        Args:
+            path: File to read
+            capacity: Knapsack capacity (these formats do not store one)
+
+        Returns:
+            Tuple of (capacity, weights, values)
+        """
+        if path.lower().endswith(".npy"):
+            return InstanceLoader.load_npy(path, capacity)
+        if path.lower().endswith(InstanceLoader.JSONL_SUFFIXES):
+            raise ValueError("JSON Lines files may hold several instances, use iter_instances()")
+        return InstanceLoader.load_csv(path, capacity)
+
+    @staticmethod
+    def iter_instances(path: str, capacity: Optional[int] = None) -> Iterator[Instance]:
+        """
+        Yield every instance stored in a file, whatever its format.
+
+        Args:
+            path: File to read
+            capacity: Knapsack capacity for CSV and ``.npy`` files
+
+        Yields:
+            Tuples of (capacity, weights, values)
+        """
+        if path.lower().endswith(InstanceLoader.JSONL_SUFFIXES):
+            with open(path, "r", encoding="utf-8") as fh:
+                yield from InstanceLoader.iter_jsonl(fh)
+        else:
+            yield InstanceLoader.load(path, capacity)
+
+    @staticmethod
+    def load_npy(path: str, capacity: Optional[int]) -> Instance:
+        """
+        Memory-map a ``.npy`` file of (weight, value) rows.
+
+        Args:
+            path: File to read
+            capacity: Knapsack capacity
+
+        Returns:
+            Tuple of (capacity, weights, values); the arrays are views on the file
+        """
+        items = np.load(path, mmap_mode="r")
+        if items.ndim != 2 or items.shape[1] != 2:
+            raise ValueError(f"Expected an array of shape (n, 2), got {items.shape}")
+        if not np.issubdtype(items.dtype, np.integer):
+            raise ValueError("Weights and values must be integers")
+        return InstanceLoader.validate(capacity, items[:, 0], items[:, 1])
+
+    @staticmethod
+    def load_csv(path: str, capacity: Optional[int]) -> Instance:
+        """
+        Parse a ``weight,value`` per line text file in fixed-size chunks.
+
+        Args:
+            path: File to read
+            capacity: Knapsack capacity
+
+        Returns:
+            Tuple of (capacity, weights, values)
+        """
+        chunks = []
+        with open(path, "rb") as fh:
+            first_line = fh.readline()
+            if not any(c.isalpha() for c in first_line.decode()):
+                chunks.append(InstanceLoader.parse_pairs(first_line, 1))
+            line_number = 2
+
+            remainder = b""
+            while True:
+                block = fh.read(InstanceLoader.CHUNK_SIZE)
+                if not block:
+                    break
+                block = remainder + block
+                cut = block.rfind(b"\n") + 1
+                remainder = block[cut:]
+                chunks.append(InstanceLoader.parse_pairs(block[:cut], line_number))
+                line_number += block.count(b"\n", 0, cut)
+            chunks.append(InstanceLoader.parse_pairs(remainder, line_number))
+
+        items = np.concatenate(chunks).reshape(-1, 2)
+        del chunks
+        return InstanceLoader.validate(capacity, items[:, 0], items[:, 1])
+
+    @staticmethod
+    def parse_pairs(text: bytes, first_line: int) -> np.ndarray:
+        """
+        Parse ``weight,value`` lines, checking that every line holds one pair.
+
+        Fields are counted per line in a vectorized pass over the bytes, so
+        a line with one or three fields cannot silently shift the pairing
+        of the lines after it. Blank lines are skipped.
+
+        Args:
+            text: Whole lines of the file
+            first_line: 1-based number of the first line in ``text``
+
+        Returns:
+            Parsed integers, two per non-blank line
+
+        Raises:
+            ValueError: If a line does not hold exactly two fields
+        """
+        data = np.frombuffer(text, dtype=np.uint8)
+        separator = InstanceLoader._SEPARATORS[data].view(np.int8)
+        # A field starts wherever a separator is followed by anything else.
+        starts = np.flatnonzero(np.diff(separator) == -1) + 1
+        if len(data) and not separator[0]:
+            starts = np.insert(starts, 0, 0)
+        ends = np.flatnonzero(data == ord("\n"))
+        if len(data) and data[-1] != ord("\n"):
+            ends = np.append(ends, len(data))
+        fields = np.diff(np.searchsorted(starts, ends), prepend=0)
+        bad = np.flatnonzero((fields != 0) & (fields != 2))
+        if len(bad):
+            content = text.split(b"\n")[bad[0]].decode(errors="replace").strip()
+            raise ValueError(f"Line {first_line + int(bad[0])}: expected 'weight,value', got '{content}'")
+        return InstanceLoader.parse_integers(text)
+
+    @staticmethod
+    def iter_jsonl(stream: IO[str]) -> Iterator[Instance]:
+        """
+        Yield instances from a JSON Lines stream, one per non-empty line.
+
+        Args:
+            stream: Text stream, e.g. an open file or ``sys.stdin``
+
+        Yields:
+            Tuples of (capacity, weights, values)
+        """
+        for line in stream:
+            if line.strip():
+                yield InstanceLoader.parse_json(line)
+
+    @staticmethod
+    def parse_json(line: str) -> Instance:
+        """
+        Parse and validate one JSON-encoded instance.
+
+        Args:
+            line: JSON object with ``capacity``, ``weights`` and ``values``
+
+        Returns:
+            Tuple of (capacity, weights, values)
+        """
+        return InstanceLoader.parse_record(json.loads(line))
+
+    @staticmethod
+    def parse_record(record: dict) -> Instance:
+        """
+        Validate an already decoded JSON instance.
+
+        Args:
+            record: Object with ``capacity``, ``weights`` and ``values``;
+                other keys are ignored
+
+        Returns:
+            Tuple of (capacity, weights, values)
+        """
+        if not isinstance(record, dict):
+            raise ValueError("Each instance must be a JSON object")
+        capacity = record.get("capacity")
+        if capacity is not None and (isinstance(capacity, bool) or not isinstance(capacity, int)):
+            raise ValueError("Capacity must be an integer")
+        weights = InstanceLoader._integer_array(record.get("weights", []))
+        values = InstanceLoader._integer_array(record.get("values", []))
+        return InstanceLoader.validate(capacity, weights, values)
+
+    @staticmethod
+    def _integer_array(items: list) -> np.ndarray:
+        """Convert a JSON list to int64, rejecting non-integer entries."""
+        array = np.asarray(items)
+        if array.size == 0:
+            return np.zeros(0, dtype=np.int64)
+        if array.ndim != 1 or array.dtype.kind not in "iu":
+            raise ValueError("Weights and values must be integers")
+        return array.astype(np.int64, copy=False)
+
+    @staticmethod
+    def as_lists(instance: Instance) -> Tuple[int, List[int], List[int]]:
+        """Convert a loaded instance to plain Python lists."""
+        capacity, weights, values = instance
+        return capacity, np.asarray(weights).tolist(), np.asarray(values).tolist()
+
@@ -7,7 +7,8 @@ Created: 2025
 """
 
 from typing import List, Tuple, Optional
-import re
+
+from .loaders import InstanceLoader
 
 
 class InputValidator:
@@ -28,40 +29,80 @@ class InputValidator:
         Returns:
             Tuple of (capacity, weights, values) if valid, None otherwise
         """
+        capacity_text = capacity_text.strip()
+        if not capacity_text:
+            raise ValueError("Capacity cannot be empty")
+        capacity = int(capacity_text)
+
+        weights_text = weights_text.strip()
+        if not weights_text:
+            raise ValueError("Weights cannot be empty")
+        values_text = values_text.strip()
+        if not values_text:
+            raise ValueError("Values cannot be empty")
+
+        # Parsing and the range checks run vectorized on the int64 arrays.
+        capacity, weights, values = InstanceLoader.validate(
+            capacity, InstanceLoader.parse_integers(weights_text), InstanceLoader.parse_integers(values_text)
+        )
+        return capacity, weights.tolist(), values.tolist()
+
+    @staticmethod
+    def validate_multi_input(capacity_text: str, weights_text: str, values_text: str) -> Tuple[List[int], List[List[int]], List[int]]:
+        """
+        Validate input for the multi-dimensional knapsack.
+        
+        Capacities are given as a list (one per dimension) and the weight
+        vectors of the dimensions are separated by semicolons.
+        
+        Args:
+            capacity_text: Text input for capacities, e.g. "50, 20"
+            weights_text: Text input for weights, e.g. "10, 20, 30; 5, 10, 8"
+            values_text: Text input for values
+        
+        Returns:
+            Tuple of (capacities, weight_vectors, values)
+        """
+        capacity_text = capacity_text.strip()
+        if not capacity_text:
+            raise ValueError("Capacity cannot be empty")
+        capacities = InstanceLoader.parse_integers(capacity_text).tolist()
+        weight_texts = [text for text in weights_text.split(";") if text.strip()]
+        if len(capacities) != len(weight_texts):
+            raise ValueError(
+                f"Number of capacities ({len(capacities)}) must equal number of weight vectors ({len(weight_texts)})"
+            )
+
+        weights = []
+        values = []
+        for capacity, text in zip(capacities, weight_texts):
+            _, vector, values = InputValidator.validate_input(str(capacity), text, values_text)
+            weights.append(vector)
+        return capacities, weights, values
+
+    @staticmethod
+    def is_multidimensional(capacity_text: str, weights_text: str) -> bool:
+        """Tell whether the input describes several capacity dimensions."""
+        return ";" in weights_text or len(capacity_text.replace(",", " ").split()) > 1
+
+    @staticmethod
+    def validate_epsilon(epsilon_text: str) -> Optional[float]:
+        """
+        Validate the approximation tolerance.
+        
+        Args:
+            epsilon_text: Text input for epsilon; empty means an exact solve
+        
+        Returns:
+            Epsilon in (0, 1), or None when the field is empty
+        """
+        epsilon_text = epsilon_text.strip()
+        if not epsilon_text:
+            return None
         try:
-            # Validate capacity
-            capacity_text = capacity_text.strip()
-            if not capacity_text:
-                raise ValueError("Capacity cannot be empty")
-            capacity = int(capacity_text)
-            if capacity <= 0:
-                raise ValueError("Capacity must be positive")
-                
-            # Validate weights
-            weights_text = weights_text.strip()
-            if not weights_text:
-                raise ValueError("Weights cannot be empty")
-            weights = [int(x.strip()) for x in re.split(r'[,\s]+', weights_text) if x.strip()]
-            if not weights:
-                raise ValueError("No valid weights found")
-            if any(w <= 0 for w in weights):
-                raise ValueError("All weights must be positive")
-                
-            # Validate values
-            values_text = values_text.strip()
-            if not values_text:
-                raise ValueError("Values cannot be empty")
-            values = [int(x.strip()) for x in re.split(r'[,\s]+', values_text) if x.strip()]
-            if not values:
-                raise ValueError("No valid values found")
-            if any(v <= 0 for v in values):
-                raise ValueError("All values must be positive")
-                
-            # Check if weights and values have same length
-            if len(weights) != len(values):
-                raise ValueError(f"Number of weights ({len(weights)}) must equal number of values ({len(values)})")
-                
-            return capacity, weights, values
-            
-        except ValueError as e:
-            raise ValueError(str(e))
+            epsilon = float(epsilon_text)
+        except ValueError:
+            raise ValueError(f"Epsilon must be a number, got '{epsilon_text}'")
+        if not 0 < epsilon < 1:
+            raise ValueError("Epsilon must be between 0 and 1 (exclusive)")
+        return epsilon